@@ -10,13 +10,27 @@ The heavy lifting is organised in individual extractors inside
 `extracttext.extractors` and executed via the :class:`extracttext.dataloader.DataLoader`.
 """
 
-from .dataloader import DataLoader, ExtractionResult, load  # noqa: F401
+__version__ = "0.1.0"
+
+from .dataloader import (  # noqa: F401
+    BatchResult,
+    DataLoader,
+    ExtractionResult,
+    TextFragment,
+    aload,
+    load,
+    load_many,
+)
 from .extractors.base_extractor import DocumentType  # noqa: F401
 
 __all__ = [
     "load",
+    "aload",
+    "load_many",
     "DataLoader",
     "ExtractionResult",
+    "BatchResult",
+    "TextFragment",
     "DocumentType",
     "UnsupportedDocumentError",
     "ExtractionFailedError",
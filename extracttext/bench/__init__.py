@@ -0,0 +1,27 @@
+"""Reproducible benchmark suite for ExtractText.
+
+Three steps, also available from the command line (``python -m extracttext.bench``):
+
+    1. :func:`generate_corpus` – write a deterministic synthetic corpus.
+    2. :func:`run_benchmarks`  – measure latency percentiles, throughput and
+       peak RSS per extractor and for :meth:`DataLoader.load`.
+    3. :func:`compare`         – diff two JSON reports and flag regressions.
+
+:func:`run_startup` measures import time, ``extracttext --help`` and the first
+``load()`` call in fresh interpreters and reports in the same format.
+"""
+
+from .compare import ComparisonReport, compare  # noqa: F401
+from .corpus import CorpusSpec, generate_corpus, load_manifest  # noqa: F401
+from .runner import run_benchmarks  # noqa: F401
+from .startup import run_startup  # noqa: F401
+
+__all__ = [
+    "CorpusSpec",
+    "generate_corpus",
+    "load_manifest",
+    "run_benchmarks",
+    "run_startup",
+    "compare",
+    "ComparisonReport",
+]
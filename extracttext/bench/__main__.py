@@ -0,0 +1,124 @@
+"""Command-line interface of the benchmark suite.
+
+Examples:
+    python -m extracttext.bench generate /tmp/corpus
+    python -m extracttext.bench run /tmp/corpus -o baseline.json
+    python -m extracttext.bench compare baseline.json current.json --threshold 0.15
+    python -m extracttext.bench startup --repeat 20 -o startup.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+from .compare import DEFAULT_THRESHOLD, compare
+from .corpus import CorpusSpec, generate_corpus
+from .runner import run_benchmarks
+from .startup import SCENARIOS, run_startup
+
+
+def _generate(args: argparse.Namespace) -> int:
+    base = CorpusSpec.tiny(args.seed) if args.tiny else CorpusSpec(seed=args.seed)
+    overrides = {name: value for name, value in vars(args).items() if name in base.__dataclass_fields__ and value is not None}
+    spec = CorpusSpec(**{**base.__dict__, **overrides})
+    for doc in generate_corpus(args.directory, spec):
+        print(f"{doc.name:<12} {doc.document_type:<10} {doc.pages:>4} page(s) {doc.bytes / 1024:>10.1f} KiB")
+    return 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    def progress(result) -> None:
+        if result.status == "ok":
+            lat = result.latency_ms
+            print(
+                f"{result.key:<44} p50 {lat['p50']:>9.1f} ms  p95 {lat['p95']:>9.1f} ms  "
+                f"{result.throughput['mb_per_s']:>8.2f} MB/s  peak {result.peak_rss_mb} MB",
+                file=sys.stderr,
+            )
+        else:
+            print(f"{result.key:<44} {result.status}: {result.detail}", file=sys.stderr)
+
+    report = run_benchmarks(
+        args.corpus,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        targets=args.targets,
+        only=args.only,
+        isolate=not args.no_isolate,
+        progress=progress,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def _startup(args: argparse.Namespace) -> int:
+    def progress(result: dict) -> None:
+        if result["status"] == "ok":
+            lat = result["latency_ms"]
+            print(f"{result['key']:<36} p50 {lat['p50']:>8.1f} ms  p95 {lat['p95']:>8.1f} ms", file=sys.stderr)
+        else:
+            print(f"{result['key']:<36} {result['status']}: {result['detail']}", file=sys.stderr)
+
+    report = run_startup(repeat=args.repeat, scenarios=args.scenarios, progress=progress)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    report = compare(baseline, current, threshold=args.threshold)
+    print(report.format())
+    # Non-zero exit lets CI fail on regressions
+    return 1 if report.regressed else 0
+
+
+def main(argv=None) -> int:  # noqa: D401
+    parser = argparse.ArgumentParser(prog="python -m extracttext.bench", description="ExtractText benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="Write the deterministic synthetic corpus")
+    gen.add_argument("directory")
+    gen.add_argument("--seed", type=int, default=1234)
+    gen.add_argument("--tiny", action="store_true", help="Minimal corpus (seconds to run)")
+    for name in ("text_pdf_pages", "scanned_pdf_pages", "mixed_pdf_pages", "tiff_frames", "docx_paragraphs", "csv_rows", "log_lines"):
+        gen.add_argument(f"--{name.replace('_', '-')}", dest=name, type=int)
+    gen.set_defaults(func=_generate)
+
+    run = sub.add_parser("run", help="Benchmark a generated corpus and emit JSON")
+    run.add_argument("corpus")
+    run.add_argument("-o", "--output", help="Write the JSON report here instead of stdout")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--targets", nargs="+", choices=("extractor", "loader"), default=["extractor", "loader"])
+    run.add_argument("--only", nargs="+", metavar="DOCUMENT", help="Only these corpus files")
+    run.add_argument("--no-isolate", action="store_true", help="Run cases in-process (peak RSS becomes cumulative)")
+    run.set_defaults(func=_run)
+
+    start = sub.add_parser("startup", help="Time imports, --help and the first load() in fresh interpreters")
+    start.add_argument("-o", "--output", help="Write the JSON report here instead of stdout")
+    start.add_argument("--repeat", type=int, default=10)
+    start.add_argument("--scenarios", nargs="+", choices=tuple(SCENARIOS))
+    start.set_defaults(func=_startup)
+
+    cmp = sub.add_parser("compare", help="Flag regressions between two JSON reports")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative tolerance (default 0.10)")
+    cmp.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Compare two benchmark reports and flag regressions.
+
+Cases are matched by key (``document:target``).  A metric regresses when it
+moves in the bad direction by more than *threshold* (relative) **and** by
+more than its absolute noise floor, so sub-millisecond jitter on tiny
+documents is not reported.  A case that succeeded in the baseline and errors
+in the current run is always a regression.
+"""
+from __future__ import annotations
+
+import typing as _t
+from dataclasses import dataclass, field
+
+__all__ = [
+    "MetricChange",
+    "ComparisonReport",
+    "compare",
+    "DEFAULT_THRESHOLD",
+]
+
+DEFAULT_THRESHOLD = 0.10
+
+#: metric → (value path, higher is better, noise path, absolute noise floor).
+#: Throughput derives from the mean latency, so its noise is judged there.
+_METRICS: dict[str, tuple[tuple[str, ...], bool, tuple[str, ...], float]] = {
+    "p50_ms": (("latency_ms", "p50"), False, ("latency_ms", "p50"), 1.0),
+    "p95_ms": (("latency_ms", "p95"), False, ("latency_ms", "p95"), 1.0),
+    "mb_per_s": (("throughput", "mb_per_s"), True, ("latency_ms", "mean"), 1.0),
+    "peak_rss_mb": (("peak_rss_mb",), False, ("peak_rss_mb",), 5.0),
+}
+
+
+@dataclass(frozen=True)
+class MetricChange:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    regression: bool
+
+    @property
+    def change(self) -> float:
+        """Relative change ``current / baseline - 1`` (``inf`` from zero)."""
+        if not self.baseline:
+            return float("inf") if self.current else 0.0
+        return self.current / self.baseline - 1
+
+
+@dataclass
+class ComparisonReport:
+    changes: list[MetricChange]
+    missing: list[str]  # keys present in the baseline only
+    added: list[str]  # keys present in the current run only
+    failed: list[str] = field(default_factory=list)  # ok in the baseline, error now
+
+    @property
+    def regressions(self) -> list[MetricChange]:
+        return [c for c in self.changes if c.regression]
+
+    @property
+    def regressed(self) -> bool:
+        """Whether any metric regressed or any case started failing."""
+        return bool(self.regressions or self.failed)
+
+    def format(self) -> str:
+        """Human-readable table of every compared metric."""
+        lines = [f"{'case':<44} {'metric':<12} {'baseline':>10} {'current':>10} {'change':>8}"]
+        for c in self.changes:
+            flag = "  REGRESSION" if c.regression else ""
+            lines.append(
+                f"{c.key:<44} {c.metric:<12} {c.baseline:>10.2f} {c.current:>10.2f} {c.change:>+8.1%}{flag}"
+            )
+        for key in self.failed:
+            lines.append(f"{key:<44} fails in the current run  REGRESSION")
+        for key in self.missing:
+            lines.append(f"{key:<44} missing from the current run")
+        for key in self.added:
+            lines.append(f"{key:<44} new in the current run")
+        lines.append(f"{len(self.regressions) + len(self.failed)} regression(s)")
+        return "\n".join(lines)
+
+
+def _value(result: dict, path: tuple[str, ...]) -> _t.Optional[float]:
+    value: _t.Any = result
+    for part in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value if isinstance(value, (int, float)) else None
+
+
+def compare(baseline: dict, current: dict, *, threshold: float = DEFAULT_THRESHOLD) -> ComparisonReport:
+    """Compare two :func:`~extracttext.bench.runner.run_benchmarks` reports."""
+    base = {r["key"]: r for r in baseline["results"] if r["status"] == "ok"}
+    cur = {r["key"]: r for r in current["results"] if r["status"] == "ok"}
+    failed = {r["key"] for r in current["results"] if r["status"] == "error"} & base.keys()
+
+    changes = []
+    for key in sorted(base.keys() & cur.keys()):
+        for metric, (path, higher_is_better, noise_path, floor) in _METRICS.items():
+            old, new = _value(base[key], path), _value(cur[key], path)
+            if old is None or new is None:
+                continue
+            worse_by = (old - new) if higher_is_better else (new - old)
+            noise_old, noise_new = _value(base[key], noise_path), _value(cur[key], noise_path)
+            noisy = noise_old is not None and noise_new is not None and abs(noise_new - noise_old) <= floor
+            regression = not noisy and worse_by > threshold * abs(old)
+            changes.append(MetricChange(key, metric, float(old), float(new), regression))
+
+    return ComparisonReport(
+        changes=changes,
+        missing=sorted(base.keys() - cur.keys() - failed),
+        added=sorted(cur.keys() - base.keys()),
+        failed=sorted(failed),
+    )
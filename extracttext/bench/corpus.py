@@ -0,0 +1,328 @@
+"""Deterministic synthetic corpus for the benchmark suite.
+
+Every document is generated from a seeded :class:`random.Random`, and PDFs and
+DOCX files are written by hand with fixed metadata.  The same
+:class:`CorpusSpec` therefore always yields byte-identical files (for a given
+Pillow version, which renders the scanned pages).  Nothing is downloaded.
+
+Produced documents (file name → logical type):
+    • ``text.pdf``     – text-layer PDF, ``text_pdf_pages`` pages.
+    • ``scanned.pdf``  – image-only PDF of rendered text (needs OCR).
+    • ``mixed.pdf``    – alternating text-layer and scanned pages.
+    • ``image.png``    – one rendered page.
+    • ``fax.tif``      – multi-frame TIFF, ``tiff_frames`` pages.
+    • ``large.docx``   – paragraphs with a table every 50 paragraphs.
+    • ``large.csv``    – ``csv_rows`` rows of mixed columns.
+    • ``large.log``    – ``log_lines`` application log lines.
+
+A ``manifest.json`` next to the files records the spec and a SHA-256 per file.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import typing as _t
+import zipfile
+import zlib
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+__all__ = [
+    "CorpusSpec",
+    "CorpusDocument",
+    "generate_corpus",
+    "load_manifest",
+]
+
+MANIFEST = "manifest.json"
+
+_WORDS = (
+    "lease agreement tenant landlord premises rent payment term notice party clause section "
+    "property schedule invoice amount total due date account balance report quarter revenue "
+    "service customer order delivery shipment warehouse inventory contract renewal period "
+    "insurance liability damage repair maintenance access entry default remedy termination"
+).split()
+
+#: Letter size in PDF points
+_PAGE_W, _PAGE_H = 612, 792
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Size knobs of the generated corpus; :meth:`tiny` suits unit tests."""
+
+    seed: int = 1234
+    text_pdf_pages: int = 50
+    scanned_pdf_pages: int = 4
+    mixed_pdf_pages: int = 6
+    tiff_frames: int = 4
+    scan_dpi: int = 200
+    docx_paragraphs: int = 5000
+    csv_rows: int = 100_000
+    log_lines: int = 200_000
+
+    @classmethod
+    def tiny(cls, seed: int = 1234) -> "CorpusSpec":
+        return cls(
+            seed=seed,
+            text_pdf_pages=3,
+            scanned_pdf_pages=1,
+            mixed_pdf_pages=2,
+            tiff_frames=2,
+            scan_dpi=100,
+            docx_paragraphs=60,
+            csv_rows=200,
+            log_lines=500,
+        )
+
+
+@dataclass(frozen=True)
+class CorpusDocument:
+    """One generated file as listed in the manifest."""
+
+    name: str
+    document_type: str  # ``DocumentType`` value the loader should report
+    pages: int
+    bytes: int
+    sha256: str
+    needs_ocr: bool
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def generate_corpus(directory: _t.Union[str, Path], spec: _t.Optional[CorpusSpec] = None) -> list[CorpusDocument]:
+    """Write the corpus described by *spec* into *directory* and return its manifest."""
+    spec = spec or CorpusSpec()
+    out = Path(directory)
+    out.mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(spec.seed)
+    builders: list[tuple[str, str, int, bool, _t.Callable[[], bytes]]] = [
+        ("text.pdf", "pdf_text", spec.text_pdf_pages, False,
+         lambda: _pdf([("text", _page_lines(rng)) for _ in range(spec.text_pdf_pages)], spec.scan_dpi)),
+        ("scanned.pdf", "pdf_image", spec.scanned_pdf_pages, True,
+         lambda: _pdf([("scan", _page_lines(rng)) for _ in range(spec.scanned_pdf_pages)], spec.scan_dpi)),
+        ("mixed.pdf", "pdf_mixed", spec.mixed_pdf_pages, True,
+         lambda: _pdf(
+             [("scan" if n % 2 else "text", _page_lines(rng)) for n in range(spec.mixed_pdf_pages)], spec.scan_dpi
+         )),
+        ("image.png", "image", 1, True, lambda: _png(_page_lines(rng), spec.scan_dpi)),
+        ("fax.tif", "image", spec.tiff_frames, True,
+         lambda: _tiff([_page_lines(rng) for _ in range(spec.tiff_frames)], spec.scan_dpi)),
+        ("large.docx", "docx", 1, False, lambda: _docx(rng, spec.docx_paragraphs)),
+        ("large.csv", "csv", 1, False, lambda: _csv(rng, spec.csv_rows)),
+        ("large.log", "text", 1, False, lambda: _log(rng, spec.log_lines)),
+    ]
+
+    documents = []
+    for name, doc_type, pages, needs_ocr, build in builders:
+        data = build()
+        (out / name).write_bytes(data)
+        documents.append(
+            CorpusDocument(name, doc_type, pages, len(data), hashlib.sha256(data).hexdigest(), needs_ocr)
+        )
+
+    manifest = {"spec": asdict(spec), "documents": [asdict(d) for d in documents]}
+    (out / MANIFEST).write_text(json.dumps(manifest, indent=2) + "\n")
+    return documents
+
+
+def load_manifest(directory: _t.Union[str, Path]) -> tuple[CorpusSpec, list[CorpusDocument]]:
+    """Read the manifest written by :func:`generate_corpus`."""
+    manifest = json.loads((Path(directory) / MANIFEST).read_text())
+    return CorpusSpec(**manifest["spec"]), [CorpusDocument(**d) for d in manifest["documents"]]
+
+
+# ---------------------------------------------------------------------------
+# Content
+# ---------------------------------------------------------------------------
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _page_lines(rng: random.Random, lines: int = 40) -> list[str]:
+    return [_sentence(rng, rng.randint(6, 10)) for _ in range(lines)]
+
+
+# ---------------------------------------------------------------------------
+# Raster pages
+# ---------------------------------------------------------------------------
+
+def _render(lines: list[str], dpi: int) -> "Image.Image":
+    """Render *lines* as an 11 pt page scanned at *dpi* (8-bit grayscale)."""
+    from PIL import Image, ImageDraw, ImageFont  # type: ignore
+
+    size = (round(_PAGE_W / 72 * dpi), round(_PAGE_H / 72 * dpi))
+    px = round(11 / 72 * dpi)
+    try:
+        font = ImageFont.load_default(size=px)
+    except TypeError:  # pragma: no cover – Pillow < 10.1 has only the bitmap font
+        font = ImageFont.load_default()
+
+    img = Image.new("L", size, 255)
+    draw = ImageDraw.Draw(img)
+    margin = dpi  # one inch
+    for n, line in enumerate(lines):
+        y = margin + round(n * px * 1.35)
+        if y + px > size[1] - margin // 2:
+            break
+        draw.text((margin, y), line, fill=0, font=font)
+    return img
+
+
+def _png(lines: list[str], dpi: int) -> bytes:
+    buf = BytesIO()
+    _render(lines, dpi).save(buf, format="PNG", dpi=(dpi, dpi))
+    return buf.getvalue()
+
+
+def _tiff(pages: list[list[str]], dpi: int) -> bytes:
+    frames = [_render(lines, dpi).convert("1") for lines in pages]
+    buf = BytesIO()
+    frames[0].save(buf, format="TIFF", save_all=True, append_images=frames[1:], compression="group4", dpi=(dpi, dpi))
+    return buf.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# PDF – minimal hand-written writer (no metadata, no timestamps)
+# ---------------------------------------------------------------------------
+
+def _pdf_string(text: str) -> bytes:
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return b"(" + escaped.encode("latin-1", "replace") + b")"
+
+
+def _pdf(pages: list[tuple[str, list[str]]], dpi: int) -> bytes:
+    """Build a PDF from ``("text" | "scan", lines)`` page specs."""
+    objects: list[bytes] = [b"", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+
+    for mode, lines in pages:
+        page_num = len(objects) + 1
+        kids.append(page_num)
+        if mode == "text":
+            body = [b"BT /F1 11 Tf 15 TL 72 720 Td"]
+            body += [_pdf_string(line) + b" Tj T*" for line in lines]
+            body.append(b"ET")
+            content = b"\n".join(body)
+            resources = b"<< /Font << /F1 3 0 R >> >>"
+            extra: list[bytes] = []
+        else:
+            img = _render(lines, dpi)
+            data = zlib.compress(img.tobytes(), 6)
+            resources = b"<< /XObject << /Im1 %d 0 R >> >>" % (page_num + 2)
+            content = b"q %d 0 0 %d 0 0 cm /Im1 Do Q" % (_PAGE_W, _PAGE_H)
+            extra = [
+                b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceGray "
+                b"/BitsPerComponent 8 /Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream"
+                % (img.width, img.height, len(data), data)
+            ]
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources %s /Contents %d 0 R >>"
+            % (_PAGE_W, _PAGE_H, resources, page_num + 1)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.extend(extra)
+
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+# ---------------------------------------------------------------------------
+# DOCX – minimal package with a fixed zip timestamp
+# ---------------------------------------------------------------------------
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+
+
+def _docx(rng: random.Random, paragraphs: int) -> bytes:
+    def para(text: str) -> str:
+        return f"<w:p><w:r><w:t>{escape(text)}</w:t></w:r></w:p>"
+
+    body = []
+    for n in range(paragraphs):
+        body.append(para(_sentence(rng, rng.randint(8, 20))))
+        if n % 50 == 49:
+            rows = "".join(
+                "<w:tr>" + "".join(f"<w:tc>{para(rng.choice(_WORDS))}</w:tc>" for _ in range(3)) + "</w:tr>"
+                for _ in range(4)
+            )
+            body.append(f"<w:tbl>{rows}</w:tbl>")
+
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{_W_NS}"><w:body>{"".join(body)}</w:body></w:document>'
+    )
+
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, text in (
+            ("[Content_Types].xml", _CONTENT_TYPES),
+            ("_rels/.rels", _RELS),
+            ("word/document.xml", document),
+        ):
+            info = zipfile.ZipInfo(name, date_time=(2020, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            zf.writestr(info, text)
+    return buf.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# CSV / log
+# ---------------------------------------------------------------------------
+
+def _csv(rng: random.Random, rows: int) -> bytes:
+    lines = ["id,date,customer,product,quantity,amount,note"]
+    for n in range(rows):
+        lines.append(
+            f"{n},2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d},"
+            f"{rng.choice(_WORDS)} {rng.choice(_WORDS)},{rng.choice(_WORDS)},"
+            f"{rng.randint(1, 500)},{rng.uniform(1, 10_000):.2f},\"{_sentence(rng, 4)}\""
+        )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _log(rng: random.Random, lines: int) -> bytes:
+    levels = ("DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR")
+    out = []
+    for n in range(lines):
+        out.append(
+            f"2024-03-{1 + n // 86_400 % 28:02d} {n // 3600 % 24:02d}:{n // 60 % 60:02d}:{n % 60:02d} "
+            f"{rng.choice(levels):<7} worker-{rng.randint(1, 16)} {_sentence(rng, rng.randint(5, 12))}"
+        )
+    return ("\n".join(out) + "\n").encode("utf-8")
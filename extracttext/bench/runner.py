@@ -0,0 +1,250 @@
+"""Benchmark runner: latency percentiles, throughput and peak RSS per case.
+
+A *case* is one corpus document processed by one *target* – either the
+extractor that owns the document type or :meth:`DataLoader.load`.  By default
+each case runs in a fresh spawned interpreter, so its peak RSS is not
+inflated by earlier cases.  OCR cases are reported as ``skipped`` when the
+Tesseract / poppler binaries are missing.
+"""
+from __future__ import annotations
+
+import os
+import platform
+import shutil
+import statistics
+import sys
+import time
+import typing as _t
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .corpus import CorpusDocument, load_manifest
+
+__all__ = [
+    "BenchCase",
+    "CaseResult",
+    "plan_cases",
+    "run_benchmarks",
+    "SCHEMA_VERSION",
+]
+
+SCHEMA_VERSION = 1
+
+#: Extractor exercised directly for each document type
+_EXTRACTOR_FOR_TYPE = {
+    "pdf_text": "PdfTextExtractor",
+    "pdf_image": "PdfOcrExtractor",
+    "pdf_mixed": "PdfHybridExtractor",
+    "image": "ImageOcrExtractor",
+    "docx": "DocxExtractor",
+    "csv": "CsvExtractor",
+    "text": "TextExtractor",
+}
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """One document × target combination."""
+
+    document: CorpusDocument
+    target: str  # extractor class name or ``"DataLoader.load"``
+    loader_options: dict = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.document.name}:{self.target}"
+
+
+@dataclass
+class CaseResult:
+    key: str
+    document: str
+    document_type: str
+    target: str
+    status: str  # ``ok`` / ``skipped`` / ``error``
+    bytes: int
+    pages: int
+    repeat: int = 0
+    chars: int = 0
+    latency_ms: dict = field(default_factory=dict)  # min / mean / p50 / p95 / max
+    throughput: dict = field(default_factory=dict)  # docs_per_s / pages_per_s / mb_per_s
+    peak_rss_mb: _t.Optional[float] = None
+    detail: str = ""
+
+
+def plan_cases(documents: _t.Iterable[CorpusDocument], targets: _t.Iterable[str] = ("extractor", "loader")) -> list[BenchCase]:
+    """Cases for *documents*; *targets* selects extractor- and/or loader-level runs."""
+    targets = set(targets)
+    cases = []
+    for doc in documents:
+        if "extractor" in targets:
+            cases.append(BenchCase(doc, _EXTRACTOR_FOR_TYPE[doc.document_type]))
+        if "loader" in targets:
+            options = {"hybrid_pdf": True} if doc.document_type == "pdf_mixed" else {}
+            cases.append(BenchCase(doc, "DataLoader.load", options))
+    return cases
+
+
+def _missing_binaries(doc: CorpusDocument) -> list[str]:
+    if not doc.needs_ocr:
+        return []
+    needed = ["tesseract"] + (["pdftoppm"] if doc.name.endswith(".pdf") else [])
+    return [cmd for cmd in needed if shutil.which(cmd) is None]
+
+
+def _percentile(values: _t.Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile (*q* in 0–100) of *values*."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    pos = (len(ordered) - 1) * q / 100
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def _worker_peaks_kib() -> list[int]:
+    """Peak RSS (``VmHWM``, KiB) of the live OCR pool workers – Linux only."""
+    from extracttext.concurrency import default_pool_pids
+
+    peaks = []
+    for pid in default_pool_pids():
+        try:
+            with open(f"/proc/{pid}/status") as fh:
+                for line in fh:
+                    if line.startswith("VmHWM:"):
+                        peaks.append(int(line.split()[1]))
+                        break
+        except OSError:
+            continue
+    return peaks
+
+
+def _peak_rss_mb() -> _t.Optional[float]:
+    """Largest peak RSS of this process, its reaped children and the live pool workers."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover – Windows
+        return None
+    peaks = [resource.getrusage(who).ru_maxrss for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)]
+    if sys.platform.startswith("linux"):
+        peaks += _worker_peaks_kib()
+    # Linux reports KiB, macOS bytes
+    return round(max(peaks) / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _run_case(case: BenchCase, path: str, repeat: int, warmup: int) -> CaseResult:
+    """Measure *case* in the current process."""
+    from extracttext import extractors
+    from extracttext.dataloader import DataLoader
+
+    doc = case.document
+    if case.target == "DataLoader.load":
+        loader = DataLoader(**case.loader_options)
+
+        def call() -> str:
+            return loader.load(Path(path)).text_payload
+
+    else:
+        extractor = getattr(extractors, case.target)()
+
+        def call() -> str:
+            return extractor.extract_text(Path(path))
+
+    result = CaseResult(case.key, doc.name, doc.document_type, case.target, "ok", doc.bytes, doc.pages)
+    try:
+        for _ in range(warmup):
+            call()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            text = call()
+            timings.append(time.perf_counter() - start)
+    except Exception as exc:
+        result.status, result.detail = "error", f"{type(exc).__name__}: {exc}"
+        return result
+
+    mean = statistics.fmean(timings)
+    result.repeat = repeat
+    result.chars = len(text)
+    result.latency_ms = {
+        "min": round(min(timings) * 1000, 3),
+        "mean": round(mean * 1000, 3),
+        "p50": round(_percentile(timings, 50) * 1000, 3),
+        "p95": round(_percentile(timings, 95) * 1000, 3),
+        "max": round(max(timings) * 1000, 3),
+    }
+    result.throughput = {
+        "docs_per_s": round(1 / mean, 3) if mean else None,
+        "pages_per_s": round(doc.pages / mean, 3) if mean else None,
+        "mb_per_s": round(doc.bytes / (1024 * 1024) / mean, 3) if mean else None,
+    }
+    result.peak_rss_mb = _peak_rss_mb()
+    return result
+
+
+def _run_case_isolated(case: BenchCase, path: str, repeat: int, warmup: int) -> CaseResult:
+    """:func:`_run_case` in a fresh spawned interpreter (clean peak RSS)."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(_run_case, case, path, repeat, warmup).result()
+
+
+def run_benchmarks(
+    corpus_dir: _t.Union[str, Path],
+    *,
+    repeat: int = 5,
+    warmup: int = 1,
+    targets: _t.Iterable[str] = ("extractor", "loader"),
+    only: _t.Optional[_t.Iterable[str]] = None,
+    isolate: bool = True,
+    progress: _t.Optional[_t.Callable[[CaseResult], None]] = None,
+) -> dict:
+    """Benchmark every case of the corpus in *corpus_dir* and return the report.
+
+    *only* restricts the run to the given document names.  The report is a
+    JSON-serialisable dict (``schema``, ``environment``, ``corpus``,
+    ``results``) suitable for :func:`extracttext.bench.compare.compare`.
+    """
+    from extracttext import __version__
+
+    corpus_dir = Path(corpus_dir)
+    spec, documents = load_manifest(corpus_dir)
+    if only is not None:
+        wanted = set(only)
+        documents = [d for d in documents if d.name in wanted]
+
+    results = []
+    for case in plan_cases(documents, targets):
+        missing = _missing_binaries(case.document)
+        if missing:
+            doc = case.document
+            result = CaseResult(
+                case.key, doc.name, doc.document_type, case.target, "skipped", doc.bytes, doc.pages,
+                detail=f"missing: {', '.join(missing)}",
+            )
+        else:
+            run = _run_case_isolated if isolate else _run_case
+            result = run(case, str(corpus_dir / case.document.name), repeat, warmup)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "extracttext": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "tesseract": shutil.which("tesseract") is not None,
+            "poppler": shutil.which("pdftoppm") is not None,
+            "isolated": isolate,
+        },
+        "corpus": asdict(spec),
+        "results": [asdict(r) for r in results],
+    }
@@ -0,0 +1,141 @@
+"""Start-up benchmarks: import time, ``extracttext --help`` and first-call latency.
+
+Every scenario runs *repeat* times in a fresh interpreter, because start-up
+cost is paid once per process – by the CLI and by every spawned pool worker.
+The bare ``python`` scenario is the interpreter's own start-up; subtract it
+to read off the library's share.  First-call scenarios additionally report
+the latency of the first :func:`extracttext.load` call measured inside the
+child (``…:call``), i.e. the lazy imports of the dispatched extractor.
+
+Results share the shape of :func:`~extracttext.bench.runner.run_benchmarks`
+results, so reports can be diffed with :func:`~extracttext.bench.compare.compare`.
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as _t
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .corpus import _page_lines, _pdf
+from .runner import SCHEMA_VERSION, _percentile
+
+__all__ = ["run_startup", "SCENARIOS"]
+
+#: Measures the first ``load`` call inside the child and prints it as JSON
+_FIRST_CALL = """
+import json, sys, time
+import extracttext
+start = time.perf_counter()
+extracttext.load(sys.argv[1])
+print(json.dumps({"call_ms": (time.perf_counter() - start) * 1000}))
+"""
+
+#: name → interpreter arguments (``@text`` / ``@pdf`` stand for the fixture paths)
+SCENARIOS: dict[str, list[str]] = {
+    "python": ["-c", "pass"],
+    "import": ["-c", "import extracttext"],
+    "cli-help": ["-m", "extracttext.cli", "--help"],
+    "first-load-text": ["-c", _FIRST_CALL, "@text"],
+    "first-load-pdf": ["-c", _FIRST_CALL, "@pdf"],
+}
+
+
+def _write_fixtures(directory: Path) -> dict[str, str]:
+    rng = random.Random(1234)
+    text = directory / "first.txt"
+    text.write_text("\n".join(_page_lines(rng)) + "\n")
+    pdf = directory / "first.pdf"
+    pdf.write_bytes(_pdf([("text", _page_lines(rng))], 150))
+    return {"@text": str(text), "@pdf": str(pdf)}
+
+
+def _stats(timings: list[float]) -> dict:
+    return {
+        "min": round(min(timings), 3),
+        "mean": round(statistics.fmean(timings), 3),
+        "p50": round(_percentile(timings, 50), 3),
+        "p95": round(_percentile(timings, 95), 3),
+        "max": round(max(timings), 3),
+    }
+
+
+def _result(key: str, timings: list[float], status: str = "ok", detail: str = "") -> dict:
+    return {
+        "key": key,
+        "document": "",
+        "document_type": "",
+        "target": "startup",
+        "status": status,
+        "bytes": 0,
+        "pages": 0,
+        "repeat": len(timings),
+        "chars": 0,
+        "latency_ms": _stats(timings) if timings else {},
+        "throughput": {},
+        "peak_rss_mb": None,
+        "detail": detail,
+    }
+
+
+def run_startup(
+    *,
+    repeat: int = 10,
+    scenarios: _t.Optional[_t.Iterable[str]] = None,
+    progress: _t.Optional[_t.Callable[[dict], None]] = None,
+) -> dict:
+    """Measure every scenario (or only *scenarios*) and return the report."""
+    from extracttext import __version__
+
+    names = list(SCENARIOS) if scenarios is None else list(scenarios)
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    # Run against this checkout even when it is not installed
+    package_root = str(Path(__file__).resolve().parents[2])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="extracttext_startup_") as tmp:
+        fixtures = _write_fixtures(Path(tmp))
+        for name in names:
+            argv = [sys.executable, *(fixtures.get(arg, arg) for arg in SCENARIOS[name])]
+            wall: list[float] = []
+            calls: list[float] = []
+            detail = ""
+            for _ in range(repeat):
+                start = time.perf_counter()
+                proc = subprocess.run(argv, capture_output=True, text=True, env=env, cwd=tmp)
+                elapsed = (time.perf_counter() - start) * 1000
+                if proc.returncode != 0:
+                    detail = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}"
+                    break
+                wall.append(elapsed)
+                if name.startswith("first-load"):
+                    calls.append(json.loads(proc.stdout.strip().splitlines()[-1])["call_ms"])
+
+            batch = [_result(f"startup:{name}", wall, "ok" if not detail else "error", detail)]
+            if calls and not detail:
+                batch.append(_result(f"startup:{name}:call", calls))
+            for item in batch:
+                results.append(item)
+                if progress is not None:
+                    progress(item)
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "extracttext": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
@@ -0,0 +1,254 @@
+"""Content-addressed cache for extraction results.
+
+Results are keyed on a hash of the document *bytes* plus every setting that
+can change the extracted text (OCR language / DPI / engine, ``prefer_ocr``,
+library version, …), so re-sent attachments are answered without re-running
+pdfminer or OCR.
+
+Tiers:
+    • :class:`MemoryCache` – in-process LRU bounded by entry count.
+    • :class:`DiskCache`   – one JSON file per entry, bounded by total size;
+      least-recently-used files are evicted first.
+    • :class:`TieredCache` – memory in front of disk, promoting disk hits.
+
+:func:`build_default_cache` assembles the tiers from environment variables.
+"""
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import typing as _t
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from .extractors.base_extractor import DocumentType
+
+__all__ = [
+    "CachedResult",
+    "ResultCache",
+    "MemoryCache",
+    "DiskCache",
+    "TieredCache",
+    "build_default_cache",
+    "content_digest",
+    "make_cache_key",
+]
+
+_CHUNK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """The cacheable part of an :class:`~extracttext.dataloader.ExtractionResult`."""
+
+    document_type: DocumentType
+    text_payload: str
+
+    def to_json(self) -> str:
+        return json.dumps({"document_type": self.document_type.value, "text_payload": self.text_payload})
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CachedResult":
+        data = json.loads(raw)
+        return cls(DocumentType(data["document_type"]), data["text_payload"])
+
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+def content_digest(source: _t.Union[str, Path, bytes]) -> str:
+    """Return the hex SHA-256 of *source* (bytes or a file path, read in chunks)."""
+    h = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        h.update(source)
+    else:
+        with open(source, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def make_cache_key(digest: str, settings: _t.Mapping[str, _t.Any]) -> str:
+    """Combine a content *digest* with extraction *settings* into a cache key."""
+    canonical = json.dumps(dict(settings), sort_keys=True, default=str)
+    return hashlib.sha256(f"{digest}:{canonical}".encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Tiers
+# ---------------------------------------------------------------------------
+
+class ResultCache(abc.ABC):
+    """Minimal cache contract used by :class:`~extracttext.dataloader.DataLoader`."""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> _t.Optional[CachedResult]:
+        """Return the entry for *key* or ``None`` on a miss."""
+
+    @abc.abstractmethod
+    def set(self, key: str, value: CachedResult) -> None:
+        """Store *value* under *key*."""
+
+
+class MemoryCache(ResultCache):
+    """Thread-safe in-process LRU holding at most *max_entries* results."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> _t.Optional[CachedResult]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedResult) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache(ResultCache):
+    """On-disk tier capped at *max_bytes*; evicts least-recently-used entries.
+
+    Recency is tracked through file modification times, which are bumped on
+    every hit, so the cache survives restarts and can be shared by several
+    processes on the same host.
+    """
+
+    def __init__(self, directory: _t.Union[str, Path], max_bytes: int = 512 * 1024 * 1024):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = sum(p.stat().st_size for p in self._entries())
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> _t.Iterator[Path]:
+        return self.directory.glob("*/*.json")
+
+    def get(self, key: str) -> _t.Optional[CachedResult]:
+        path = self._path(key)
+        try:
+            raw = path.read_text(encoding="utf-8")
+            os.utime(path)  # mark as recently used
+            return CachedResult.from_json(raw)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt entry – drop it and treat as a miss
+            self._discard(path)
+            return None
+
+    def set(self, key: str, value: CachedResult) -> None:
+        data = value.to_json().encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        # Atomic publish so concurrent readers never see partial files
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+
+        with self._lock:
+            try:
+                self._size -= path.stat().st_size
+            except FileNotFoundError:
+                pass
+            os.replace(tmp, path)
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _discard(self, path: Path) -> None:
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+                self._size -= size
+            except FileNotFoundError:
+                pass
+
+    def _evict(self) -> None:
+        """Remove oldest entries until the tier is back to 90 % of its cap."""
+        target = int(self.max_bytes * 0.9)
+        stats = []
+        for p in self._entries():
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            stats.append((st.st_mtime, st.st_size, p))
+        stats.sort()
+
+        self._size = sum(size for _, size, _ in stats)
+        for _, size, p in stats:
+            if self._size <= target:
+                break
+            try:
+                p.unlink()
+                self._size -= size
+            except FileNotFoundError:
+                pass
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+
+class TieredCache(ResultCache):
+    """Check *memory* first, then *disk*; disk hits are promoted to memory."""
+
+    def __init__(self, memory: MemoryCache, disk: _t.Optional[DiskCache] = None):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> _t.Optional[CachedResult]:
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value: CachedResult) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+
+def build_default_cache() -> TieredCache:
+    """Return a :class:`TieredCache` configured from the environment.
+
+    Environment overrides:
+        • ``EXTRACTTEXT_CACHE_ENTRIES``   – memory tier size (default 256).
+        • ``EXTRACTTEXT_CACHE_DIR``       – disk tier location
+          (default ``~/.cache/extracttext``; set to an empty string to disable).
+        • ``EXTRACTTEXT_CACHE_MAX_BYTES`` – disk tier cap (default 512 MiB).
+    """
+    memory = MemoryCache(int(os.getenv("EXTRACTTEXT_CACHE_ENTRIES", "256")))
+
+    directory = os.getenv("EXTRACTTEXT_CACHE_DIR", str(Path.home() / ".cache" / "extracttext"))
+    disk = None
+    if directory:
+        disk = DiskCache(directory, int(os.getenv("EXTRACTTEXT_CACHE_MAX_BYTES", str(512 * 1024 * 1024))))
+
+    return TieredCache(memory, disk)
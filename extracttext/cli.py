@@ -3,6 +3,7 @@
 
 Example:
     extracttext sample.pdf --prefer-ocr --json
+    extracttext slow.pdf --profile --profile-dir ./slow-profile   # CPU + allocation profile
 """
 
 import argparse
@@ -17,11 +18,36 @@ def main() -> None:  # noqa: D401
     parser = argparse.ArgumentParser(description="Extract text from a document")
     parser.add_argument("source", help="path to document")
     parser.add_argument("--prefer-ocr", action="store_true", help="Force OCR-first order")
+    parser.add_argument(
+        "--hybrid-pdf",
+        action="store_true",
+        help="Per-page PDF mode: use the text layer where present, OCR only pages without one",
+    )
     parser.add_argument("--json", action="store_true", help="Output JSON envelope instead of raw text")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write a CPU profile (pstats), allocation snapshot and top-N summary to --profile-dir; "
+        "OCR worker processes are included",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="extracttext-profile",
+        metavar="DIR",
+        help="Directory for --profile artifacts (default ./extracttext-profile)",
+    )
+    parser.add_argument("--profile-top", type=int, default=30, metavar="N", help="Rows per summary table")
     args = parser.parse_args()
 
     try:
-        res = load(Path(args.source), prefer_ocr=args.prefer_ocr)
+        if args.profile:
+            from .profiling import profile
+
+            with profile(args.profile_dir, top=args.profile_top) as report:
+                res = load(Path(args.source), prefer_ocr=args.prefer_ocr, hybrid_pdf=args.hybrid_pdf)
+            print(f"Profile written to {report.directory} (summary: {report.summary_path})", file=sys.stderr)
+        else:
+            res = load(Path(args.source), prefer_ocr=args.prefer_ocr, hybrid_pdf=args.hybrid_pdf)
     except Exception as exc:
         print(f"Error: {exc}", file=sys.stderr)
         sys.exit(1)
@@ -4,33 +4,139 @@ Provides a singleton *process* pool for CPU-bound tasks (e.g. OCR) so that
 heavy work can execute in parallel without blocking the main interpreter.
 
 The pool is lazy-initialised on first access to avoid unnecessary processes
-for applications that never use OCR.
+for applications that never use OCR.  It is the *only* pool the library
+creates: per-page OCR tasks from every concurrent document are scheduled on
+it, and code already running inside one of its workers executes fan-out work
+inline instead of spawning a nested pool.
 """
 from __future__ import annotations
 
 import os
-from concurrent.futures import ProcessPoolExecutor, Executor
+from concurrent.futures import Future, ProcessPoolExecutor, Executor, ThreadPoolExecutor
 import atexit
-from typing import Optional
+import time
+from typing import Any, Callable, Optional
 
 __all__ = [
+    "InlineExecutor",
+    "default_pool_pids",
     "get_default_executor",
+    "get_thread_executor",
+    "prewarm_default_executor",
+    "resolve_executor",
+    "worker_count",
 ]
 
 _DEFAULT_POOL: Optional[ProcessPoolExecutor] = None
+_THREAD_POOL: Optional[ThreadPoolExecutor] = None
+
+#: Set in every worker of the default pool by :func:`_mark_worker`
+_IN_POOL_WORKER = False
+
+
+class InlineExecutor(Executor):
+    """Executor running every task synchronously in the calling thread.
+
+    Used inside pool workers so that code written against the
+    :class:`~concurrent.futures.Executor` interface never nests pools.
+    """
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:  # type: ignore[override]
+        fut: Future = Future()
+        try:
+            fut.set_result(fn(*args, **kwargs))
+        except BaseException as exc:  # propagate through the future like a pool would
+            fut.set_exception(exc)
+        return fut
+
+
+def _mark_worker() -> None:
+    global _IN_POOL_WORKER
+    _IN_POOL_WORKER = True
+
+    from .profiling import _reset_after_fork
+
+    _reset_after_fork()
+
+
+def worker_count() -> int:
+    """Number of CPUs this process may actually run on (honours affinity masks)."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except (AttributeError, OSError):  # pragma: no cover – non-Linux platforms
+        return os.cpu_count() or 1
 
 
 def _create_pool() -> ProcessPoolExecutor:
-    max_workers = os.cpu_count() or 1
-    pool = ProcessPoolExecutor(max_workers=max_workers)
+    max_workers = worker_count()
+    pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_mark_worker)
     # Ensure we cleanly shutdown when Python exits
     atexit.register(pool.shutdown, wait=False)
     return pool
 
 
 def get_default_executor() -> Executor:
-    """Return a singleton :class:`ProcessPoolExecutor` instance."""
+    """Return a singleton :class:`ProcessPoolExecutor` instance.
+
+    A pool left broken by a crashed worker is replaced transparently.
+    """
     global _DEFAULT_POOL
-    if _DEFAULT_POOL is None:
+    if _DEFAULT_POOL is None or getattr(_DEFAULT_POOL, "_broken", False):
         _DEFAULT_POOL = _create_pool()
-    return _DEFAULT_POOL 
\ No newline at end of file
+    return _DEFAULT_POOL
+
+
+def get_thread_executor() -> Executor:
+    """Return a singleton :class:`ThreadPoolExecutor` for orchestration work.
+
+    Used by the asyncio API to keep blocking steps (temp files, waiting on the
+    process pool) off the event loop.  Its threads hold no CPU-bound work, so
+    it can be much larger than the process pool; size it with
+    ``EXTRACTTEXT_IO_THREADS`` (default 64).
+    """
+    global _THREAD_POOL
+    if _THREAD_POOL is None:
+        max_workers = int(os.getenv("EXTRACTTEXT_IO_THREADS", "64"))
+        _THREAD_POOL = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="extracttext-io")
+        atexit.register(_THREAD_POOL.shutdown, wait=False)
+    return _THREAD_POOL
+
+
+def _warm_worker() -> None:
+    # Stay busy briefly so that each task lands on a different worker
+    time.sleep(0.05)
+
+
+def prewarm_default_executor() -> Executor:
+    """Spawn every worker of the default pool up-front and return it.
+
+    Worker processes are otherwise started lazily on first submit, which puts
+    fork + import cost on the first OCR request.
+    """
+    pool = get_default_executor()
+    futures = [pool.submit(_warm_worker) for _ in range(worker_count())]
+    for fut in futures:
+        fut.result()
+    return pool
+
+
+def default_pool_pids() -> list[int]:
+    """PIDs of the default pool's live worker processes (empty before first use)."""
+    if _DEFAULT_POOL is None:
+        return []
+    return list(getattr(_DEFAULT_POOL, "_processes", None) or {})
+
+
+def resolve_executor(executor: Optional[Executor] = None) -> Executor:
+    """Return the executor fan-out work (e.g. per-page OCR) should use.
+
+    * an explicitly supplied *executor* always wins;
+    * inside a worker of the default pool an :class:`InlineExecutor` is
+      returned, so tasks never create nested pools;
+    * otherwise the shared default pool.
+    """
+    if executor is not None:
+        return executor
+    if _IN_POOL_WORKER:
+        return InlineExecutor()
+    return get_default_executor()
@@ -5,30 +5,37 @@ End-users are expected to import :func:`load` or instantiate :class:`DataLoader`
 
 from __future__ import annotations
 
+import itertools
 import json
+import time
 import uuid
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import BinaryIO, List, Union, Optional
+from typing import BinaryIO, Iterable, Iterator, List, Tuple, Union, Optional
+import typing as _t
 import io
 import os
 import shutil
 import tempfile
+from time import perf_counter
 # Forward ref for executor typing hints (avoids heavy import unless needed)
 from concurrent.futures import Executor
 
-from .extractors import (
-    CsvExtractor,
-    DocxExtractor,
-    ImageOcrExtractor,
-    PdfOcrExtractor,
-    PdfTextExtractor,
-    TextExtractor,
-)
 from .extractors.base_extractor import BaseExtractor, DocumentType
-from .errors import UnsupportedDocumentError, ExtractionFailedError
+from .extractors.registry import HYBRID_PDF_SPEC, ExtractorSpec, registered_specs
+from .cache import CachedResult, ResultCache, content_digest, make_cache_key
+from .detector import KIND_IMAGE, KIND_PDF, DocumentProbe, probe_document, sniff_kind
+from .errors import DeadlineExceededError, UnsupportedDocumentError, ExtractionFailedError
+from .instrumentation import Span, SpanHook, Trace, span, tracing_enabled
+from .profiling import profiled
 
-SourceType = Union[str, Path, bytes, BinaryIO]
+SourceType = Union[str, Path, bytes, memoryview, BinaryIO]
+
+#: ``load_many`` items – a source, optionally paired with its filename
+BatchSourceType = Union[SourceType, Tuple[SourceType, str]]
+
+#: Extractors that schedule per-page OCR on an executor themselves
+_PAGE_PARALLEL_TYPES = {DocumentType.PDF_IMAGE, DocumentType.PDF_MIXED}
 
 
 @dataclass
@@ -37,10 +44,35 @@ class ExtractionResult:
     document_name: str
     document_type: DocumentType
     text_payload: str
+    # Set when a deadline or ``max_chars`` cut the requested text short
+    partial: bool = False
+    # Per-stage timings, only with ``load(..., trace=True)``
+    spans: Optional[List[Span]] = None
 
     # ------------------------------------------------------------------
     # Convenience helpers
     # ------------------------------------------------------------------
+    def dict(self) -> dict:
+        data = asdict(self)
+        if self.spans is None:
+            del data["spans"]
+        return data
+
+    def json(self, **kwargs) -> str:  # noqa: D401
+        return json.dumps(self.dict(), default=str, **kwargs)
+
+
+@dataclass
+class TextFragment:
+    """One page (or chunk) of a document yielded by :meth:`DataLoader.iter_text`."""
+
+    document_id: str
+    document_name: str
+    document_type: DocumentType
+    page: int  # 1-based page number (chunk number for unpaginated types)
+    text: str
+    elapsed_ms: float  # since iteration started
+
     def dict(self) -> dict:
         return asdict(self)
 
@@ -48,21 +80,109 @@ class ExtractionResult:
         return json.dumps(self.dict(), default=str, **kwargs)
 
 
+@dataclass
+class BatchResult:
+    """Outcome of one item processed by :meth:`DataLoader.load_many`.
+
+    Exactly one of :attr:`result` / :attr:`error` is set, so a single bad file
+    never aborts the whole batch.
+    """
+
+    index: int  # position of the item in the input iterable
+    document_name: Optional[str]
+    result: Optional[ExtractionResult] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _split_pages(cached: CachedResult) -> List[str]:
+    """Split a cached payload back into the pages :meth:`DataLoader.iter_text` yields."""
+    if not cached.document_type.is_pdf:
+        return [cached.text_payload]
+    pages = cached.text_payload.split("\f")
+    if cached.document_type == DocumentType.PDF_TEXT and len(pages) > 1 and pages[-1] == "":
+        # Both PDF text engines terminate every page with a form-feed
+        pages.pop()
+    return pages
+
+
+def _check_deadline(deadline: Optional[float], doc_type: DocumentType) -> None:
+    if deadline is not None and time.monotonic() >= deadline:
+        raise DeadlineExceededError("Extraction deadline exceeded", doc_type)
+
+
+def _await_future(future: "_t.Any", deadline: Optional[float], doc_type: DocumentType) -> "_t.Any":
+    """``future.result()`` bounded by *deadline*; the task is cancelled on expiry."""
+    from concurrent.futures import TimeoutError as FutureTimeout
+
+    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeout:
+        future.cancel()
+        raise DeadlineExceededError("Extraction deadline exceeded", doc_type) from None
+
+
+def _is_paginated(doc_type: Optional[DocumentType]) -> bool:
+    """Whether pages of *doc_type* are joined with form-feeds."""
+    return doc_type is not None and (doc_type.is_pdf or doc_type == DocumentType.IMAGE)
+
+
+def _pages_in_worker(
+    extractor: BaseExtractor, doc: Union[Path, bytes], page_numbers: Optional[List[int]] = None
+) -> List[str]:
+    """Pool task: the pages (or chunks) of a document, *page_numbers* only when given."""
+    options = {} if page_numbers is None else {"page_numbers": page_numbers}
+    return list(extractor.iter_pages(doc, **options))  # type: ignore[call-arg]
+
+
+def _load_in_worker(source: Union[str, bytes], filename: Optional[str], options: dict) -> ExtractionResult:
+    """Pool task used by :meth:`DataLoader.load_many` – one whole document.
+
+    Only documents without pages to fan out (text, CSV, DOCX) run here; a
+    worker cannot submit to the pool, so anything it would fan out runs inline.
+    """
+    from .concurrency import InlineExecutor
+
+    return DataLoader(executor=InlineExecutor(), **options).load(source, filename=filename)
+
+
+def _batch_kind(payload: Union[str, bytes], name: str) -> Optional[str]:
+    """Content kind of a :meth:`DataLoader.load_many` payload – header sniff only."""
+    suffix = Path(name).suffix.lower()
+    if isinstance(payload, bytes):
+        return sniff_kind(io.BytesIO(payload), suffix)
+    with open(payload, "rb") as fp:
+        return sniff_kind(fp, suffix)
+
+
 class DataLoader:
-    """Central orchestrator – delegates work to individual extractors."""
-
-    #: Ordered preference of extractors
-    _EXTRACTORS: List[BaseExtractor] = [
-        PdfTextExtractor(),
-        DocxExtractor(),
-        TextExtractor(),
-        CsvExtractor(),
-        ImageOcrExtractor(),
-        PdfOcrExtractor(),
-    ]
-
-    def __init__(self, *, prefer_ocr: bool = False, executor: Optional["Executor"] = None):
+    """Central orchestrator – delegates work to individual extractors.
+
+    Extractors come from :mod:`extracttext.extractors.registry` and are
+    imported only when a document is first dispatched to them.
+    """
+
+    def __init__(
+        self,
+        *,
+        prefer_ocr: bool = False,
+        executor: Optional["Executor"] = None,
+        hybrid_pdf: bool = False,
+        cache: Optional[ResultCache] = None,
+        in_memory: bool = False,
+        hooks: Iterable[SpanHook] = (),
+    ):
         self.prefer_ocr = prefer_ocr
+        self.hybrid_pdf = hybrid_pdf
+        self.cache = cache
+        self.in_memory = in_memory
+        # Span callbacks for this loader's calls, see extracttext.instrumentation
+        self.hooks: List[SpanHook] = list(hooks)
+
         if executor is None and prefer_ocr:
             # Lazy import to avoid heavy module unless concurrency requested
             from .concurrency import get_default_executor
@@ -120,35 +240,255 @@ class DataLoader:
 
         raise TypeError("Unsupported *source* type; expected path, bytes, or BinaryIO")
 
-    def _iter_extractors(self) -> List[BaseExtractor]:
-        """Return extractors in order, honouring *prefer_ocr*."""
+    @staticmethod
+    def _buffer_source(
+        source: SourceType, filename: str | None = None
+    ) -> tuple[Union[Path, bytes], str, _t.Callable[[], None]]:
+        """In-memory counterpart of :meth:`_normalise_source`.
+
+        Bytes are used as-is and streams are read into memory, so detection and
+        extraction run on the buffer without a temp-file round trip.  Streams
+        larger than ``EXTRACTTEXT_IN_MEMORY_MAX_BYTES`` (default 32 MiB) spill
+        to a temporary file to keep memory bounded.  Paths are passed through.
+        """
+        noop = lambda: None  # noqa: E731 – simple placeholder
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return bytes(source) if not isinstance(source, bytes) else source, (filename or ""), noop
+
+        if hasattr(source, "read") and not isinstance(source, (str, Path)):
+            limit = int(os.getenv("EXTRACTTEXT_IN_MEMORY_MAX_BYTES", str(32 * 1024 * 1024)))
+            head = source.read(limit + 1)  # type: ignore[union-attr]
+            if len(head) <= limit:
+                return head, (filename or ""), noop
+
+            suffix = f"_{filename}" if filename else ""
+            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+            tmp.write(head)
+            shutil.copyfileobj(source, tmp)  # type: ignore[arg-type]
+            tmp.close()
+            return Path(tmp.name), (filename or Path(tmp.name).name), lambda: os.remove(tmp.name)
+
+        return DataLoader._normalise_source(source, filename)
+
+    def _open_source(
+        self, source: SourceType, filename: str | None = None
+    ) -> tuple[Union[Path, bytes], str, _t.Callable[[], None]]:
+        if self.in_memory:
+            return self._buffer_source(source, filename)
+        return self._normalise_source(source, filename)
+
+    def _cache_key(self, content: Union[Path, bytes], suffix: str) -> str:
+        """Key on document bytes plus every setting that affects the output."""
+        from . import __version__
+
+        # Settings only – none of these imports loads an extraction backend
+        from .encoding import DEFAULT_CHUNK_BYTES, DEFAULT_SAMPLE_BYTES
+        from .extractors.docx import DEFAULT_DOCX_ENGINE
+        from .ocr.options import DEFAULT_ENGINE, AdaptiveDpiOptions, PreprocessOptions, adaptive_dpi_enabled
+        from .poppler import DEFAULT_PDFTOTEXT_MODE, resolve_pdf_text_engine
+
+        settings = {
+            "version": __version__,
+            "suffix": suffix.lower(),  # extension still steers routing
+            "prefer_ocr": self.prefer_ocr,
+            "hybrid_pdf": self.hybrid_pdf,
+            "ocr_lang": os.getenv("OCR_LANG", "eng"),
+            "ocr_dpi": os.getenv("OCR_DPI", "300"),
+            "ocr_engine": os.getenv("OCR_ENGINE", DEFAULT_ENGINE),
+            "docx_engine": os.getenv("DOCX_ENGINE", DEFAULT_DOCX_ENGINE),
+            # Resolved, so "auto" results differ once poppler is installed
+            "pdf_text_engine": resolve_pdf_text_engine(),
+            "pdftotext_mode": os.getenv("PDFTOTEXT_MODE", DEFAULT_PDFTOTEXT_MODE),
+            # Encoding detection sample, and chunks where it is re-run on a mismatch
+            "text_sample_bytes": int(os.getenv("EXTRACTTEXT_TEXT_SAMPLE_BYTES", str(DEFAULT_SAMPLE_BYTES))),
+            "text_chunk_bytes": int(os.getenv("EXTRACTTEXT_TEXT_CHUNK_BYTES", str(DEFAULT_CHUNK_BYTES))),
+            "ocr_preprocess": asdict(PreprocessOptions.from_env()),
+            "ocr_dpi_auto": asdict(AdaptiveDpiOptions.from_env()) if adaptive_dpi_enabled() else None,
+        }
+        return make_cache_key(content_digest(content), settings)
+
+    def _iter_specs(self) -> List[ExtractorSpec]:
+        """Return extractor specs in order, honouring *prefer_ocr* and *hybrid_pdf*."""
+        specs = registered_specs()
+        if self.hybrid_pdf:
+            # Whole-document PDF extractors stay behind as fallbacks
+            specs = [HYBRID_PDF_SPEC, *specs]
+
         if not self.prefer_ocr:
-            return self._EXTRACTORS
+            return specs
 
         # Move OCR variants to the front while preserving original relative order
         ocr_types = {DocumentType.IMAGE, DocumentType.PDF_IMAGE}
-        return sorted(self._EXTRACTORS, key=lambda e: e.DOCUMENT_TYPE not in ocr_types)
+        return sorted(specs, key=lambda s: s.document_type not in ocr_types)
+
+    def _candidates(self, probe: DocumentProbe) -> List[BaseExtractor]:
+        """Extractors worth trying for *probe*.
+
+        Recognised content goes straight to the extractors of its kind, so
+        misnamed files never run through unrelated (and expensive)
+        extractors; unrecognised content is routed by extension.  Only the
+        returned extractors are imported.
+        """
+        if probe.kind is None:
+            specs = [s for s in self._iter_specs() if s.accepts_suffix(probe.suffix)]
+        else:
+            specs = [s for s in self._iter_specs() if s.kind == probe.kind]
+        return [spec.load() for spec in specs]
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def load(self, source: SourceType, filename: str | None = None) -> ExtractionResult:  # noqa: D401
+    def load(
+        self,
+        source: SourceType,
+        filename: str | None = None,
+        *,
+        pages: Optional[Iterable[int]] = None,
+        max_chars: Optional[int] = None,
+        deadline: Optional[float] = None,
+        trace: bool = False,
+    ) -> ExtractionResult:  # noqa: D401
         """Return :class:`ExtractionResult` for *source*.
 
-        Current implementation **only identifies** the first extractor capable
-        of handling the document.  Text extraction will be added in subsequent
-        milestones.
+        Extractors are tried in preference order; the first one that accepts
+        the document and succeeds wins, failures fall through to the next.
+
+        For previews and triage the work can be bounded:
+
+        * *pages* – 0-based page numbers (e.g. ``range(3)``) of PDFs and
+          multi-frame images; only those pages are parsed, rendered or OCR'd.
+          Unpaginated documents count as page 0.
+        * *max_chars* – stop once this many characters are extracted; text
+          files are decoded only that far.
+        * *deadline* – seconds.  When it passes, pending OCR tasks are
+          cancelled and whatever finished so far is returned.
+
+        Results cut short by *max_chars* or *deadline* have
+        :attr:`ExtractionResult.partial` set.  Pages are joined with ``\f``;
+        bounded results are never written to the cache.
+
+        With *trace* the per-stage timings (normalise, probe, every attempted
+        extractor, OCR render/recognition) are attached as
+        :attr:`ExtractionResult.spans`; see :mod:`extracttext.instrumentation`.
+        """
+        return self._load(source, filename, pages=pages, max_chars=max_chars, deadline=deadline, trace=trace)
+
+    async def aload(
+        self,
+        source: SourceType,
+        filename: str | None = None,
+        *,
+        pages: Optional[Iterable[int]] = None,
+        max_chars: Optional[int] = None,
+        deadline: Optional[float] = None,
+        trace: bool = False,
+    ) -> ExtractionResult:  # noqa: D401
+        """Asynchronous :meth:`load` that never blocks the event loop.
+
+        Orchestration (temp files, probing, waiting on results) runs on the
+        shared I/O thread pool while the CPU-bound extraction itself is
+        executed on the process pool – whole documents for cheap types and
+        per-page tasks for OCR'd PDFs.  Accepts the same bounds and *trace*
+        flag as :meth:`load`.
+        """
+        import asyncio
+        import functools
+
+        from .concurrency import get_thread_executor
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(
+            self._load,
+            source,
+            filename,
+            offload=True,
+            pages=pages,
+            max_chars=max_chars,
+            deadline=deadline,
+            trace=trace,
+        )
+        return await loop.run_in_executor(get_thread_executor(), call)
+
+    def _load(
+        self,
+        source: SourceType,
+        filename: str | None = None,
+        *,
+        trace: bool = False,
+        **kwargs: _t.Any,
+    ) -> ExtractionResult:
+        """Shared implementation of :meth:`load` / :meth:`aload`.
+
+        Runs :meth:`_load_document` inside a :class:`Trace` when *trace* is set
+        or span hooks are registered; the whole call becomes the final
+        ``load`` span.
         """
-        # 1. Normalise various input shapes into an on-disk file reference
-        path, final_name, cleanup = self._normalise_source(source, filename)
+        if not (trace or tracing_enabled(self.hooks)):
+            return self._load_document(source, filename, **kwargs)
+
+        recorder = Trace(self.hooks)
+        with recorder.activate(), recorder.span("load") as attrs:
+            result = self._load_document(source, filename, **kwargs)
+            attrs["document_type"] = result.document_type.value
+            attrs["partial"] = result.partial
+        if trace:
+            result.spans = recorder.spans
+        return result
+
+    def _load_document(
+        self,
+        source: SourceType,
+        filename: str | None = None,
+        *,
+        offload: bool = False,
+        pages: Optional[Iterable[int]] = None,
+        max_chars: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> ExtractionResult:
+        """Extract one document, whole or bounded.
+
+        With *offload* every non page-parallel ``extract_text`` call, and the
+        text-layer pass of hybrid PDFs, is submitted to the process pool
+        instead of running in this thread.
+        """
+        if pages is not None or max_chars is not None or deadline is not None:
+            return self._load_bounded(
+                source, filename, offload=offload, pages=pages, max_chars=max_chars, deadline=deadline
+            )
+
+        # 1. Normalise various input shapes into an on-disk file reference,
+        #    or keep them as an in-memory buffer when *in_memory* is enabled
+        with span("normalise", in_memory=self.in_memory):
+            doc, final_name, cleanup = self._open_source(source, filename)
+        suffix = doc.suffix if isinstance(doc, Path) else Path(final_name).suffix
 
         try:
             last_error: Exception | None = None
 
-            # 2. Iterate through extractors in preference order
-            for extractor in self._iter_extractors():
+            # 2. Identical content + settings seen before → skip extraction
+            cache_key = self._cache_key(doc, suffix) if self.cache is not None else None
+            if cache_key is not None:
+                with span("cache") as attrs:
+                    cached = self.cache.get(cache_key)  # type: ignore[union-attr]
+                    attrs["hit"] = cached is not None
+                if cached is not None:
+                    return ExtractionResult(
+                        document_id=str(uuid.uuid4()),
+                        document_name=final_name,
+                        document_type=cached.document_type,
+                        text_payload=cached.text_payload,
+                    )
+
+            # 3. Gather document facts once; every extractor reuses the probe
+            with span("probe") as attrs:
+                probe = probe_document(doc, name=final_name)
+                attrs["kind"] = probe.kind
+
+            # 4. Iterate through candidate extractors in preference order
+            for extractor in self._candidates(probe):
                 try:
-                    if not extractor.can_process(path):
+                    if not extractor.can_process(doc, probe):
                         continue
                 except Exception:
                     # Heuristic should be cheap & fail-safe – skip extractor on error
@@ -156,18 +496,38 @@ class DataLoader:
 
                 # Attempt heavy extraction; allow extractor to raise
                 try:
-                    # OCR heavy tasks can benefit from process pool
-                    if self._executor and extractor.DOCUMENT_TYPE in {DocumentType.IMAGE, DocumentType.PDF_IMAGE}:
-                        text_future = self._executor.submit(extractor.extract_text, path)
-                        text_payload = text_future.result()
-                    else:
-                        text_payload = extractor.extract_text(path)
+                    doc_type = extractor.DOCUMENT_TYPE
+                    with span("extract", extractor=type(extractor).__name__, document_type=doc_type.value):
+                        if doc_type in _PAGE_PARALLEL_TYPES:
+                            # Extractor fans pages out itself (shared pool by default);
+                            # running it *inside* a pool worker would nest pools.
+                            # Hybrid PDFs learn their type from the pages they OCR.
+                            doc_type, text_payload = extractor.extract_typed(
+                                doc, **self._page_parallel_options(extractor, offload)
+                            )
+                        elif extractor.DOCUMENT_TYPE == DocumentType.IMAGE and (offload or self._executor):
+                            # Frames of multi-page images fan out across the pool;
+                            # a single frame runs there as one task.
+                            from .concurrency import resolve_executor
+
+                            text_payload = extractor.extract_text(doc, executor=resolve_executor(self._executor))  # type: ignore[call-arg]
+                        elif offload:
+                            # Keep the calling thread free of CPU-bound work
+                            from .concurrency import resolve_executor
+
+                            text_future = resolve_executor(self._executor).submit(profiled(extractor.extract_text), doc)
+                            text_payload = text_future.result()
+                        else:
+                            text_payload = extractor.extract_text(doc)
+
+                    if cache_key is not None:
+                        self.cache.set(cache_key, CachedResult(doc_type, text_payload))  # type: ignore[union-attr]
 
                     # Success – build result envelope
                     return ExtractionResult(
                         document_id=str(uuid.uuid4()),
                         document_name=final_name,
-                        document_type=extractor.DOCUMENT_TYPE,
+                        document_type=doc_type,
                         text_payload=text_payload,
                     )
                 except Exception as exc:
@@ -191,10 +551,416 @@ class DataLoader:
                 # Best-effort cleanup; swallow errors
                 pass
 
+    def _load_bounded(
+        self,
+        source: SourceType,
+        filename: str | None,
+        *,
+        offload: bool,
+        pages: Optional[Iterable[int]],
+        max_chars: Optional[int],
+        deadline: Optional[float],
+    ) -> ExtractionResult:
+        """:meth:`load` with *pages* / *max_chars* / *deadline* – built on page streaming."""
+        if max_chars is not None and max_chars < 0:
+            raise ValueError("max_chars must be >= 0")
+        expires = None if deadline is None else time.monotonic() + deadline
+        wanted = None if pages is None else sorted({n for n in pages if n >= 0})
+
+        with span("normalise", in_memory=self.in_memory):
+            doc, final_name, cleanup = self._open_source(source, filename)
+        stream = self._iter_pages(doc, final_name, offload=offload, pages=wanted, deadline=expires)
+        parts: List[str] = []
+        size = 0
+        partial = False
+        doc_type: Optional[DocumentType] = None
+        try:
+            while max_chars is None or size <= max_chars:
+                try:
+                    doc_type, _, text = next(stream)
+                except StopIteration as stop:
+                    doc_type = stop.value
+                    break
+                except DeadlineExceededError as exc:
+                    doc_type = doc_type or exc.document_type
+                    partial = True
+                    break
+                size += len(text) + (1 if parts and _is_paginated(doc_type) else 0)
+                parts.append(text)
+        finally:
+            stream.close()
+            try:
+                cleanup()
+            except Exception:
+                pass
+
+        text_payload = ("\f" if _is_paginated(doc_type) else "").join(parts)
+        if max_chars is not None and len(text_payload) > max_chars:
+            text_payload = text_payload[:max_chars]
+            partial = True
+
+        return ExtractionResult(
+            document_id=str(uuid.uuid4()),
+            document_name=final_name,
+            document_type=doc_type,  # type: ignore[arg-type]
+            text_payload=text_payload,
+            partial=partial,
+        )
+
+    def iter_text(self, source: SourceType, filename: str | None = None) -> Iterator[TextFragment]:
+        """Yield :class:`TextFragment` objects as pages of *source* complete.
+
+        PDFs stream page by page (OCR'd pages in order, as soon as they and
+        their predecessors are recognised); other types yield a single
+        fragment.  Falls back to the next extractor only while nothing has
+        been yielded yet.  Cached results are replayed, but streamed text is
+        not written to the cache – the full document is never held here.
+        """
+        return self._iter_text(source, filename)
+
+    async def aiter_text(self, source: SourceType, filename: str | None = None) -> _t.AsyncIterator[TextFragment]:
+        """Asynchronous :meth:`iter_text`; each step runs off the event loop."""
+        import asyncio
+
+        from .concurrency import get_thread_executor
+
+        loop = asyncio.get_running_loop()
+        pool = get_thread_executor()
+        fragments = self._iter_text(source, filename, offload=True)
+        done = object()
+        try:
+            while True:
+                fragment = await loop.run_in_executor(pool, next, fragments, done)
+                if fragment is done:
+                    return
+                yield fragment  # type: ignore[misc]
+        finally:
+            await loop.run_in_executor(pool, fragments.close)
+
+    def _iter_text(
+        self, source: SourceType, filename: str | None = None, *, offload: bool = False
+    ) -> Iterator[TextFragment]:
+        started = perf_counter()
+        document_id = str(uuid.uuid4())
+
+        doc, final_name, cleanup = self._open_source(source, filename)
+        try:
+            for doc_type, page, text in self._iter_pages(doc, final_name, offload=offload):
+                yield TextFragment(
+                    document_id=document_id,
+                    document_name=final_name,
+                    document_type=doc_type,
+                    page=page,
+                    text=text,
+                    elapsed_ms=round((perf_counter() - started) * 1000, 2),
+                )
+        finally:
+            try:
+                cleanup()
+            except Exception:
+                pass
+
+    def _iter_pages(
+        self,
+        doc: Union[Path, bytes],
+        final_name: str,
+        *,
+        offload: bool = False,
+        pages: Optional[List[int]] = None,
+        deadline: Optional[float] = None,
+    ) -> _t.Generator[Tuple[DocumentType, int, str], None, DocumentType]:
+        """Yield ``(document_type, page, text)`` for an opened document.
+
+        *pages* is a sorted list of 0-based page numbers (unpaginated documents
+        are page 0); *deadline* a :func:`time.monotonic` timestamp after which
+        :class:`DeadlineExceededError` is raised.  Returns the document type of
+        the extractor that finished, so callers learn it even when no page was
+        selected.
+        """
+        suffix = doc.suffix if isinstance(doc, Path) else Path(final_name).suffix
+        selected = None if pages is None else set(pages)
+
+        if self.cache is not None:
+            with span("cache") as attrs:
+                cached = self.cache.get(self._cache_key(doc, suffix))
+                attrs["hit"] = cached is not None
+            if cached is not None:
+                for n, text in enumerate(_split_pages(cached)):
+                    if selected is None or n in selected:
+                        yield cached.document_type, n + 1, text
+                return cached.document_type
+
+        with span("probe") as attrs:
+            probe = probe_document(doc, name=final_name)
+            attrs["kind"] = probe.kind
+        last_error: Exception | None = None
+
+        for extractor in self._candidates(probe):
+            try:
+                if not extractor.can_process(doc, probe):
+                    continue
+            except Exception:
+                continue
+
+            doc_type = extractor.DOCUMENT_TYPE
+            options: dict = {}
+            numbers: Iterator[int] = itertools.count()
+            if pages is not None and extractor.PAGINATED:
+                options["page_numbers"] = pages
+                numbers = iter(pages)
+            elif pages is not None and 0 not in selected:  # type: ignore[operator]
+                return doc_type  # unpaginated document = page 0 only
+
+            page = 0
+            try:
+                with span("extract", extractor=type(extractor).__name__, document_type=doc_type.value):
+                    _check_deadline(deadline, doc_type)
+                    if doc_type in _PAGE_PARALLEL_TYPES:
+                        stream = extractor.iter_typed_pages(
+                            doc, deadline=deadline, **self._page_parallel_options(extractor, offload), **options
+                        )
+                    elif doc_type == DocumentType.IMAGE and (offload or self._executor):
+                        from .concurrency import resolve_executor
+
+                        stream = extractor.iter_typed_pages(
+                            doc, executor=resolve_executor(self._executor), deadline=deadline, **options
+                        )
+                    elif offload:
+                        from .concurrency import resolve_executor
+
+                        # Pages come back together but are still yielded one by one
+                        selection = pages if options else None
+                        future = resolve_executor(self._executor).submit(
+                            profiled(_pages_in_worker), extractor, doc, selection
+                        )
+                        stream = ((doc_type, text) for text in _await_future(future, deadline, doc_type))
+                    else:
+                        stream = extractor.iter_typed_pages(doc, **options)
+
+                    for doc_type, text in stream:
+                        page = next(numbers) + 1
+                        yield doc_type, page, text
+                        _check_deadline(deadline, doc_type)
+                return doc_type
+            except DeadlineExceededError as exc:
+                # Never fall back – the time budget is spent
+                raise DeadlineExceededError(str(exc), doc_type) from None
+            except Exception as exc:
+                if page:
+                    # Fragments already went out – switching extractor now
+                    # would mix two different renderings of the document
+                    raise ExtractionFailedError(f"Extraction failed after page {page}") from exc
+                last_error = exc
+                continue
+
+        if last_error is None:
+            raise UnsupportedDocumentError("No extractor recognised this document")
+        raise ExtractionFailedError("All extractors failed to extract text") from last_error
+
+    def load_many(
+        self,
+        sources: Iterable[BatchSourceType],
+        *,
+        ordered: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[BatchResult]:
+        """Extract many documents in parallel, yielding :class:`BatchResult` items.
+
+        Everything runs on one process pool (the loader's executor or the
+        shared default pool), so all cores stay busy regardless of the mix:
+        text, CSV and DOCX documents are one task each, while PDFs and images
+        are orchestrated from a thread of this process so their pages fan out
+        across the pool as with :meth:`aload`.
+
+        *sources* is consumed lazily, so a generator over millions of paths is
+        never materialised.  Items may be ``(source, filename)`` tuples.
+
+        *max_workers* caps concurrently processed documents: no more than that
+        many are ever in flight at once (the pages of one PDF count as one
+        document, bounded by ``OCR_MAX_INFLIGHT``).  Without it, up to twice
+        the pool size are in flight so the pool never idles between results.
+
+        ``ordered=False`` yields results as they finish; ``ordered=True`` yields
+        them in input order.  Failures are reported per item via
+        :attr:`BatchResult.error`.
+        """
+        from collections import deque
+        from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+        from .concurrency import get_thread_executor, resolve_executor, worker_count
+
+        pool = resolve_executor(self._executor)
+        window = max(1, max_workers) if max_workers else 2 * worker_count()
+        options = {"prefer_ocr": self.prefer_ocr, "hybrid_pdf": self.hybrid_pdf, "in_memory": self.in_memory}
+        paged = DataLoader(executor=pool, **options)  # no cache – results are stored below
+
+        def _dispatch(payload: Union[str, bytes], name: str) -> Future:
+            if _batch_kind(payload, name) in (KIND_PDF, KIND_IMAGE):
+                # Pages fan out across the pool from here; inside a worker
+                # they would be OCR'd one after another on a single core
+                return get_thread_executor().submit(paged._load_document, payload, name or None, offload=True)
+            return pool.submit(_load_in_worker, payload, name or None, options)
+
+        items = enumerate(sources)
+        pending: dict = {}  # future -> (index, name, cache_key)
+        order: deque = deque()  # futures in submission order (ordered mode)
+
+        def _submit_next() -> bool:
+            try:
+                index, item = next(items)
+            except StopIteration:
+                return False
+
+            source, filename = item if isinstance(item, tuple) else (item, None)
+            name = filename
+            cache_key = None
+            try:
+                payload, name = self._batch_payload(source, filename)
+                if self.cache is not None:
+                    suffix = Path(name).suffix if name else ""
+                    cache_key = self._cache_key(Path(payload) if isinstance(payload, str) else payload, suffix)
+                    cached = self.cache.get(cache_key)
+                    if cached is not None:
+                        fut: Future = Future()
+                        fut.set_result(
+                            ExtractionResult(str(uuid.uuid4()), name or "", cached.document_type, cached.text_payload)
+                        )
+                        cache_key = None  # nothing to store
+                    else:
+                        fut = _dispatch(payload, name)
+                else:
+                    fut = _dispatch(payload, name)
+            except Exception as exc:  # unreadable input – report, keep going
+                fut = Future()
+                fut.set_exception(exc)
+
+            pending[fut] = (index, name, cache_key)
+            if ordered:
+                order.append(fut)
+            return True
+
+        def _outcome(fut: Future) -> BatchResult:
+            index, name, cache_key = pending.pop(fut)
+            exc = fut.exception()
+            if exc is not None:
+                return BatchResult(index=index, document_name=name, error=exc)
+            result = fut.result()
+            if cache_key is not None:
+                self.cache.set(cache_key, CachedResult(result.document_type, result.text_payload))  # type: ignore[union-attr]
+            return BatchResult(index=index, document_name=result.document_name, result=result)
+
+        try:
+            while len(pending) < window and _submit_next():
+                pass
+
+            while pending:
+                if ordered:
+                    done = [order.popleft()]
+                    wait(done)
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for fut in done:
+                    yield _outcome(fut)
+                    _submit_next()
+        finally:
+            # Consumer stopped early – don't leave queued documents behind
+            for fut in pending:
+                fut.cancel()
+
+    def _page_parallel_options(self, extractor: BaseExtractor, offload: bool) -> dict:
+        """Keyword arguments for a page-parallel extractor.
+
+        With *offload* the hybrid extractor's text-layer pass (pure-Python
+        pdfminer work) goes to the pool as well, like a PDF_TEXT extraction.
+        """
+        options: dict = {"executor": self._executor}
+        if offload and extractor.DOCUMENT_TYPE == DocumentType.PDF_MIXED:
+            from .concurrency import resolve_executor
+
+            options["text_executor"] = resolve_executor(self._executor)
+        return options
+
+    @staticmethod
+    def _batch_payload(source: SourceType, filename: Optional[str]) -> Tuple[Union[str, bytes], str]:
+        """Return a picklable payload (path string or bytes) and display name."""
+        if isinstance(source, (str, Path)):
+            path = Path(source).expanduser().resolve()
+            if not path.exists():
+                raise FileNotFoundError(path)
+            return str(path), (filename or path.name)
+        if isinstance(source, (bytes, bytearray)):
+            return bytes(source), (filename or "")
+        if hasattr(source, "read"):
+            name = filename or Path(str(getattr(source, "name", "") or "")).name
+            return source.read(), name  # type: ignore[union-attr]
+        raise TypeError("Unsupported *source* type; expected path, bytes, or BinaryIO")
+
 
 # Convenience functional API -------------------------------------------------
 
-def load(source: SourceType, filename: str | None = None, *, prefer_ocr: bool = False, executor: Optional["Executor"] = None) -> ExtractionResult:  # noqa: D401
+def load(
+    source: SourceType,
+    filename: str | None = None,
+    *,
+    prefer_ocr: bool = False,
+    executor: Optional["Executor"] = None,
+    hybrid_pdf: bool = False,
+    cache: Optional[ResultCache] = None,
+    in_memory: bool = False,
+    pages: Optional[Iterable[int]] = None,
+    max_chars: Optional[int] = None,
+    deadline: Optional[float] = None,
+    trace: bool = False,
+) -> ExtractionResult:  # noqa: D401
     """Module-level helper mirroring :pymeth:`DataLoader.load`."""
 
-    return DataLoader(prefer_ocr=prefer_ocr, executor=executor).load(source, filename=filename) 
\ No newline at end of file
+    loader = DataLoader(
+        prefer_ocr=prefer_ocr, executor=executor, hybrid_pdf=hybrid_pdf, cache=cache, in_memory=in_memory
+    )
+    return loader.load(
+        source, filename=filename, pages=pages, max_chars=max_chars, deadline=deadline, trace=trace
+    )
+
+
+async def aload(
+    source: SourceType,
+    filename: str | None = None,
+    *,
+    prefer_ocr: bool = False,
+    executor: Optional["Executor"] = None,
+    hybrid_pdf: bool = False,
+    cache: Optional[ResultCache] = None,
+    in_memory: bool = False,
+    pages: Optional[Iterable[int]] = None,
+    max_chars: Optional[int] = None,
+    deadline: Optional[float] = None,
+    trace: bool = False,
+) -> ExtractionResult:  # noqa: D401
+    """Module-level helper mirroring :pymeth:`DataLoader.aload`."""
+
+    loader = DataLoader(
+        prefer_ocr=prefer_ocr, executor=executor, hybrid_pdf=hybrid_pdf, cache=cache, in_memory=in_memory
+    )
+    return await loader.aload(
+        source, filename=filename, pages=pages, max_chars=max_chars, deadline=deadline, trace=trace
+    )
+
+
+def load_many(
+    sources: Iterable[BatchSourceType],
+    *,
+    ordered: bool = False,
+    max_workers: Optional[int] = None,
+    prefer_ocr: bool = False,
+    executor: Optional["Executor"] = None,
+    hybrid_pdf: bool = False,
+    cache: Optional[ResultCache] = None,
+    in_memory: bool = False,
+) -> Iterator[BatchResult]:  # noqa: D401
+    """Module-level helper mirroring :pymeth:`DataLoader.load_many`."""
+
+    loader = DataLoader(
+        prefer_ocr=prefer_ocr, executor=executor, hybrid_pdf=hybrid_pdf, cache=cache, in_memory=in_memory
+    )
+    return loader.load_many(sources, ordered=ordered, max_workers=max_workers) 
\ No newline at end of file
@@ -4,50 +4,131 @@ This subpackage offers small, self-contained helpers that *individual* extractor
 can use to make cheap decisions without incurring heavy I/O.
 
 Public API (v1):
-    • detect_mime_type(path) -> str  – Prefer python-magic; fallback to mimetypes.
-    • peek_pdf_has_text(path) -> bool – Inspect first page with pdfminer.six.
+    • detect_mime_type(path | bytes) -> str  – Prefer python-magic; fallback to mimetypes.
+    • peek_pdf_has_text(path) -> bool – Inspect first page (poppler or pdfminer.six).
+    • probe_document(path | bytes) -> DocumentProbe – One-shot facts shared by extractors.
+    • sniff_kind(fp) -> str | None – Content kind from magic bytes (``KIND_*``).
 """
 from __future__ import annotations
 
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Union
+from typing import Any, BinaryIO, Optional, Union
+import codecs
 import mimetypes
+import zipfile
 
 # ----------------------------------------------------------------------------
-# Optional dependency – python-magic
+# Optional dependency – python-magic, loaded on first use: importing it and
+# opening the libmagic database is a noticeable share of start-up time
 # ----------------------------------------------------------------------------
-try:
-    import magic  # type: ignore
+_MAGIC_MIME: Any = None
+_HAS_MAGIC: Optional[bool] = None  # ``None`` until the first lookup
 
-    _HAS_MAGIC = True
-    _MAGIC_MIME = magic.Magic(mime=True)
-except Exception:  # pragma: no cover – treat *any* failure as unavailable
-    _HAS_MAGIC = False
-    _MAGIC_MIME = None  # type: ignore
+
+def _magic_mime() -> Any:
+    """Return the shared MIME-mode ``magic.Magic``, or ``None`` when unavailable."""
+    global _HAS_MAGIC, _MAGIC_MIME
+
+    if _HAS_MAGIC is None:
+        try:
+            import magic  # type: ignore
+
+            _MAGIC_MIME = magic.Magic(mime=True)
+            _HAS_MAGIC = True
+        except Exception:  # pragma: no cover – treat *any* failure as unavailable
+            _HAS_MAGIC = False
+    return _MAGIC_MIME
+
+
+#: libmagic only needs the header; cap what we hand to ``from_buffer``
+_MAGIC_BUFFER_BYTES = 1 << 20
 
 __all__ = [
+    "DocumentProbe",
     "detect_mime_type",
     "peek_pdf_has_text",
+    "probe_document",
+    "sniff_kind",
+    "KIND_PDF",
+    "KIND_DOCX",
+    "KIND_IMAGE",
+    "KIND_TEXT",
+    "KIND_CSV",
 ]
 
+# ---------------------------------------------------------------------------
+# Content kinds – what the bytes *are*, independent of the file name
+# ---------------------------------------------------------------------------
+KIND_PDF = "pdf"
+KIND_DOCX = "docx"
+KIND_IMAGE = "image"
+KIND_TEXT = "text"
+KIND_CSV = "csv"
+
+#: Bytes read from the start of a document for signature checks
+_HEADER_BYTES = 8192
+
+#: PDF readers accept junk before the header within the first KiB; only
+#: honoured for ``.pdf`` files or binary junk (text merely *mentioning* the
+#: signature, such as a log line, stays text)
+_PDF_SIGNATURE_WINDOW = 1024
+
+#: Image signature → MIME type reported without asking libmagic
+_IMAGE_SIGNATURES = {
+    b"\x89PNG\r\n\x1a\n": "image/png",
+    b"\xff\xd8\xff": "image/jpeg",
+    b"II*\x00": "image/tiff",  # little-endian
+    b"MM\x00*": "image/tiff",  # big-endian
+    b"GIF87a": "image/gif",
+    b"GIF89a": "image/gif",
+}
+
+_PDF_MIME = "application/pdf"
+_DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+#: Text suffixes never re-routed to CSV by libmagic's ``text/csv`` guess
+_CSV_SUFFIXES = ("", ".csv")
+
+# UTF-32 first: its little-endian BOM starts with the UTF-16 one
+_TEXT_BOMS = (
+    codecs.BOM_UTF32_LE,
+    codecs.BOM_UTF32_BE,
+    codecs.BOM_UTF8,
+    codecs.BOM_UTF16_LE,
+    codecs.BOM_UTF16_BE,
+)
+
 
 # ---------------------------------------------------------------------------
 # Public helpers
 # ---------------------------------------------------------------------------
 
-def detect_mime_type(source: Union[str, Path]) -> str:  # noqa: D401
+def detect_mime_type(source: Union[str, Path, bytes, memoryview]) -> str:  # noqa: D401
     """Return best-effort MIME type for *source*.
 
+    *source* may be a path or an in-memory buffer; buffers are inspected with
+    libmagic's ``from_buffer`` (header only) and never touch the filesystem.
+
     Order of preference:
     1. `python-magic` (libmagic) – if installed & functional.
-    2. `mimetypes.guess_type` based on file extension.
+    2. `mimetypes.guess_type` based on file extension (paths only).
     3. Fallback to ``application/octet-stream``.
     """
+    magic_mime = _magic_mime()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        if magic_mime is not None:
+            try:
+                return magic_mime.from_buffer(bytes(source[:_MAGIC_BUFFER_BYTES]))
+            except Exception:
+                pass
+        return "application/octet-stream"
+
     path = Path(source)
 
-    if _HAS_MAGIC:
+    if magic_mime is not None:
         try:
-            return _MAGIC_MIME.from_file(str(path))  # type: ignore[union-attr]
+            return magic_mime.from_file(str(path))
         except Exception:
             # Gracefully degrade to extension-based detection
             pass
@@ -56,8 +137,260 @@ def detect_mime_type(source: Union[str, Path]) -> str:  # noqa: D401
     return guessed or "application/octet-stream"
 
 
-# pdfminer is an existing dependency (see requirements.txt)
-import pdfminer.high_level  # type: ignore
+def sniff_kind(fp: BinaryIO, suffix: str = "") -> Optional[str]:  # noqa: D401
+    """Return the content kind of the seekable stream *fp* (a ``KIND_*`` value).
+
+    Reads the header once and checks well-known signatures – ``%PDF-``,
+    PNG / JPEG / TIFF / GIF magic, a ZIP container holding
+    ``word/document.xml`` and Unicode BOMs.  BOM-less text is recognised via
+    libmagic when available; *suffix* only splits text into ``KIND_TEXT`` vs
+    ``KIND_CSV`` (libmagic's ``text/csv`` counts for ``.csv`` files and
+    nameless buffers only).  Returns ``None`` when the content is not
+    recognised, in which case callers fall back to extension-based routing.
+    *fp* is rewound before returning.
+    """
+    return _sniff(fp, suffix)[0]
+
+
+def _looks_binary(data: bytes) -> bool:
+    """Whether *data* contains control bytes that never occur in text."""
+    return any(byte < 0x09 or 0x0E <= byte < 0x20 for byte in data)
+
+
+def _pdf_signature_at(header: bytes, suffix: str) -> bool:
+    offset = header.find(b"%PDF-", 0, _PDF_SIGNATURE_WINDOW)
+    if offset < 0:
+        return False
+    return offset == 0 or suffix.lower() == ".pdf" or _looks_binary(header[:offset])
+
+
+def _sniff(fp: BinaryIO, suffix: str = "") -> tuple[Optional[str], Optional[str]]:
+    """Return ``(kind, mime_type)`` of *fp* – see :func:`sniff_kind`.
+
+    The MIME type comes from the matched signature or, for everything else,
+    from the single libmagic lookup on the header.
+    """
+    try:
+        header = fp.read(_HEADER_BYTES)
+        if not header:
+            return None, None
+
+        if _pdf_signature_at(header, suffix):
+            return KIND_PDF, _PDF_MIME
+        for signature, image_mime in _IMAGE_SIGNATURES.items():
+            if header.startswith(signature):
+                return KIND_IMAGE, image_mime
+        if header.startswith(b"PK\x03\x04"):
+            # Only the central directory is read, not the members
+            fp.seek(0)
+            try:
+                with zipfile.ZipFile(fp) as zf:
+                    names = set(zf.namelist())
+            except zipfile.BadZipFile:
+                return None, "application/zip"
+            if "word/document.xml" in names:
+                return KIND_DOCX, _DOCX_MIME
+            return None, "application/zip"
+
+        if header.startswith(_TEXT_BOMS):
+            mime = "text/plain"
+        else:
+            mime = detect_mime_type(header)
+            if mime == _PDF_MIME and not _looks_binary(header):
+                # libmagic also finds "%PDF-" past offset 0; the check above said no
+                mime = "text/plain"
+
+        suffix = suffix.lower()
+        if (mime == "text/csv" and suffix in _CSV_SUFFIXES) or (mime == "text/plain" and suffix == ".csv"):
+            return KIND_CSV, mime
+        if mime in ("text/plain", "text/csv"):
+            return KIND_TEXT, mime
+        return None, mime
+    finally:
+        fp.seek(0)
+
+
+# ---------------------------------------------------------------------------
+# Document probe – poppler when the PDF text engine uses it, else pdfminer
+# (an existing dependency, see requirements.txt)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class DocumentProbe:
+    """Facts about a document gathered in a *single* pass.
+
+    :class:`extracttext.dataloader.DataLoader` builds one probe per
+    :meth:`~extracttext.dataloader.DataLoader.load` call and hands it to every
+    extractor's ``can_process`` so that expensive checks (e.g. parsing a PDF)
+    run once instead of once per candidate extractor.
+
+    *path* is ``None`` for in-memory documents; *name* / *suffix* then come
+    from the caller-supplied filename.  *kind* is the sniffed content kind
+    (``None`` when unrecognised).  PDF-specific fields are ``None`` for
+    non-PDF documents.
+    """
+
+    path: Optional[Path]
+    suffix: str
+    name: str = ""
+    mime_type: Optional[str] = None
+    is_pdf: bool = False
+    page_count: Optional[int] = None
+    has_text_layer: Optional[bool] = None
+    is_encrypted: bool = False
+    producer: Optional[str] = None
+    kind: Optional[str] = None
+
+
+def _decode_pdf_string(value: object) -> Optional[str]:
+    """Best-effort conversion of a PDF info-dictionary value to ``str``."""
+    from pdfminer.pdftypes import resolve1  # type: ignore
+
+    value = resolve1(value)
+    if isinstance(value, bytes):
+        if value.startswith((b"\xfe\xff", b"\xff\xfe")):
+            return value.decode("utf-16", errors="replace")
+        return value.decode("latin-1")
+    if value is None:
+        return None
+    return str(value)
+
+
+def _probe_pdf(fp: BinaryIO, base: DocumentProbe) -> DocumentProbe:
+    """Parse *fp* once and record page count, text layer, encryption, producer."""
+    from io import StringIO
+
+    from pdfminer.converter import TextConverter  # type: ignore
+    from pdfminer.layout import LAParams  # type: ignore
+    from pdfminer.pdfdocument import PDFDocument, PDFPasswordIncorrect  # type: ignore
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager  # type: ignore
+    from pdfminer.pdfpage import PDFPage  # type: ignore
+    from pdfminer.pdfparser import PDFParser  # type: ignore
+    from pdfminer.pdftypes import resolve1  # type: ignore
+
+    try:
+        parser = PDFParser(fp)
+        try:
+            doc = PDFDocument(parser)
+        except PDFPasswordIncorrect:
+            # Owner/user password required – nothing more can be learned
+            return replace(base, is_pdf=True, has_text_layer=False, is_encrypted=True)
+
+        producer = None
+        for info in doc.info:
+            if "Producer" in info:
+                producer = _decode_pdf_string(info["Producer"])
+                break
+
+        page_count: Optional[int]
+        try:
+            page_count = int(resolve1(doc.catalog["Pages"])["Count"])
+        except Exception:
+            page_count = None
+
+        # Layout pass over the first page only – mirrors peek semantics
+        has_text = False
+        first_page = next(iter(PDFPage.create_pages(doc)), None)
+        if first_page is not None:
+            rsrcmgr = PDFResourceManager()
+            out = StringIO()
+            device = TextConverter(rsrcmgr, out, laparams=LAParams())
+            try:
+                PDFPageInterpreter(rsrcmgr, device).process_page(first_page)
+            finally:
+                device.close()
+            has_text = bool(out.getvalue().strip())
+
+        return replace(
+            base,
+            is_pdf=True,
+            page_count=page_count,
+            has_text_layer=has_text,
+            is_encrypted=doc.encryption is not None,
+            producer=producer,
+        )
+    except Exception:
+        # Malformed PDFs are treated as *no text layer*
+        return replace(base, is_pdf=True, has_text_layer=False)
+
+
+def _probe_pdf_poppler(source: Union[Path, bytes, memoryview], base: DocumentProbe) -> DocumentProbe:
+    """Same facts as :func:`_probe_pdf` from ``pdfinfo`` and first-page ``pdftotext``."""
+    from .. import poppler
+
+    info = poppler.pdfinfo(source)
+    first_page = poppler.pdftotext(source, first_page=1, last_page=1, mode="raw")
+    return replace(
+        base,
+        is_pdf=True,
+        page_count=int(info["Pages"]) if "Pages" in info else None,
+        has_text_layer=bool(first_page.strip()),
+        is_encrypted=info.get("Encrypted", "no").startswith("yes"),
+        producer=info.get("Producer") or None,
+    )
+
+
+def _probe_pdf_any(fp: BinaryIO, source: Union[Path, bytes, memoryview], base: DocumentProbe) -> DocumentProbe:
+    """Probe with poppler when it extracts the text too, falling back to pdfminer."""
+    from .. import poppler
+
+    try:
+        if poppler.resolve_pdf_text_engine() == "pdftotext":
+            return _probe_pdf_poppler(source, base)
+    except Exception:
+        pass  # e.g. a password-protected PDF – pdfminer reports it properly
+    return _probe_pdf(fp, base)
+
+
+def probe_document(
+    source: Union[str, Path, bytes, memoryview], name: Optional[str] = None
+) -> DocumentProbe:  # noqa: D401
+    """Return a :class:`DocumentProbe` for *source*.
+
+    *source* is a path or an in-memory buffer; for buffers pass the original
+    filename as *name* (used as the extension fallback).
+
+    The content kind is sniffed from the header (see :func:`sniff_kind`), so
+    misnamed files are still recognised; the same sniff yields *mime_type*
+    (the matched signature's type, else one libmagic lookup on the header).
+
+    PDFs – by signature, or by extension when the content is unrecognised –
+    are inspected once: ``pdfinfo`` plus ``pdftotext`` on the first page when
+    the PDF text engine resolves to pdftotext, otherwise one pdfminer parse
+    with a layout pass over the first page.  Either decides whether a text
+    layer is present.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        from io import BytesIO
+
+        name = name or ""
+        fp: BinaryIO = BytesIO(source)
+        suffix = Path(name).suffix.lower()
+        kind, mime_type = _sniff(fp, suffix)
+        base = DocumentProbe(path=None, suffix=suffix, name=name, mime_type=mime_type, kind=kind)
+        if not _looks_like_pdf(base):
+            return base
+        return _probe_pdf_any(fp, source, base)
+
+    path = Path(source)
+    base = DocumentProbe(path=path, suffix=path.suffix.lower(), name=name or path.name)
+    try:
+        fp = open(path, "rb")
+    except OSError:
+        # Unreadable – leave it to the extractors to report a proper error
+        return base
+
+    with fp:
+        kind, mime_type = _sniff(fp, base.suffix)
+        base = replace(base, kind=kind, mime_type=mime_type)
+        if not _looks_like_pdf(base):
+            return base
+        return _probe_pdf_any(fp, path, base)
+
+
+def _looks_like_pdf(probe: DocumentProbe) -> bool:
+    # The signature wins; the extension only counts for unrecognised content
+    return probe.kind == KIND_PDF or (probe.kind is None and probe.suffix == ".pdf")
 
 
 def peek_pdf_has_text(source: Union[str, Path]) -> bool:  # noqa: D401
@@ -67,15 +400,4 @@ def peek_pdf_has_text(source: Union[str, Path]) -> bool:  # noqa: D401
     The check is intentionally *shallow* to remain fast – it never parses more
     than one page.
     """
-    path = Path(source)
-
-    # Quick escape hatch – non-PDF extensions almost certainly lack PDF data
-    if path.suffix.lower() != ".pdf":
-        return False
-
-    try:
-        text = pdfminer.high_level.extract_text(str(path), maxpages=1)
-        return bool(text and text.strip())
-    except Exception:
-        # Malformed or encrypted PDFs are treated as *no text layer*
-        return False 
\ No newline at end of file
+    return bool(probe_document(source).has_text_layer)
@@ -0,0 +1,153 @@
+"""Encoding detection and incremental decoding for text-like documents.
+
+Detection never looks at more than a bounded sample:
+
+    1. Unicode BOM → the matching BOM-aware codec.
+    2. Strict UTF-8 over the sample (the overwhelmingly common case).
+    3. `chardet` over the sample only.
+
+Decoding then runs a codec incremental decoder over fixed-size chunks of an
+``mmap`` (files) or ``memoryview`` (buffers), so multi-GB logs are processed
+with constant memory.  If a later chunk turns out not to match the detected
+encoding, detection is re-run on that chunk and decoding continues with
+replacement characters rather than failing half-way.
+
+Environment overrides:
+    • ``EXTRACTTEXT_TEXT_SAMPLE_BYTES`` – detection sample size (default 64 KiB).
+    • ``EXTRACTTEXT_TEXT_CHUNK_BYTES``  – decode chunk size (default 1 MiB).
+"""
+from __future__ import annotations
+
+import codecs
+import mmap
+import os
+import typing as _t
+from contextlib import contextmanager
+from pathlib import Path
+
+__all__ = [
+    "detect_encoding",
+    "iter_decoded",
+    "iter_line_chunks",
+]
+
+DEFAULT_SAMPLE_BYTES = 64 * 1024
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+# UTF-32 first: its little-endian BOM starts with the UTF-16 one
+_BOM_CODECS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def detect_encoding(sample: _t.Union[bytes, memoryview], *, complete: bool = False) -> str:  # noqa: D401
+    """Return the codec name to decode a document starting with *sample*.
+
+    Set *complete* when *sample* is the whole document, so a multi-byte
+    sequence cut off at the end of the sample counts as invalid UTF-8.
+    """
+    head = bytes(sample[:4])
+    for bom, encoding in _BOM_CODECS:
+        if head.startswith(bom):
+            return encoding
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=complete)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    return _chardet_encoding(sample)
+
+
+def _chardet_encoding(sample: _t.Union[bytes, memoryview]) -> str:
+    import chardet  # type: ignore
+
+    detected = chardet.detect(bytes(sample))
+    encoding = (detected.get("encoding") or "utf-8").strip()
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return "utf-8"
+    return encoding
+
+
+@contextmanager
+def _buffer(
+    source: _t.Union[str, Path, bytes, bytearray, memoryview],
+) -> _t.Iterator[_t.Union[memoryview, mmap.mmap, bytes]]:
+    """Yield a sliceable view over *source* without copying it into memory."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield memoryview(source)
+        return
+
+    with open(source, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            yield b""  # mmap refuses empty files
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def iter_decoded(
+    source: _t.Union[str, Path, bytes, bytearray, memoryview],
+    chunk_size: _t.Optional[int] = None,
+) -> _t.Iterator[str]:
+    """Yield the decoded text of *source* in order, one chunk at a time.
+
+    *source* is a path (mapped with ``mmap``) or an in-memory buffer.  Chunks
+    hold at most *chunk_size* bytes of input (``EXTRACTTEXT_TEXT_CHUNK_BYTES``
+    by default); empty chunks are skipped.
+    """
+    sample_size = int(os.getenv("EXTRACTTEXT_TEXT_SAMPLE_BYTES", str(DEFAULT_SAMPLE_BYTES)))
+    chunk_size = chunk_size or int(os.getenv("EXTRACTTEXT_TEXT_CHUNK_BYTES", str(DEFAULT_CHUNK_BYTES)))
+
+    with _buffer(source) as buf:
+        size = len(buf)
+        if not size:
+            return
+
+        encoding = detect_encoding(buf[:sample_size], complete=size <= sample_size)
+        decoder = codecs.getincrementaldecoder(encoding)("strict")
+        # Decoded pages of a mapping are dropped from the resident set as we go
+        can_release = isinstance(buf, mmap.mmap) and hasattr(mmap, "MADV_DONTNEED")
+        released = 0
+
+        for offset in range(0, size, chunk_size):
+            data = buf[offset : offset + chunk_size]
+            final = offset + chunk_size >= size
+            pending = decoder.getstate()[0]
+            try:
+                text = decoder.decode(data, final=final)
+            except UnicodeDecodeError:
+                # The sample was not representative – re-detect on the chunk
+                # that failed and carry on without raising again
+                data = pending + bytes(data)
+                decoder = codecs.getincrementaldecoder(_chardet_encoding(data[:sample_size]))("replace")
+                text = decoder.decode(data, final=final)
+            if can_release:
+                end = min(offset + chunk_size, size) // mmap.PAGESIZE * mmap.PAGESIZE
+                if end > released:
+                    buf.madvise(mmap.MADV_DONTNEED, released, end - released)  # type: ignore[union-attr]
+                    released = end
+            if text:
+                yield text
+
+
+def iter_line_chunks(source: _t.Union[str, Path, bytes, bytearray, memoryview]) -> _t.Iterator[str]:
+    """Like :func:`iter_decoded`, but every chunk ends on a line boundary.
+
+    A chunk without any newline goes out as-is to keep memory bounded.
+    """
+    carry = ""
+    for chunk in iter_decoded(source):
+        chunk = carry + chunk
+        cut = chunk.rfind("\n") + 1 or len(chunk)
+        carry = chunk[cut:]
+        yield chunk[:cut]
+    if carry:
+        yield carry
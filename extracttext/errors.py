@@ -6,11 +6,17 @@ All custom errors subclass :class:`ExtractTextError` so that callers can catch
 """
 from __future__ import annotations
 
+import typing as _t
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from extracttext.extractors.base_extractor import DocumentType
+
 __all__ = [
     "ExtractTextError",
     "UnsupportedDocumentError",
     "ExtractionFailedError",
     "OcrEngineNotFoundError",
+    "DeadlineExceededError",
 ]
 
 
@@ -27,4 +33,17 @@ class ExtractionFailedError(ExtractTextError):
 
 
 class OcrEngineNotFoundError(ExtractTextError):
-    """Raised when Tesseract (or underlying OCR engine) is missing/unavailable.""" 
\ No newline at end of file
+    """Raised when Tesseract (or underlying OCR engine) is missing/unavailable."""
+
+
+class DeadlineExceededError(ExtractTextError):
+    """Raised when an extraction deadline passes before all pages are done.
+
+    :meth:`DataLoader.load <extracttext.dataloader.DataLoader.load>` turns it
+    into a partial result; *document_type* names the extractor that was
+    interrupted (set by the loader).
+    """
+
+    def __init__(self, message: str = "Extraction deadline exceeded", document_type: _t.Optional["DocumentType"] = None):
+        super().__init__(message)
+        self.document_type = document_type
@@ -2,24 +2,64 @@
 
 Each module defines a concrete `BaseExtractor` implementation.
 End-users generally don't import these directly; they are wired up by
-`extracttext.dataloader`.
+`extracttext.dataloader` through the lazy registry in
+:mod:`extracttext.extractors.registry`.
+
+The extractor classes are still importable from here, but each module – and
+its backend (pdfminer, pdf2image, python-docx, Pillow, …) – is only
+imported on first attribute access.
 """
 
+import importlib
+import typing as _t
+
 from .base_extractor import BaseExtractor, DocumentType  # noqa: F401
-from .pdf_text import PdfTextExtractor  # noqa: F401
-from .pdf_ocr import PdfOcrExtractor  # noqa: F401
-from .image_ocr import ImageOcrExtractor  # noqa: F401
-from .docx import DocxExtractor  # noqa: F401
-from .text_file import TextExtractor  # noqa: F401
-from .csv_file import CsvExtractor  # noqa: F401
+from .registry import ExtractorSpec, register_extractor, unregister_extractor  # noqa: F401
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from .csv_file import CsvExtractor
+    from .docx import DocxExtractor
+    from .image_ocr import ImageOcrExtractor
+    from .pdf_hybrid import PdfHybridExtractor
+    from .pdf_ocr import PdfOcrExtractor
+    from .pdf_text import PdfTextExtractor
+    from .text_file import TextExtractor
+
+#: Extractor class → defining sub-module, imported on first access
+_LAZY = {
+    "PdfTextExtractor": "pdf_text",
+    "PdfOcrExtractor": "pdf_ocr",
+    "PdfHybridExtractor": "pdf_hybrid",
+    "ImageOcrExtractor": "image_ocr",
+    "DocxExtractor": "docx",
+    "TextExtractor": "text_file",
+    "CsvExtractor": "csv_file",
+}
 
 __all__ = [
     "BaseExtractor",
     "DocumentType",
+    "ExtractorSpec",
+    "register_extractor",
+    "unregister_extractor",
     "PdfTextExtractor",
     "PdfOcrExtractor",
+    "PdfHybridExtractor",
     "ImageOcrExtractor",
     "DocxExtractor",
     "TextExtractor",
     "CsvExtractor",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> _t.Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later look-ups skip this hook
+    return value
+
+
+def __dir__() -> _t.List[str]:
+    return sorted({*globals(), *_LAZY})
@@ -8,6 +8,9 @@ import enum
 import typing as _t
 from pathlib import Path
 
+if _t.TYPE_CHECKING:  # pragma: no cover – typing only, avoids import cycle
+    from extracttext.detector import DocumentProbe
+
 __all__ = [
     "DocumentType",
     "BaseExtractor",
@@ -19,6 +22,7 @@ class DocumentType(str, enum.Enum):
 
     PDF_TEXT = "pdf_text"
     PDF_IMAGE = "pdf_image"  # rasterised or scanned
+    PDF_MIXED = "pdf_mixed"  # per-page mix of text layer and scanned pages
     IMAGE = "image"  # jpg / png / tiff
     DOCX = "docx"
     TEXT = "text"
@@ -40,6 +44,16 @@ class BaseExtractor(abc.ABC):
     #: extractor handles (e.g. differentiating PDF-with-text vs. PDF-OCR).
     DOCUMENT_TYPE: DocumentType
 
+    #: Content kind (``extracttext.detector.KIND_*``) this extractor handles
+    DOCUMENT_KIND: _t.ClassVar[str]
+
+    #: Lower-case extensions routed here when the content kind is unknown
+    EXTENSIONS: _t.ClassVar[frozenset] = frozenset()
+
+    #: Whether :meth:`iter_pages` yields real pages and accepts a 0-based
+    #: ``page_numbers`` selection; unpaginated documents count as one page.
+    PAGINATED: _t.ClassVar[bool] = False
+
     # ---------------------------------------------------------------------
     # Static helpers every extractor can reuse
     # ---------------------------------------------------------------------
@@ -50,16 +64,50 @@ class BaseExtractor(abc.ABC):
             return source
         return Path(source)
 
+    @staticmethod
+    def _suffix(source: _t.Union[str, Path, bytes], probe: _t.Optional["DocumentProbe"] = None) -> str:
+        """Lower-case extension of the document.
+
+        The probe wins when given – for in-memory buffers it is the only place
+        the original filename survives.
+        """
+        if probe is not None:
+            return probe.suffix
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return ""
+        return Path(source).suffix.lower()
+
+    def _matches(
+        self,
+        source: _t.Union[str, Path, bytes],
+        probe: _t.Optional["DocumentProbe"],
+        extensions: _t.Collection[str],
+    ) -> bool:
+        """Kind-first routing check shared by ``can_process`` implementations.
+
+        A sniffed content kind on the probe is authoritative, so misnamed
+        files still reach the right extractor; the extension is only consulted
+        when the content was not recognised (or no probe is given).
+        """
+        if probe is not None and probe.kind is not None:
+            return probe.kind == self.DOCUMENT_KIND
+        return self._suffix(source, probe) in extensions
+
     # ------------------------------------------------------------------
     # Mandatory interface
     # ------------------------------------------------------------------
     @abc.abstractmethod
-    def can_process(self, source: _t.Union[str, Path]) -> bool:  # noqa: D401
+    def can_process(self, source: _t.Union[str, Path, bytes], probe: _t.Optional["DocumentProbe"] = None) -> bool:  # noqa: D401
         """Cheap check quickly indicating whether this extractor *might* handle the file.
 
         Should avoid heavy I/O; prefer checking file extensions, magic numbers,
         or the first few bytes. Returning *False* guarantees the orchestrator
         will not invoke :meth:`extract_text` for this extractor.
+
+        *probe* is the :class:`~extracttext.detector.DocumentProbe` computed once
+        by the orchestrator.  Extractors needing document facts should read them
+        from it rather than re-parsing *source*; when called standalone
+        (``probe=None``) they may build their own.
         """
 
     @abc.abstractmethod
@@ -68,4 +116,32 @@ class BaseExtractor(abc.ABC):
 
         Subclasses should raise an exception (e.g. `RuntimeError`) if extraction
         fails so that the orchestrator can attempt a fallback extractor.
-        """ 
\ No newline at end of file
+        """
+
+    # ------------------------------------------------------------------
+    # Optional interface
+    # ------------------------------------------------------------------
+    def iter_pages(self, source: _t.Union[str, Path, bytes]) -> _t.Iterator[str]:  # noqa: D401
+        """Yield the text of *source* one page (or chunk) at a time, in order.
+
+        The default yields the whole :meth:`extract_text` result as a single
+        fragment; paginated extractors override it to stream pages as they
+        complete.
+        """
+        yield self.extract_text(source)
+
+    def extract_typed(self, source: _t.Union[str, Path, bytes], **kwargs: _t.Any) -> tuple[DocumentType, str]:
+        """Return ``(document_type, text)`` – :meth:`extract_text` plus the type it found.
+
+        The default reports :attr:`DOCUMENT_TYPE`; extractors whose type
+        depends on the content (per-page PDF routing) override it.  *kwargs*
+        are forwarded to :meth:`extract_text`.
+        """
+        return self.DOCUMENT_TYPE, self.extract_text(source, **kwargs)
+
+    def iter_typed_pages(
+        self, source: _t.Union[str, Path, bytes], **kwargs: _t.Any
+    ) -> _t.Iterator[tuple[DocumentType, str]]:
+        """:meth:`iter_pages` yielding ``(document_type, text)`` pairs; see :meth:`extract_typed`."""
+        for text in self.iter_pages(source, **kwargs):
+            yield self.DOCUMENT_TYPE, text
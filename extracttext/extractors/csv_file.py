@@ -1,42 +1,243 @@
-"""Extractor for CSV files (comma-separated values)."""
+"""Extractor for CSV files (comma-separated values).
+
+Besides the raw-text :meth:`CsvExtractor.extract_text`, a *structured* mode
+parses the file as it is decoded: :meth:`CsvExtractor.open_rows` streams rows
+with column projection and a row limit, and :meth:`CsvExtractor.read_columns`
+builds compact per-column arrays.  Neither ever holds the raw file in memory.
+"""
 
 from __future__ import annotations
 
+import csv
+import itertools
+from operator import itemgetter
 from pathlib import Path
 import typing as _t
 
+from ..detector import KIND_CSV
+from ..encoding import iter_decoded, iter_line_chunks
 from .base_extractor import BaseExtractor, DocumentType
 
-__all__ = ["CsvExtractor"]
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from extracttext.detector import DocumentProbe
+
+__all__ = ["CsvExtractor", "CsvRows"]
+
+#: Decoded characters handed to :class:`csv.Sniffer`
+_SNIFF_CHARS = 64 * 1024
+_SNIFF_DELIMITERS = ",;\t|"
+
+#: Column selector – header name or 0-based index
+ColumnRef = _t.Union[str, int]
+
+
+class CsvRows:
+    """Lazily parsed rows of one CSV document.
+
+    Iterating yields one tuple per data row holding the projected columns in
+    :attr:`columns` order; missing trailing fields are returned as ``""``.
+    Use as a context manager (or call :meth:`close`) to release the
+    underlying file early.
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        dialect: _t.Type[csv.Dialect],
+        rows: _t.Iterator[tuple[str, ...]],
+        chunks: _t.Optional[_t.Iterator[str]] = None,
+    ):
+        self.columns = columns
+        self.dialect = dialect
+        self._rows = rows
+        self._chunks = chunks  # the decoder holding the file (mmap) open
+
+    def __iter__(self) -> _t.Iterator[tuple[str, ...]]:
+        return self._rows
+
+    def close(self) -> None:
+        for it in (self._rows, self._chunks):
+            close = getattr(it, "close", None)
+            if close is not None:
+                close()
+
+    def __enter__(self) -> "CsvRows":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
 
 class CsvExtractor(BaseExtractor):
     DOCUMENT_TYPE = DocumentType.CSV
+    DOCUMENT_KIND = KIND_CSV
+    EXTENSIONS = frozenset({".csv"})
 
-    def can_process(self, source: _t.Union[str, Path]) -> bool:
-        return str(source).lower().endswith(".csv")
+    def can_process(self, source: _t.Union[str, Path, bytes], probe: _t.Optional["DocumentProbe"] = None) -> bool:
+        return self._matches(source, probe, self.EXTENSIONS)
 
     def extract_text(self, source: _t.Union[str, Path, bytes]) -> str:  # noqa: D401
-        # Similar strategy to TextExtractor: read raw bytes and decode using chardet.
-        if isinstance(source, (bytes, bytearray)):
-            raw: bytes = source  # type: ignore[assignment]
-        else:
-            path = self._to_path(source)
-            with open(path, "rb") as fh:
-                raw = fh.read()
+        # Same strategy as TextExtractor: sample-based detection + chunked decode.
+        if not isinstance(source, (bytes, bytearray)):
+            source = self._to_path(source)
+
+        # Ensure we preserve original line endings and delimiter characters – no modifications.
+        return "".join(iter_decoded(source))
 
-        if not raw:
-            return ""
+    def iter_pages(self, source: _t.Union[str, Path, bytes]) -> _t.Iterator[str]:  # noqa: D401
+        """Yield the raw text in line-aligned chunks (see :func:`~extracttext.encoding.iter_line_chunks`)."""
+        if not isinstance(source, (bytes, bytearray)):
+            source = self._to_path(source)
+        return iter_line_chunks(source)
 
-        import chardet  # local import to avoid top-level requirement for csv only
+    # ------------------------------------------------------------------
+    # Structured mode
+    # ------------------------------------------------------------------
+    def open_rows(
+        self,
+        source: _t.Union[str, Path, bytes],
+        *,
+        columns: _t.Optional[_t.Sequence[ColumnRef]] = None,
+        limit: _t.Optional[int] = None,
+        header: _t.Optional[bool] = True,
+    ) -> CsvRows:
+        """Parse *source* lazily and return its rows as a :class:`CsvRows`.
 
-        detected = chardet.detect(raw)
-        encoding = (detected.get("encoding") or "utf-8").strip()
+        The dialect (delimiter, quoting) is sniffed once from the first
+        64 KiB of decoded text.  *columns* projects each row onto the given
+        header names or 0-based indices; *limit* caps the number of data
+        rows.  With ``header=None`` the presence of a header row is sniffed
+        too; without a header, columns are named ``"0"``, ``"1"``, …
 
+        Raises ``ValueError`` for unknown column names.
+        """
+        if not isinstance(source, (bytes, bytearray)):
+            source = self._to_path(source)
+
+        chunks = iter_decoded(source)
         try:
-            text = raw.decode(encoding)
-        except Exception:
-            text = raw.decode("utf-8", errors="replace")
+            return self._open_rows(chunks, columns, limit, header)
+        except BaseException:
+            chunks.close()
+            raise
 
-        # Ensure we preserve original line endings and delimiter characters – no modifications.
-        return text 
\ No newline at end of file
+    def _open_rows(
+        self,
+        chunks: _t.Iterator[str],
+        columns: _t.Optional[_t.Sequence[ColumnRef]],
+        limit: _t.Optional[int],
+        header: _t.Optional[bool],
+    ) -> CsvRows:
+        lines = _iter_lines(chunks)
+        sample_lines: list[str] = []
+        sampled = 0
+        for line in lines:
+            sample_lines.append(line)
+            sampled += len(line)
+            if sampled >= _SNIFF_CHARS:
+                break
+        sample = "".join(sample_lines)
+
+        dialect: _t.Type[csv.Dialect]
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=_SNIFF_DELIMITERS)
+        except csv.Error:
+            dialect = csv.excel
+        if header is None:
+            try:
+                header = csv.Sniffer().has_header(sample)
+            except csv.Error:
+                header = False
+
+        reader = csv.reader(itertools.chain(sample_lines, lines), dialect)
+        first = next(reader, None)
+        if first is None:
+            return CsvRows([], dialect, iter(()), chunks)
+
+        if header:
+            names = first
+            body: _t.Iterator[list[str]] = reader
+        else:
+            names = [str(i) for i in range(len(first))]
+            body = itertools.chain([first], reader)
+
+        indices = _resolve_columns(names, columns)
+        if limit is not None:
+            body = itertools.islice(body, max(0, limit))
+
+        selected = [names[i] if i < len(names) else str(i) for i in indices]
+        return CsvRows(selected, dialect, _project(body, indices), chunks)
+
+    def read_columns(
+        self,
+        source: _t.Union[str, Path, bytes],
+        *,
+        columns: _t.Optional[_t.Sequence[ColumnRef]] = None,
+        limit: _t.Optional[int] = None,
+        header: _t.Optional[bool] = True,
+    ) -> dict[str, list[str]]:
+        """Return the (projected) table as ``{column name: values}``.
+
+        Columnar counterpart of :meth:`open_rows` with the same arguments;
+        only the selected columns are ever materialised.
+        """
+        with self.open_rows(source, columns=columns, limit=limit, header=header) as rows:
+            arrays: list[list[str]] = [[] for _ in rows.columns]
+            appends = [a.append for a in arrays]
+            for row in rows:
+                for append, value in zip(appends, row):
+                    append(value)
+            return dict(zip(rows.columns, arrays))
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _iter_lines(chunks: _t.Iterable[str]) -> _t.Iterator[str]:
+    """Re-split decoded chunks into ``\\n``-terminated lines for :mod:`csv`.
+
+    Only ``\\n`` splits lines (``\\r\\n`` stays intact), matching a file
+    opened with ``newline=""``, so quoted multi-line fields survive.
+    """
+    carry = ""
+    for chunk in chunks:
+        parts = (carry + chunk).split("\n")
+        carry = parts.pop()
+        for part in parts:
+            yield part + "\n"
+    if carry:
+        yield carry
+
+
+def _resolve_columns(names: list[str], columns: _t.Optional[_t.Sequence[ColumnRef]]) -> list[int]:
+    if columns is None:
+        return list(range(len(names)))
+
+    positions = {name: i for i, name in enumerate(names)}
+    indices = []
+    for col in columns:
+        if isinstance(col, int):
+            indices.append(col)
+        elif col in positions:
+            indices.append(positions[col])
+        else:
+            raise ValueError(f"Unknown CSV column {col!r}; available: {names}")
+    return indices
+
+
+def _project(rows: _t.Iterable[list[str]], indices: list[int]) -> _t.Iterator[tuple[str, ...]]:
+    if not indices:
+        for _ in rows:
+            yield ()
+        return
+
+    getter = itemgetter(*indices)
+    width = max(indices) + 1
+    single = len(indices) == 1
+    for row in rows:
+        if len(row) < width:
+            # Ragged row – pad missing trailing fields
+            row = row + [""] * (width - len(row))
+        values = getter(row)
+        yield (values,) if single else values
@@ -1,33 +1,171 @@
-"""Extractor for Microsoft Word .docx files."""
+"""Extractor for Microsoft Word .docx files.
+
+Two engines are available (select via ``DOCX_ENGINE``):
+    • ``stream``      – (default) reads the main document part (found via
+      ``_rels/.rels``, normally ``word/document.xml``) straight from the zip
+      with an incremental XML parser; text comes out in true body order
+      (tables where they appear) with memory independent of document size.
+    • ``python-docx`` – builds the full python-docx object model; paragraphs
+      first, then tables.  Kept for comparison and as an escape hatch.
+"""
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 import typing as _t
 
-import docx  # type: ignore  # noqa: F401
-
+from ..detector import KIND_DOCX
 from .base_extractor import BaseExtractor, DocumentType
 
+if _t.TYPE_CHECKING:  # pragma: no cover
+    import zipfile
+
+    from extracttext.detector import DocumentProbe
+
 __all__ = ["DocxExtractor"]
 
+DEFAULT_DOCX_ENGINE = "stream"
+_DOCX_ENGINES = ("stream", "python-docx")
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY, _P, _R, _T, _TAB, _PTAB, _BR, _CR, _NB_HYPHEN = (
+    _W + "body",
+    _W + "p",
+    _W + "r",
+    _W + "t",
+    _W + "tab",
+    _W + "ptab",
+    _W + "br",
+    _W + "cr",
+    _W + "noBreakHyphen",
+)
+_TBL, _TR, _TC, _TXBX = _W + "tbl", _W + "tr", _W + "tc", _W + "txbxContent"
+_BR_TYPE = _W + "type"
+
+_RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_DEFAULT_MAIN_PART = "word/document.xml"
+
 
 class DocxExtractor(BaseExtractor):
     DOCUMENT_TYPE = DocumentType.DOCX
+    DOCUMENT_KIND = KIND_DOCX
+    EXTENSIONS = frozenset({".docx"})
 
-    def can_process(self, source: _t.Union[str, Path]) -> bool:
-        return str(source).lower().endswith(".docx")
+    def can_process(self, source: _t.Union[str, Path, bytes], probe: _t.Optional["DocumentProbe"] = None) -> bool:
+        return self._matches(source, probe, self.EXTENSIONS)
 
     def extract_text(self, source: _t.Union[str, Path, bytes]) -> str:  # noqa: D401
         """Return text from a .docx file.
 
-        The routine iterates over *all* paragraphs *and* table cells, preserving
-        logical reading order.  Paragraphs are separated by newlines; table
-        cells are joined by tabs within a row, and rows by newlines.
+        Paragraphs are separated by newlines; table cells are joined by tabs
+        within a row, and rows by newlines.  The engine is chosen with the
+        ``DOCX_ENGINE`` environment variable (default ``stream``).
+        """
+
+        engine = os.getenv("DOCX_ENGINE", DEFAULT_DOCX_ENGINE)
+        if engine == "stream":
+            return "\n".join(self.iter_blocks(source))
+        if engine == "python-docx":
+            return self._extract_object_model(source)
+        raise ValueError(f"Unknown DOCX engine {engine!r}; expected one of {list(_DOCX_ENGINES)}")
+
+    def iter_blocks(self, source: _t.Union[str, Path, bytes]) -> _t.Iterator[str]:  # noqa: D401
+        """Yield non-empty paragraphs and table rows in document body order.
+
+        The main document part is parsed incrementally and every finished
+        top-level block is discarded, so memory stays constant.  Text boxes
+        are skipped (as python-docx does); nested table text is folded into
+        the enclosing cell.
         """
 
+        import zipfile
+        from io import BytesIO
+        from xml.etree.ElementTree import iterparse
+
+        try:
+            zf = zipfile.ZipFile(BytesIO(source) if isinstance(source, (bytes, bytearray)) else self._to_path(source))
+        except Exception as exc:  # pragma: no cover – propagate meaningful message
+            raise RuntimeError("Failed to open DOCX document") from exc
+        part = _main_part(zf)
+        try:
+            xml = zf.open(part)
+        except KeyError as exc:
+            zf.close()
+            raise RuntimeError(f"DOCX archive has no {part}") from exc
+
+        with zf, xml:
+            body = None
+            depth = 0
+            in_run = tbl_depth = txbx_depth = 0
+            para: list[str] = []  # text of the paragraph being parsed
+            cell: list[str] = []  # paragraphs of the current top-level cell
+            row: list[str] = []  # non-empty cells of the current top-level row
+
+            for event, elem in iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    depth += 1
+                    if tag == _R:
+                        in_run += 1
+                    elif tag == _TBL:
+                        tbl_depth += 1
+                    elif tag == _TXBX:
+                        txbx_depth += 1
+                    elif tag == _BODY:
+                        body = elem
+                    continue
+
+                depth -= 1
+                if txbx_depth:
+                    if tag == _TXBX:
+                        txbx_depth -= 1
+                    elif tag == _R:
+                        in_run -= 1
+                    continue
+
+                if in_run:
+                    if tag == _T:
+                        para.append(elem.text or "")
+                    elif tag in (_TAB, _PTAB):
+                        para.append("\t")
+                    elif tag == _CR or (tag == _BR and elem.get(_BR_TYPE) in (None, "textWrapping")):
+                        para.append("\n")
+                    elif tag == _NB_HYPHEN:
+                        para.append("-")
+                    elif tag == _R:
+                        in_run -= 1
+                elif tag == _P:
+                    text = "".join(para)
+                    para.clear()
+                    elem.clear()
+                    if tbl_depth:
+                        cell.append(text)
+                    elif text.strip():
+                        yield text.strip()
+                elif tag == _TC and tbl_depth == 1:
+                    text = "\n".join(cell).strip()
+                    cell.clear()
+                    if text:
+                        row.append(text)
+                elif tag == _TR and tbl_depth == 1:
+                    if row:
+                        yield "\t".join(row)
+                    row.clear()
+                elif tag == _TBL:
+                    tbl_depth -= 1
+
+                if depth == 2 and body is not None:
+                    # A top-level block just ended – drop it from the tree
+                    body.clear()
+
+    def _extract_object_model(self, source: _t.Union[str, Path, bytes]) -> str:
+        """python-docx engine: paragraphs first, then table rows."""
+
         from io import BytesIO  # local import to keep global namespace minimal
 
+        import docx  # type: ignore  # python-docx (and lxml) only for this engine
+
         # Obtain python-docx `Document` instance from various input shapes
         try:
             if isinstance(source, (bytes, bytearray)):
@@ -49,8 +187,24 @@ class DocxExtractor(BaseExtractor):
         # Collect text from tables (row-major order)
         for table in doc_obj.tables:
             for row in table.rows:
-                row_text = "\t".join(cell.text.strip() for cell in row.cells if cell.text.strip())
+                cells = (cell.text.strip() for cell in row.cells)
+                row_text = "\t".join(text for text in cells if text)
                 if row_text:
                     parts.append(row_text)
 
-        return "\n".join(parts) 
\ No newline at end of file
+        return "\n".join(parts)
+
+
+def _main_part(zf: "zipfile.ZipFile") -> str:
+    """Name of the main document part, resolved like python-docx via ``_rels/.rels``."""
+    import posixpath
+    from xml.etree.ElementTree import ParseError, fromstring
+
+    try:
+        rels = fromstring(zf.read("_rels/.rels"))
+    except (KeyError, ParseError):
+        return _DEFAULT_MAIN_PART
+    for rel in rels.iter(_RELATIONSHIP):
+        if rel.get("Type", "").endswith("/officeDocument") and rel.get("TargetMode") != "External":
+            return posixpath.normpath(rel.get("Target", _DEFAULT_MAIN_PART)).lstrip("/")
+    return _DEFAULT_MAIN_PART
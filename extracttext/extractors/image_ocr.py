@@ -1,4 +1,10 @@
-"""OCR extractor for standalone image files (JPG, PNG, TIFF, ...)."""
+"""OCR extractor for standalone image files (JPG, PNG, TIFF, ...).
+
+Multi-frame images (multi-page TIFF faxes, animated GIFs) are OCRed frame by
+frame: frames are decoded lazily, written to the raster scratch directory and
+fanned out across the OCR worker pool exactly like scanned PDF pages; frame
+texts are joined with ``\f`` form-feeds.
+"""
 
 from __future__ import annotations
 
@@ -6,48 +12,198 @@ from pathlib import Path
 import typing as _t
 
 from PIL import Image  # type: ignore  # noqa: F401
-import pytesseract  # type: ignore  # noqa: F401
 
+from ..ocr import get_engine
+from ..ocr.pipeline import in_page_order
+from ..ocr.preprocess import prepare_image
+from ..detector import KIND_IMAGE
+from ..errors import DeadlineExceededError
+from ..instrumentation import record_span, span, timed
+from ..profiling import profiled
 from .base_extractor import BaseExtractor, DocumentType
 
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+
+    from extracttext.detector import DocumentProbe
+
 __all__ = ["ImageOcrExtractor"]
 
 
-_VALID_IMG_EXT = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".gif"}
+def _open_image(source: _t.Union[Path, bytes]) -> "Image.Image":
+    from io import BytesIO
+
+    if isinstance(source, (bytes, bytearray)):
+        return Image.open(BytesIO(source))  # type: ignore[arg-type]
+    return Image.open(str(source))
+
+
+def _ocr_image(source: _t.Union[Path, bytes], lang: str) -> str:
+    """OCR a single-frame image (runs in-process or in a pool worker)."""
+    with _open_image(source) as img:
+        # Shrink / grayscale before Tesseract sees a single pixel
+        # Stripped like the pages of multi-frame images and PDFs
+        return (get_engine().image_to_string(prepare_image(img), lang=lang) or "").strip()
+
+
+def _time_left(deadline: _t.Optional[float]) -> _t.Optional[float]:
+    """Seconds until the :func:`time.monotonic` *deadline* (``None`` = unbounded)."""
+    if deadline is None:
+        return None
+    import time
+
+    return max(0.0, deadline - time.monotonic())
 
 
 class ImageOcrExtractor(BaseExtractor):
     DOCUMENT_TYPE = DocumentType.IMAGE
+    DOCUMENT_KIND = KIND_IMAGE
+    EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".gif"})
+    PAGINATED = True
 
-    def can_process(self, source: _t.Union[str, Path]) -> bool:
-        return Path(source).suffix.lower() in _VALID_IMG_EXT
+    def can_process(self, source: _t.Union[str, Path, bytes], probe: _t.Optional["DocumentProbe"] = None) -> bool:
+        return self._matches(source, probe, self.EXTENSIONS)
 
-    def extract_text(self, source: _t.Union[str, Path, bytes]) -> str:  # noqa: D401
+    def extract_text(
+        self, source: _t.Union[str, Path, bytes], *, executor: _t.Optional["Executor"] = None
+    ) -> str:  # noqa: D401
         """Run Tesseract OCR on a standalone image.
 
         The language used can be overridden via the environment variable
-        ``OCR_LANG`` (defaults to ``eng``). Any failure to read or process the
-        image raises ``RuntimeError`` so the orchestrator can attempt fallbacks.
+        ``OCR_LANG`` (defaults to ``eng``) and the backend via ``OCR_ENGINE``
+        (see :mod:`extracttext.ocr`).  Images are normalised first (draft
+        decode, downscale, grayscale – see :mod:`extracttext.ocr.preprocess`).
+
+        Every frame of a multi-frame image is recognised; frames run in
+        parallel on *executor* (default: the shared pool) and their texts are
+        joined with ``\f``.  A single-frame image runs as one task on
+        *executor* when given, otherwise in-process.  Any failure to read or
+        process the image raises ``RuntimeError`` so the orchestrator can
+        attempt fallbacks.
+        """
+
+        return "\f".join(self.iter_pages(source, executor=executor))
+
+    def iter_pages(
+        self,
+        source: _t.Union[str, Path, bytes],
+        *,
+        executor: _t.Optional["Executor"] = None,
+        page_numbers: _t.Optional[_t.Iterable[int]] = None,
+        deadline: _t.Optional[float] = None,
+    ) -> _t.Iterator[str]:  # noqa: D401
+        """Yield the OCR text of every frame in order, as soon as it is ready.
+
+        Same behaviour and environment overrides as :meth:`extract_text`;
+        multi-frame images additionally honour ``OCR_MAX_INFLIGHT``,
+        ``OCR_BATCH_SIZE`` and ``OCR_RASTER_DIR`` like scanned PDFs.
+        *page_numbers* (0-based) selects frames.  Past the :func:`time.monotonic`
+        *deadline* pending frames are cancelled and
+        :class:`~extracttext.errors.DeadlineExceededError` is raised.
         """
 
         import os
-        from io import BytesIO
+        from concurrent.futures import TimeoutError as FutureTimeout
 
         lang = os.getenv("OCR_LANG", "eng")
+        if not isinstance(source, (bytes, bytearray)):
+            source = self._to_path(source)
 
         try:
-            if isinstance(source, (bytes, bytearray)):
-                img = Image.open(BytesIO(source))  # type: ignore[arg-type]
-            else:
-                path = self._to_path(source)
-                img = Image.open(str(path))
+            with _open_image(source) as img:
+                frame_count = getattr(img, "n_frames", 1)
+        except Exception as exc:  # pragma: no cover – propagate for orchestrator
+            raise RuntimeError("Image OCR failed") from exc
 
-            # Ensure image is in a format Tesseract likes (convert mode if needed)
-            if img.mode != "RGB":
-                img = img.convert("RGB")
+        frames: _t.Sequence[int] = range(frame_count)
+        if page_numbers is not None:
+            frames = sorted({n for n in page_numbers if 0 <= n < frame_count})
 
-            text = pytesseract.image_to_string(img, lang=lang)
+        try:
+            if frame_count > 1:
+                results = self._iter_frames_ocr(source, frames, lang, executor, deadline)
+                for _, text in in_page_order(results, frames):
+                    yield text
+            elif not frames:
+                return
+            elif executor is not None:
+                future = executor.submit(timed, profiled(_ocr_image), source, lang)
+                try:
+                    text, seconds = future.result(timeout=_time_left(deadline))
+                except FutureTimeout:
+                    future.cancel()
+                    raise DeadlineExceededError("Image OCR deadline exceeded") from None
+                record_span("ocr", seconds, pages=[1])
+                yield text
+            else:
+                with span("ocr", pages=[1]):
+                    text = _ocr_image(source, lang)
+                yield text
+        except DeadlineExceededError:
+            raise
         except Exception as exc:  # pragma: no cover – propagate for orchestrator
             raise RuntimeError("Image OCR failed") from exc
 
-        return text or "" 
\ No newline at end of file
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _iter_frames_ocr(
+        self,
+        source: _t.Union[Path, bytes],
+        frames: _t.Sequence[int],
+        lang: str,
+        executor: _t.Optional["Executor"] = None,
+        deadline: _t.Optional[float] = None,
+    ) -> _t.Iterator[tuple[int, str]]:
+        """Yield ``(frame_number, text)`` pairs as OCR completes (any order).
+
+        The sorted *frames* are decoded one at a time in this thread,
+        normalised, saved as uncompressed rasters and submitted in batches to
+        the pool by the :class:`~extracttext.ocr.pipeline.OcrScheduler` the
+        PDF OCR extractor uses too.  Decoding blocks while ``OCR_MAX_INFLIGHT``
+        frames await OCR, so memory does not grow with the frame count.
+        """
+
+        import os
+        import tempfile
+        from dataclasses import replace
+
+        from extracttext.concurrency import resolve_executor
+        from extracttext.ocr import DEFAULT_ENGINE
+        from extracttext.ocr.pipeline import OcrScheduler, batch_size, max_inflight, raster_dir
+        from extracttext.ocr.preprocess import PreprocessOptions
+
+        preprocess = PreprocessOptions.from_env()
+        # Frames are normalised here; the worker must not process them again
+        worker_preprocess = replace(preprocess, enabled=False)
+        per_task = batch_size(len(frames))
+        scheduler = OcrScheduler(
+            resolve_executor(executor),
+            lang=lang,
+            engine_name=os.getenv("OCR_ENGINE", DEFAULT_ENGINE),
+            limit=max_inflight(),
+            deadline=deadline,
+        )
+
+        with tempfile.TemporaryDirectory(prefix="extracttext_", dir=raster_dir()) as tmpdir, scheduler:
+            with _open_image(source) as img:
+                batch: list[str] = []
+                numbers: list[int] = []
+                for n in frames:
+                    # Back-pressure before decoding the next frame
+                    yield from scheduler.reserve(len(batch) + 1)
+
+                    with span("render", first_page=n + 1, last_page=n + 1):
+                        img.seek(n)
+                        frame = prepare_image(img, preprocess)
+                        raster = os.path.join(tmpdir, f"frame-{n:05d}.{'pgm' if frame.mode == 'L' else 'ppm'}")
+                        frame.save(raster)
+                    batch.append(raster)
+                    numbers.append(n)
+                    if len(batch) == per_task:
+                        scheduler.submit(batch, numbers, None, worker_preprocess)
+                        batch, numbers = [], []
+                if batch:
+                    scheduler.submit(batch, numbers, None, worker_preprocess)
+
+            yield from scheduler.drain()
@@ -0,0 +1,146 @@
+"""Hybrid extractor for PDFs mixing digital and scanned pages.
+
+Every page is first run through the PDF text-layer engine.  Only the pages that
+come back empty are rasterised and OCR'd, then all pages are merged in their
+original order using the ``\f`` separator shared with the other PDF extractors.
+
+Results report ``PDF_MIXED`` only when both kinds of page occurred; a document
+that needed no OCR is ``PDF_TEXT`` and one that needed it everywhere is
+``PDF_IMAGE``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import typing as _t
+
+from ..detector import KIND_PDF
+from ..profiling import profiled
+from .base_extractor import BaseExtractor, DocumentType
+from .pdf_ocr import PdfOcrExtractor
+from .pdf_text import PdfTextExtractor
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+
+    from extracttext.detector import DocumentProbe
+
+__all__ = ["PdfHybridExtractor"]
+
+
+class PdfHybridExtractor(BaseExtractor):
+    """Per-page routing: text layer where present, OCR only where missing."""
+
+    DOCUMENT_TYPE = DocumentType.PDF_MIXED
+    DOCUMENT_KIND = KIND_PDF
+    EXTENSIONS = frozenset({".pdf"})
+    PAGINATED = True
+
+    def __init__(self) -> None:
+        self._text = PdfTextExtractor()
+        self._ocr = PdfOcrExtractor()
+
+    def can_process(self, source: _t.Union[str, Path, bytes], probe: _t.Optional["DocumentProbe"] = None) -> bool:
+        # Any PDF qualifies – the per-page split happens during extraction.
+        return self._matches(source, probe, self.EXTENSIONS)
+
+    def extract_text(
+        self, source: _t.Union[str, Path, bytes], *, executor: _t.Optional["Executor"] = None
+    ) -> str:  # noqa: D401
+        """Return the text of every page, OCR-ing only pages lacking a text layer.
+
+        Missing pages are OCR'd on *executor* (shared pool by default).
+        """
+
+        return self.extract_typed(source, executor=executor)[1]
+
+    def extract_typed(
+        self,
+        source: _t.Union[str, Path, bytes],
+        *,
+        executor: _t.Optional["Executor"] = None,
+        text_executor: _t.Optional["Executor"] = None,
+    ) -> tuple[DocumentType, str]:
+        """:meth:`extract_text` plus the type of the PDF, see :func:`_mix_type`.
+
+        The text-layer pass runs on *text_executor* when given (it is CPU
+        work too), otherwise in the calling thread.
+        """
+
+        pages = self._text_pages(source, None, text_executor)
+
+        missing = [n for n, text in enumerate(pages) if not text.strip()]
+        if missing:
+            ocr_texts = self._ocr.ocr_pages(source, missing, executor=executor)
+            for n, text in ocr_texts.items():
+                pages[n] = text
+
+        return _mix_type(len(missing), len(pages)), "\f".join(pages)
+
+    def iter_pages(
+        self,
+        source: _t.Union[str, Path, bytes],
+        *,
+        executor: _t.Optional["Executor"] = None,
+        page_numbers: _t.Optional[_t.Iterable[int]] = None,
+        deadline: _t.Optional[float] = None,
+    ) -> _t.Iterator[str]:  # noqa: D401
+        """Yield page texts in order; text-layer pages wait only for earlier OCR pages.
+
+        *page_numbers* (0-based) and *deadline* behave as for
+        :meth:`PdfOcrExtractor.iter_pages`.
+        """
+
+        for _, text in self.iter_typed_pages(
+            source, executor=executor, page_numbers=page_numbers, deadline=deadline
+        ):
+            yield text
+
+    def iter_typed_pages(
+        self,
+        source: _t.Union[str, Path, bytes],
+        *,
+        executor: _t.Optional["Executor"] = None,
+        page_numbers: _t.Optional[_t.Iterable[int]] = None,
+        deadline: _t.Optional[float] = None,
+        text_executor: _t.Optional["Executor"] = None,
+    ) -> _t.Iterator[tuple[DocumentType, str]]:
+        """:meth:`iter_pages` with the type of the selected pages, see :func:`_mix_type`.
+
+        *text_executor* behaves as for :meth:`extract_typed`.
+        """
+
+        if page_numbers is None:
+            pages = self._text_pages(source, None, text_executor)
+            numbers: _t.Sequence[int] = range(len(pages))
+        else:
+            numbers = sorted(set(page_numbers))
+            pages = self._text_pages(source, numbers, text_executor)
+        missing = [n for n, text in zip(numbers, pages) if not text.strip()]
+        doc_type = _mix_type(len(missing), len(pages))
+        ocr = self._ocr.iter_ocr_pages(source, missing, executor=executor, deadline=deadline)
+
+        for text in pages:
+            if not text.strip():
+                _, text = next(ocr)
+            yield doc_type, text
+
+    def _text_pages(
+        self,
+        source: _t.Union[str, Path, bytes],
+        page_numbers: _t.Optional[_t.Sequence[int]],
+        text_executor: _t.Optional["Executor"],
+    ) -> list[str]:
+        """Text layer of the selected pages, on *text_executor* when given."""
+        if text_executor is None:
+            return self._text.extract_pages(source, page_numbers=page_numbers)
+        return text_executor.submit(profiled(self._text.extract_pages), source, page_numbers=page_numbers).result()
+
+
+def _mix_type(ocr_pages: int, pages: int) -> DocumentType:
+    """``PDF_TEXT`` when no page needed OCR, ``PDF_IMAGE`` when all did, else ``PDF_MIXED``."""
+    if not ocr_pages:
+        return DocumentType.PDF_TEXT
+    if ocr_pages == pages:
+        return DocumentType.PDF_IMAGE
+    return DocumentType.PDF_MIXED
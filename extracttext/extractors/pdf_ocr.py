@@ -1,7 +1,14 @@
 """OCR-based extractor for scanned / image-only PDF files.
 
-Will convert each page to images via `pdf2image.convert_from_path` then feed
-those images to `pytesseract.image_to_string`.
+Will convert pages to images in small windows via `pdf2image.convert_from_path`
+and stream them to OCR workers (see :mod:`extracttext.ocr`) as they are rendered.
+
+Rasters never travel through the parent process: poppler writes uncompressed
+PGM files straight into a scratch directory (``/dev/shm`` when available) and
+workers receive only the file *paths*, which Tesseract reads directly.
+
+Pages render at ``OCR_DPI``; ``OCR_DPI=auto`` picks a resolution per page from
+a low-resolution probe render (see :mod:`extracttext.ocr.dpi`).
 """
 
 from __future__ import annotations
@@ -10,88 +17,311 @@ from pathlib import Path
 import typing as _t
 
 import pdf2image  # type: ignore  # noqa: F401
-import pytesseract  # type: ignore  # noqa: F401
 
+from ..detector import KIND_PDF
+from ..errors import DeadlineExceededError
+from ..instrumentation import span
+from ..ocr.pipeline import OcrScheduler, batch_size, in_page_order, max_inflight, raster_dir
 from .base_extractor import BaseExtractor, DocumentType
 
-__all__ = ["PdfOcrExtractor"]
-
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
 
-def _ocr_page(img_bytes_lang: tuple[bytes, str]) -> str:
-    """Run Tesseract on a single page image passed as raw bytes."""
+    from extracttext.detector import DocumentProbe
+    from extracttext.ocr.dpi import AdaptiveDpiOptions
 
-    from io import BytesIO
-
-    import pytesseract  # local import inside process
-    from PIL import Image
-
-    img_bytes, lang = img_bytes_lang
-    img = Image.open(BytesIO(img_bytes))
-    if img.mode != "RGB":
-        img = img.convert("RGB")
-    return pytesseract.image_to_string(img, lang=lang).strip()
+__all__ = ["PdfOcrExtractor"]
 
 
 class PdfOcrExtractor(BaseExtractor):
     """Fallback extractor for PDFs that *lack* a text layer."""
 
     DOCUMENT_TYPE = DocumentType.PDF_IMAGE
+    DOCUMENT_KIND = KIND_PDF
+    EXTENSIONS = frozenset({".pdf"})
+    PAGINATED = True
 
-    def can_process(self, source: _t.Union[str, Path]) -> bool:
-        path = self._to_path(source)
-        if path.suffix.lower() != ".pdf":
+    def can_process(self, source: _t.Union[str, Path, bytes], probe: _t.Optional["DocumentProbe"] = None) -> bool:
+        if not self._matches(source, probe, self.EXTENSIONS):
             return False
 
         try:
-            from extracttext.detector import peek_pdf_has_text
+            if probe is None:
+                from extracttext.detector import probe_document
+
+                probe = probe_document(source)
 
-            return not peek_pdf_has_text(path)
+            return not probe.has_text_layer
         except Exception:
             return True
 
-    def extract_text(self, source: _t.Union[str, Path, bytes]) -> str:  # noqa: D401
+    def extract_text(
+        self, source: _t.Union[str, Path, bytes], *, executor: _t.Optional["Executor"] = None
+    ) -> str:  # noqa: D401
         """Run OCR on every page of *source* and concatenate with form-feeds.
 
-        Pipeline:
-        1. Convert PDF pages to PIL Images via `pdf2image` (uses poppler).
-        2. Feed each page to `pytesseract.image_to_string`.
-        3. Join page texts with the ``\f`` form-feed character so downstream
-           callers can split if needed.
+        Pipeline (streaming, bounded memory):
+        1. Render pages in small windows via `pdf2image` (``first_page`` /
+           ``last_page``, uses poppler).
+        2. Hand every rendered page to an OCR worker immediately, so rendering
+           of the next window overlaps with OCR of the previous one.  At most
+           ``OCR_MAX_INFLIGHT`` rasters are alive at any time.
+        3. Join page texts in page order with the ``\f`` form-feed character so
+           downstream callers can split if needed.
+
+        Page OCR runs on *executor* when given, otherwise on the shared pool
+        from :func:`extracttext.concurrency.resolve_executor`.
 
         Environment overrides:
-            • ``OCR_LANG`` – language passed to Tesseract (default ``eng``).
-            • ``OCR_DPI``  – conversion resolution for `pdf2image` (default 300).
+            • ``OCR_LANG``          – language passed to Tesseract (default ``eng``).
+            • ``OCR_DPI``           – conversion resolution for `pdf2image` (default 300).
+            • ``OCR_RENDER_WINDOW`` – pages rasterised per poppler call (default 4).
+            • ``OCR_MAX_INFLIGHT``  – cap on rendered pages awaiting OCR
+              (default ``2 × cpu_count``).
+            • ``OCR_RASTER_DIR``    – scratch directory for page rasters
+              (default ``/dev/shm`` when writable).
+            • ``OCR_ENGINE``        – OCR backend, see :mod:`extracttext.ocr`
+              (default ``tesseract-batch``).
+            • ``OCR_BATCH_SIZE``    – max pages per engine invocation (default 4).
+        """
+
+        try:
+            page_count = self._page_count(source)
+            if not page_count:
+                return ""
+
+            texts = dict(self._iter_ocr(source, range(page_count), executor))
+            return "\f".join(texts[n] for n in range(page_count))
+        except Exception as exc:  # pragma: no cover
+            raise RuntimeError("PDF OCR failed") from exc
+
+    def ocr_pages(
+        self,
+        source: _t.Union[str, Path, bytes],
+        page_numbers: _t.Iterable[int],
+        *,
+        executor: _t.Optional["Executor"] = None,
+    ) -> dict[int, str]:
+        """OCR only the given 0-based *page_numbers* of *source*.
+
+        Returns a mapping ``page_number -> text``.  Pages are rendered with
+        ``first_page``/``last_page`` windows so untouched pages are never
+        rasterised.  Honours the same environment overrides as
+        :meth:`extract_text`.
+        """
+
+        wanted = sorted(set(page_numbers))
+        if not wanted:
+            return {}
+
+        try:
+            return dict(self._iter_ocr(source, wanted, executor))
+        except Exception as exc:  # pragma: no cover
+            raise RuntimeError("PDF OCR failed") from exc
+
+    def iter_pages(
+        self,
+        source: _t.Union[str, Path, bytes],
+        *,
+        executor: _t.Optional["Executor"] = None,
+        page_numbers: _t.Optional[_t.Iterable[int]] = None,
+        deadline: _t.Optional[float] = None,
+    ) -> _t.Iterator[str]:  # noqa: D401
+        """Yield the OCR text of every page in order, as soon as it is ready.
+
+        Same pipeline and environment overrides as :meth:`extract_text`; a page
+        is yielded once it and all pages before it have been recognised.
+        *page_numbers* (0-based) restricts OCR to those pages; numbers past
+        the end are ignored.  See :meth:`iter_ocr_pages` for *deadline*.
+        """
+        try:
+            page_count = self._page_count(source)
+        except Exception as exc:  # pragma: no cover
+            raise RuntimeError("PDF OCR failed") from exc
+
+        wanted: _t.Iterable[int] = range(page_count)
+        if page_numbers is not None:
+            wanted = [n for n in page_numbers if 0 <= n < page_count]
+        for _, text in self.iter_ocr_pages(source, wanted, executor=executor, deadline=deadline):
+            yield text
+
+    def iter_ocr_pages(
+        self,
+        source: _t.Union[str, Path, bytes],
+        page_numbers: _t.Iterable[int],
+        *,
+        executor: _t.Optional["Executor"] = None,
+        deadline: _t.Optional[float] = None,
+    ) -> _t.Iterator[tuple[int, str]]:
+        """Streaming :meth:`ocr_pages` – yield ``(page_number, text)`` in page order.
+
+        *deadline* is a :func:`time.monotonic` timestamp: once it passes,
+        queued pages are cancelled, running ones are abandoned and
+        :class:`~extracttext.errors.DeadlineExceededError` is raised.
+        """
+
+        wanted = sorted(set(page_numbers))
+        if not wanted:
+            return
+
+        try:
+            yield from in_page_order(self._iter_ocr(source, wanted, executor, deadline), wanted)
+        except DeadlineExceededError:
+            raise
+        except Exception as exc:  # pragma: no cover
+            raise RuntimeError("PDF OCR failed") from exc
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _iter_ocr(
+        self,
+        source: _t.Union[str, Path, bytes],
+        page_numbers: _t.Sequence[int],
+        executor: _t.Optional["Executor"] = None,
+        deadline: _t.Optional[float] = None,
+    ) -> _t.Iterator[tuple[int, str]]:
+        """Yield ``(page_number, text)`` pairs as OCR completes (any order).
+
+        The producer (this thread) rasterises one window at a time and blocks
+        whenever the number of pages awaiting OCR would exceed the in-flight
+        cap (see :class:`~extracttext.ocr.pipeline.OcrScheduler`), so peak
+        memory is independent of the document length.  The
+        *deadline* is checked before every window and bounds every wait.
+        Every render and every OCR batch is recorded as a span of the active
+        trace (:mod:`extracttext.instrumentation`).
         """
 
         import os
-        from concurrent.futures import ProcessPoolExecutor
-        from io import BytesIO
+        import tempfile
+
+        from extracttext.concurrency import resolve_executor
+        from extracttext.ocr import DEFAULT_ENGINE
+        from extracttext.ocr.dpi import AdaptiveDpiOptions, adaptive_dpi_enabled
+        from extracttext.ocr.preprocess import PreprocessOptions
 
         lang = os.getenv("OCR_LANG", "eng")
-        dpi = int(os.getenv("OCR_DPI", "300"))
+        adaptive = AdaptiveDpiOptions.from_env() if adaptive_dpi_enabled() else None
+        dpi = None if adaptive else int(os.getenv("OCR_DPI", "300"))
+        engine_name = os.getenv("OCR_ENGINE", DEFAULT_ENGINE)
+        preprocess = PreprocessOptions.from_env()
+        window = max(1, int(os.getenv("OCR_RENDER_WINDOW", "4")))
+        per_task = batch_size(len(page_numbers))
 
-        try:
+        with tempfile.TemporaryDirectory(prefix="extracttext_", dir=raster_dir()) as tmpdir:
             if isinstance(source, (bytes, bytearray)):
-                pages = pdf2image.convert_from_bytes(source, dpi=dpi)
+                # Persist once – poppler needs a path and we render many windows
+                path = Path(tmpdir) / "source.pdf"
+                path.write_bytes(source)
             else:
                 path = self._to_path(source)
-                pages = pdf2image.convert_from_path(str(path), dpi=dpi)
 
-            if not pages:
-                return ""
+            # Shared long-lived pool – never a per-document one
+            scheduler = OcrScheduler(
+                resolve_executor(executor),
+                lang=lang,
+                engine_name=engine_name,
+                limit=max_inflight(window),
+                deadline=deadline,
+            )
+            with scheduler:
+                for first, last in _windows(page_numbers, window):
+                    # Back-pressure: make room for the whole window before rendering
+                    yield from scheduler.reserve(last - first + 1)
 
-            # Convert each page PIL.Image to raw bytes to make them picklable
-            page_payloads: list[tuple[bytes, str]] = []
-            for p in pages:
-                if p.mode != "RGB":
-                    p = p.convert("RGB")
-                buf = BytesIO()
-                p.save(buf, format="PNG")
-                page_payloads.append((buf.getvalue(), lang))
+                    if adaptive is None:
+                        runs = [(first, last, dpi)]
+                    else:
+                        with span("dpi_probe", first_page=first + 1, last_page=last + 1):
+                            runs = self._plan_dpi(path, tmpdir, first, last, adaptive)
 
-            with ProcessPoolExecutor() as pool:
-                texts = list(pool.map(_ocr_page, page_payloads, chunksize=1))
+                    for run_first, run_last, run_dpi in runs:
+                        with span("render", first_page=run_first + 1, last_page=run_last + 1, dpi=run_dpi):
+                            raster_paths = self._render(
+                                path, run_dpi, tmpdir, first_page=run_first + 1, last_page=run_last + 1
+                            )
+                        numbers = list(range(run_first, run_last + 1))
+                        for start in range(0, len(raster_paths), per_task):
+                            # An adaptive DPI is deliberate – no downscale to OCR_TARGET_DPI
+                            scheduler.submit(
+                                raster_paths[start : start + per_task],
+                                numbers[start : start + per_task],
+                                dpi,
+                                preprocess,
+                            )
 
-            return "\f".join(t.strip() for t in texts)
-        except Exception as exc:  # pragma: no cover
-            raise RuntimeError("PDF OCR failed") from exc 
\ No newline at end of file
+                yield from scheduler.drain()
+
+    def _plan_dpi(
+        self, path: Path, tmpdir: str, first: int, last: int, options: "AdaptiveDpiOptions"
+    ) -> list[tuple[int, int, int]]:
+        """Choose a render DPI for pages *first*–*last* (0-based, inclusive).
+
+        The window is rendered once at the probe resolution; the result is a
+        list of ``(first, last, dpi)`` runs of consecutive pages sharing a DPI.
+        """
+        import os
+
+        from PIL import Image  # type: ignore
+
+        from extracttext.ocr.dpi import choose_dpi
+
+        probe_paths = self._render(path, options.probe_dpi, tmpdir, first_page=first + 1, last_page=last + 1)
+        runs: list[tuple[int, int, int]] = []
+        try:
+            for n, probe_path in zip(range(first, last + 1), probe_paths):
+                with Image.open(probe_path) as probe:
+                    dpi = choose_dpi(probe, options)
+                if runs and runs[-1][2] == dpi:
+                    runs[-1] = (runs[-1][0], n, dpi)
+                else:
+                    runs.append((n, n, dpi))
+        finally:
+            for probe_path in probe_paths:
+                try:
+                    os.remove(probe_path)
+                except OSError:
+                    pass
+        return runs
+
+    def _page_count(self, source: _t.Union[str, Path, bytes]) -> int:
+        """Return the number of pages reported by poppler's ``pdfinfo``."""
+        if isinstance(source, (bytes, bytearray)):
+            info = pdf2image.pdfinfo_from_bytes(source)
+        else:
+            info = pdf2image.pdfinfo_from_path(str(self._to_path(source)))
+        return int(info.get("Pages", 0))
+
+    def _render(self, path: Path, dpi: int, output_folder: str, **kwargs: _t.Any) -> list[str]:
+        """Rasterise *path* into *output_folder* and return the raster file paths.
+
+        poppler writes grayscale PGM files directly (no PNG codec, nothing
+        decoded in this process); *kwargs* are forwarded to `pdf2image`.
+        """
+        return pdf2image.convert_from_path(
+            str(path),
+            dpi=dpi,
+            output_folder=output_folder,
+            paths_only=True,
+            fmt="ppm",
+            grayscale=True,
+            **kwargs,
+        )
+
+
+def _contiguous_runs(numbers: _t.Sequence[int]) -> _t.Iterator[tuple[int, int]]:
+    """Yield ``(first, last)`` bounds of consecutive runs in sorted *numbers*."""
+    start = prev = numbers[0]
+    for n in numbers[1:]:
+        if n != prev + 1:
+            yield start, prev
+            start = n
+        prev = n
+    yield start, prev
+
+
+def _windows(numbers: _t.Sequence[int], size: int) -> _t.Iterator[tuple[int, int]]:
+    """Split sorted *numbers* into contiguous ``(first, last)`` runs of ≤ *size* pages."""
+    for first, last in _contiguous_runs(numbers):
+        for start in range(first, last + 1, size):
+            yield start, min(start + size - 1, last)
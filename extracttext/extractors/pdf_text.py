@@ -1,6 +1,12 @@
 """Extractor for PDF files that already contain an embedded text layer.
 
-Relies on `pdfminer.six` under the hood (implementation pending).
+Two engines are available (select via ``PDF_TEXT_ENGINE``, see
+:mod:`extracttext.poppler`):
+    • ``pdftotext`` – poppler's C++ extraction in a subprocess; several times
+      faster, output mode chosen with ``PDFTOTEXT_MODE``.
+    • ``pdfminer``  – pdfminer.six layout analysis in-process.
+The default ``auto`` uses pdftotext when poppler is installed and falls back
+to pdfminer for documents pdftotext cannot read.
 """
 
 from __future__ import annotations
@@ -8,46 +14,86 @@ from __future__ import annotations
 from pathlib import Path
 import typing as _t
 
-# Third-party library placeholder (import kept so linters know the dependency).
-import pdfminer.high_level  # type: ignore  # noqa: F401
-
+from .. import poppler
+from ..detector import KIND_PDF
 from .base_extractor import BaseExtractor, DocumentType
 
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from extracttext.detector import DocumentProbe
+
 __all__ = ["PdfTextExtractor"]
 
+#: Pages per pdftotext call when streaming pages, bounding latency and memory
+_PDFTOTEXT_CHUNK_PAGES = 32
+
+
+def _page_runs(numbers: _t.Iterable[int], limit: int) -> list[tuple[int, int]]:
+    """Group sorted 0-based *numbers* into ``(first, last)`` runs of at most *limit* pages."""
+    runs: list[list[int]] = []
+    for n in numbers:
+        if runs and n == runs[-1][1] + 1 and n - runs[-1][0] < limit:
+            runs[-1][1] = n
+        else:
+            runs.append([n, n])
+    return [(first, last) for first, last in runs]
+
 
 class PdfTextExtractor(BaseExtractor):
     """Extracts text directly from PDFs that already have a selectable layer."""
 
     DOCUMENT_TYPE = DocumentType.PDF_TEXT
+    DOCUMENT_KIND = KIND_PDF
+    EXTENSIONS = frozenset({".pdf"})
+    PAGINATED = True
 
-    def can_process(self, source: _t.Union[str, Path]) -> bool:
+    def can_process(self, source: _t.Union[str, Path, bytes], probe: _t.Optional["DocumentProbe"] = None) -> bool:
         """Accept **only** PDFs that appear to contain a selectable text layer."""
 
-        path = self._to_path(source)
-        if path.suffix.lower() != ".pdf":
+        if not self._matches(source, probe, self.EXTENSIONS):
             return False
 
-        # Light heuristic – inspect first page only
+        # Light heuristic – inspect first page only (shared probe when given)
         try:
-            from extracttext.detector import peek_pdf_has_text  # local import to avoid cycles
+            if probe is None:
+                from extracttext.detector import probe_document  # local import to avoid cycles
+
+                probe = probe_document(source)
 
-            return peek_pdf_has_text(path)
+            return bool(probe.has_text_layer)
         except Exception:
             # On any analysis failure fall back to *assuming* text layer present.
             # The heavy extraction phase will raise if this assumption is wrong.
             return True
 
     def extract_text(self, source: _t.Union[str, Path, bytes]) -> str:  # noqa: D401
-        """Return raw text from *source* using `pdfminer.six`.
+        """Return the text layer of *source*, pages separated by form-feeds.
+
+        The engine follows ``PDF_TEXT_ENGINE``; with ``auto`` a pdftotext
+        failure is retried with pdfminer.
+        """
 
-        The helper delegates to :func:`pdfminer.high_level.extract_text` which
-        handles layout analysis internally.  For in-memory bytes we wrap them
-        in a ``BytesIO`` stream so pdfminer can treat it as a file-like object.
+        setting = poppler.pdf_text_engine_setting()
+        if poppler.resolve_pdf_text_engine(setting) == "pdftotext":
+            try:
+                return poppler.pdftotext(source)
+            except Exception as exc:
+                if setting == "pdftotext":
+                    raise RuntimeError("Failed to extract text layer from PDF") from exc
+                # auto – pdfminer copes with some PDFs poppler rejects
+
+        return self._extract_pdfminer(source)
+
+    def _extract_pdfminer(self, source: _t.Union[str, Path, bytes]) -> str:
+        """pdfminer engine: :func:`pdfminer.high_level.extract_text`.
+
+        For in-memory bytes we wrap them in a ``BytesIO`` stream so pdfminer
+        can treat it as a file-like object.
         """
 
         from io import BytesIO
 
+        import pdfminer.high_level  # type: ignore
+
         try:
             if isinstance(source, (bytes, bytearray)):
                 fp = BytesIO(source)  # type: ignore[arg-type]
@@ -58,4 +104,103 @@ class PdfTextExtractor(BaseExtractor):
         except Exception as exc:  # pragma: no cover – escalate explicit failure
             raise RuntimeError("Failed to extract text layer from PDF") from exc
 
-        return text or "" 
\ No newline at end of file
+        return text or ""
+
+    def extract_pages(
+        self, source: _t.Union[str, Path, bytes], *, page_numbers: _t.Optional[_t.Iterable[int]] = None
+    ) -> list[str]:
+        """Return the text layer of *source* as one string per page.
+
+        Uses the same engine as :meth:`extract_text`, split per page, so
+        callers can tell exactly which pages carry no text layer (e.g.
+        scanned attachments).  *page_numbers* behaves as for :meth:`iter_pages`.
+        """
+        return list(self.iter_pages(source, page_numbers=page_numbers))
+
+    def iter_pages(
+        self, source: _t.Union[str, Path, bytes], *, page_numbers: _t.Optional[_t.Iterable[int]] = None
+    ) -> _t.Iterator[str]:  # noqa: D401
+        """Yield the text layer of *source* page by page.
+
+        With *page_numbers* (0-based) only those pages are extracted, in
+        document order; numbers past the end are ignored.  pdftotext runs
+        over consecutive pages in chunks of up to 32; with ``auto``, pages
+        left after a pdftotext failure come from pdfminer.
+        """
+
+        setting = poppler.pdf_text_engine_setting()
+        if poppler.resolve_pdf_text_engine(setting) == "pdfminer":
+            yield from self._iter_pages_pdfminer(source, page_numbers=page_numbers)
+            return
+
+        wanted: _t.Optional[list[int]] = None
+        done = 0
+        try:
+            count = int(poppler.pdfinfo(source)["Pages"])
+            if page_numbers is None:
+                wanted = list(range(count))
+            else:
+                wanted = sorted(n for n in set(page_numbers) if 0 <= n < count)
+            for first, last in _page_runs(wanted, _PDFTOTEXT_CHUNK_PAGES):
+                pages = poppler.split_pages(poppler.pdftotext(source, first_page=first + 1, last_page=last + 1))
+                if len(pages) != last - first + 1:
+                    raise RuntimeError(f"pdftotext returned {len(pages)} page(s) for pages {first + 1}-{last + 1}")
+                for text in pages:
+                    yield text
+                    done += 1
+            return
+        except Exception as exc:
+            if setting == "pdftotext":
+                raise RuntimeError("Failed to extract text layer from PDF") from exc
+
+        # auto – let pdfminer finish whatever pdftotext did not deliver
+        remaining = page_numbers if wanted is None else wanted[done:]
+        yield from self._iter_pages_pdfminer(source, page_numbers=remaining)
+
+    def _iter_pages_pdfminer(
+        self, source: _t.Union[str, Path, bytes], *, page_numbers: _t.Optional[_t.Iterable[int]] = None
+    ) -> _t.Iterator[str]:
+        """pdfminer engine: drain the converter after every page.
+
+        With *page_numbers* only those pages are interpreted, and parsing
+        stops after the last one.
+        """
+
+        from io import BytesIO, StringIO
+
+        from pdfminer.converter import TextConverter  # type: ignore
+        from pdfminer.layout import LAParams  # type: ignore
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager  # type: ignore
+        from pdfminer.pdfpage import PDFPage  # type: ignore
+
+        try:
+            if isinstance(source, (bytes, bytearray)):
+                fp: _t.BinaryIO = BytesIO(source)  # type: ignore[arg-type]
+            else:
+                fp = open(self._to_path(source), "rb")
+
+            with fp:
+                rsrcmgr = PDFResourceManager()
+                out = StringIO()
+                device = TextConverter(rsrcmgr, out, laparams=LAParams())
+                interpreter = PDFPageInterpreter(rsrcmgr, device)
+                wanted = None if page_numbers is None else set(page_numbers)
+                remaining = None if wanted is None else len(wanted)
+                try:
+                    if remaining == 0:
+                        return
+                    for page in PDFPage.get_pages(fp, pagenos=wanted):
+                        interpreter.process_page(page)
+                        # TextConverter terminates every page with a form-feed
+                        text = out.getvalue().rstrip("\f")
+                        out.seek(0)
+                        out.truncate()
+                        yield text
+                        if remaining is not None:
+                            remaining -= 1
+                            if not remaining:
+                                break  # never walk the rest of the page tree
+                finally:
+                    device.close()
+        except Exception as exc:  # pragma: no cover – escalate explicit failure
+            raise RuntimeError("Failed to extract text layer from PDF") from exc
@@ -0,0 +1,222 @@
+"""Lazy extractor registry.
+
+Every extractor is described by an :class:`ExtractorSpec` – document type,
+content kind, file extensions and an ``"module:Class"`` import path – so
+:class:`~extracttext.dataloader.DataLoader` can route a document without
+importing any backend.  An extractor's module (and with it pdfminer,
+pdf2image, python-docx, Pillow, …) is imported the first time the extractor
+is dispatched, which keeps ``import extracttext``, the CLI and freshly
+spawned workers cheap.
+
+Third-party extractors register through the ``extracttext.extractors``
+entry-point group, e.g. in ``pyproject.toml``::
+
+    [project.entry-points."extracttext.extractors"]
+    rtf = "extracttext_rtf:SPEC"          # an ExtractorSpec – stays lazy
+    epub = "extracttext_epub:EpubExtractor"  # a class – imported at discovery
+
+Entry points are discovered on the first dispatch (``EXTRACTTEXT_PLUGINS=0``
+disables them); :func:`register_extractor` does the same in code.
+Registered extractors are tried after the built-in ones of the same kind
+unless their *priority* is lower.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import threading
+import typing as _t
+import warnings
+from dataclasses import dataclass, field
+
+from .base_extractor import BaseExtractor, DocumentType
+
+__all__ = [
+    "ExtractorSpec",
+    "register_extractor",
+    "unregister_extractor",
+    "registered_specs",
+    "BUILTIN_SPECS",
+    "HYBRID_PDF_SPEC",
+    "ENTRY_POINT_GROUP",
+]
+
+ENTRY_POINT_GROUP = "extracttext.extractors"
+
+#: Priority of extractors registered without one – after every built-in
+DEFAULT_PRIORITY = 100
+
+_LOCK = threading.Lock()
+_INSTANCES: dict[str, BaseExtractor] = {}
+
+
+@dataclass(frozen=True)
+class ExtractorSpec:
+    """Routing facts about an extractor plus where to import it from.
+
+    *kind* is the sniffed content kind (``extracttext.detector.KIND_*``) the
+    extractor handles; *extensions* route documents whose content was not
+    recognised (empty = ask the extractor's ``can_process`` for every such
+    document).  Lower *priority* is tried first.
+    """
+
+    name: str
+    target: str  # ``"package.module:ClassName"``
+    document_type: DocumentType
+    kind: _t.Optional[str]
+    extensions: frozenset = field(default_factory=frozenset)
+    priority: int = DEFAULT_PRIORITY
+
+    @classmethod
+    def from_class(cls, extractor: _t.Type[BaseExtractor], *, priority: int = DEFAULT_PRIORITY) -> "ExtractorSpec":
+        """Spec of an already imported extractor class."""
+        return cls(
+            name=extractor.__name__,
+            target=f"{extractor.__module__}:{extractor.__qualname__}",
+            document_type=extractor.DOCUMENT_TYPE,
+            kind=getattr(extractor, "DOCUMENT_KIND", None),
+            extensions=frozenset(getattr(extractor, "EXTENSIONS", ())),
+            priority=priority,
+        )
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the extractor has been imported and instantiated already."""
+        return self.target in _INSTANCES
+
+    def load(self) -> BaseExtractor:
+        """Import the extractor (once per process) and return its shared instance."""
+        instance = _INSTANCES.get(self.target)
+        if instance is None:
+            module_name, _, class_name = self.target.partition(":")
+            extractor_cls = getattr(importlib.import_module(module_name), class_name)
+            with _LOCK:
+                instance = _INSTANCES.setdefault(self.target, extractor_cls())
+        return instance
+
+    def accepts_suffix(self, suffix: str) -> bool:
+        """Extension routing for documents whose content kind is unknown."""
+        return not self.extensions or suffix in self.extensions
+
+
+def _builtin(name: str, module: str, document_type: DocumentType, kind: str, extensions: set, priority: int) -> ExtractorSpec:
+    return ExtractorSpec(
+        name=name,
+        target=f"extracttext.extractors.{module}:{name}",
+        document_type=document_type,
+        kind=kind,
+        extensions=frozenset(extensions),
+        priority=priority,
+    )
+
+
+# Kinds mirror extracttext.detector.KIND_* (not imported: the detector pulls in more)
+#: Built-in extractors in preference order
+BUILTIN_SPECS: tuple[ExtractorSpec, ...] = (
+    _builtin("PdfTextExtractor", "pdf_text", DocumentType.PDF_TEXT, "pdf", {".pdf"}, 10),
+    _builtin("DocxExtractor", "docx", DocumentType.DOCX, "docx", {".docx"}, 20),
+    _builtin("TextExtractor", "text_file", DocumentType.TEXT, "text", {".txt", ".log", ".md"}, 30),
+    _builtin("CsvExtractor", "csv_file", DocumentType.CSV, "csv", {".csv"}, 40),
+    _builtin(
+        "ImageOcrExtractor",
+        "image_ocr",
+        DocumentType.IMAGE,
+        "image",
+        {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".gif"},
+        50,
+    ),
+    _builtin("PdfOcrExtractor", "pdf_ocr", DocumentType.PDF_IMAGE, "pdf", {".pdf"}, 60),
+)
+
+#: Per-page PDF extractor, put first by ``DataLoader(hybrid_pdf=True)``
+HYBRID_PDF_SPEC = _builtin("PdfHybridExtractor", "pdf_hybrid", DocumentType.PDF_MIXED, "pdf", {".pdf"}, 0)
+
+_REGISTERED: list[ExtractorSpec] = []
+_PLUGINS: _t.Optional[list[ExtractorSpec]] = None  # discovered lazily
+_ORDERED: _t.Optional[list[ExtractorSpec]] = None  # cache of registered_specs()
+
+
+def register_extractor(
+    extractor: _t.Union[ExtractorSpec, _t.Type[BaseExtractor]], *, priority: _t.Optional[int] = None
+) -> ExtractorSpec:
+    """Add an extractor to every :class:`DataLoader`'s dispatch.
+
+    *extractor* is a spec (imported lazily) or an extractor class.  Returns
+    the registered spec, which :func:`unregister_extractor` accepts.
+    """
+    global _ORDERED
+
+    spec = _as_spec(extractor)
+    if priority is not None:
+        spec = ExtractorSpec(spec.name, spec.target, spec.document_type, spec.kind, spec.extensions, priority)
+    if isinstance(extractor, type):
+        # Already imported – no need to import it again by path
+        _INSTANCES.setdefault(spec.target, extractor())
+    with _LOCK:
+        _REGISTERED.append(spec)
+        _ORDERED = None
+    return spec
+
+
+def unregister_extractor(spec: ExtractorSpec) -> None:
+    """Remove an extractor added with :func:`register_extractor`."""
+    global _ORDERED
+
+    with _LOCK:
+        if spec in _REGISTERED:
+            _REGISTERED.remove(spec)
+        _ORDERED = None
+
+
+def registered_specs() -> list[ExtractorSpec]:
+    """Built-in, registered and entry-point extractors in preference order."""
+    global _ORDERED
+
+    ordered = _ORDERED
+    if ordered is None:
+        plugins = _discover_plugins()
+        with _LOCK:
+            # sorted() is stable: equal priorities keep registration order
+            ordered = _ORDERED = sorted([*BUILTIN_SPECS, *_REGISTERED, *plugins], key=lambda s: s.priority)
+    return ordered
+
+
+def _as_spec(extractor: _t.Any) -> ExtractorSpec:
+    if isinstance(extractor, ExtractorSpec):
+        return extractor
+    if isinstance(extractor, type) and issubclass(extractor, BaseExtractor):
+        return ExtractorSpec.from_class(extractor)
+    raise TypeError(f"Expected an ExtractorSpec or a BaseExtractor subclass, got {extractor!r}")
+
+
+def _discover_plugins() -> list[ExtractorSpec]:
+    """Specs from the ``extracttext.extractors`` entry points (looked up once)."""
+    global _PLUGINS
+
+    if _PLUGINS is not None:
+        return _PLUGINS
+    if os.getenv("EXTRACTTEXT_PLUGINS", "1").lower() in {"0", "false", "no", "off"}:
+        _PLUGINS = []
+        return _PLUGINS
+
+    from importlib.metadata import entry_points
+
+    try:
+        found = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:  # pragma: no cover – Python 3.9 returns a dict
+        found = entry_points().get(ENTRY_POINT_GROUP, [])  # type: ignore[attr-defined]
+
+    plugins = []
+    for entry_point in found:
+        try:
+            extractor = entry_point.load()
+            spec = _as_spec(extractor)
+            if isinstance(extractor, type):
+                _INSTANCES.setdefault(spec.target, extractor())
+        except Exception as exc:
+            # A broken plugin must not take the built-in extractors down
+            warnings.warn(f"Skipping extractor plugin {entry_point.name!r}: {exc}", RuntimeWarning, stacklevel=2)
+            continue
+        plugins.append(spec)
+    _PLUGINS = plugins
+    return plugins
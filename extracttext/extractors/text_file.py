@@ -4,41 +4,38 @@ from __future__ import annotations
 
 from pathlib import Path
 import typing as _t
-import chardet  # type: ignore  # noqa: F401
 
+from ..detector import KIND_TEXT
+from ..encoding import iter_decoded, iter_line_chunks
 from .base_extractor import BaseExtractor, DocumentType
 
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from extracttext.detector import DocumentProbe
+
 __all__ = ["TextExtractor"]
 
 
 class TextExtractor(BaseExtractor):
     DOCUMENT_TYPE = DocumentType.TEXT
+    DOCUMENT_KIND = KIND_TEXT
+    EXTENSIONS = frozenset({".txt", ".log", ".md"})
 
-    _VALID_EXT = {".txt", ".log", ".md"}
-
-    def can_process(self, source: _t.Union[str, Path]) -> bool:
-        return Path(source).suffix.lower() in self._VALID_EXT
+    def can_process(self, source: _t.Union[str, Path, bytes], probe: _t.Optional["DocumentProbe"] = None) -> bool:
+        return self._matches(source, probe, self.EXTENSIONS)
 
     def extract_text(self, source: _t.Union[str, Path, bytes]) -> str:  # noqa: D401
-        # Accept bytes or on-disk file; decode using chardet when encoding unknown.
-
-        # If *source* is bytes directly, work with it; else read file content to bytes
-        if isinstance(source, (bytes, bytearray)):
-            raw: bytes = source  # type: ignore[assignment]
-        else:
-            path = self._to_path(source)
-            with open(path, "rb") as fh:
-                raw = fh.read()
-
-        if not raw:
-            return ""  # empty file yields empty string
-
-        # Attempt to detect encoding via chardet; fall back to UTF-8 with replacement
-        detected = chardet.detect(raw)
-        encoding = (detected.get("encoding") or "utf-8").strip()
-
-        try:
-            return raw.decode(encoding)
-        except Exception:
-            # As last resort decode as UTF-8 with replacement chars
-            return raw.decode("utf-8", errors="replace") 
\ No newline at end of file
+        # Accept bytes or on-disk file.  BOM / strict UTF-8 first, chardet only
+        # on a bounded sample, then chunked decoding (see extracttext.encoding).
+        if not isinstance(source, (bytes, bytearray)):
+            source = self._to_path(source)
+        return "".join(iter_decoded(source))
+
+    def iter_pages(self, source: _t.Union[str, Path, bytes]) -> _t.Iterator[str]:  # noqa: D401
+        """Yield the text in roughly chunk-sized pieces split on line boundaries.
+
+        Memory stays constant regardless of file size, so multi-GB logs can be
+        streamed through :meth:`~extracttext.dataloader.DataLoader.iter_text`.
+        """
+        if not isinstance(source, (bytes, bytearray)):
+            source = self._to_path(source)
+        return iter_line_chunks(source)
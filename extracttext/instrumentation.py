@@ -0,0 +1,178 @@
+"""Per-stage timing spans for the extraction pipeline.
+
+Every :meth:`DataLoader.load` can be traced: it is split into *spans* –
+``normalise`` (source → path / buffer), ``cache``, ``probe``, one
+``extract`` span per attempted extractor (failures included) and, for OCR,
+``render`` / ``dpi_probe`` spans per page window and ``ocr`` spans per
+recognised batch of pages.  The whole call is the final ``load`` span.
+
+Spans reach you two ways:
+
+* ``load(..., trace=True)`` attaches them to
+  :attr:`ExtractionResult.spans <extracttext.dataloader.ExtractionResult.spans>`;
+* hooks – callables ``hook(span, trace)`` registered globally with
+  :func:`add_hook` or per loader via ``DataLoader(hooks=[...])`` – are called
+  as each span finishes.  The ``load`` span always comes last, so a hook can
+  look at the complete :attr:`Trace.spans` then (see
+  :mod:`extracttext.server.metrics`).
+
+Without hooks and ``trace=True`` nothing is recorded and :func:`span` is a
+no-op.  OCR timings are measured inside the worker processes (see
+:func:`timed`) and recorded by the thread that collects their results.
+"""
+from __future__ import annotations
+
+import threading
+import typing as _t
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+
+__all__ = [
+    "Span",
+    "SpanHook",
+    "Trace",
+    "add_hook",
+    "remove_hook",
+    "span",
+    "record_span",
+    "timed",
+    "tracing_enabled",
+]
+
+
+@dataclass
+class Span:
+    """One timed stage of a traced call."""
+
+    name: str
+    start_ms: float  # offset from the start of the trace
+    duration_ms: float
+    attrs: dict = field(default_factory=dict)
+    error: _t.Optional[str] = None  # ``"ExceptionType: message"`` when the stage failed
+
+    def dict(self) -> dict:
+        return asdict(self)
+
+
+#: ``hook(span, trace)`` – called whenever a span finishes
+SpanHook = _t.Callable[[Span, "Trace"], None]
+
+_HOOKS: list[SpanHook] = []
+_CURRENT: ContextVar[_t.Optional["Trace"]] = ContextVar("extracttext_trace", default=None)
+
+
+def add_hook(hook: SpanHook) -> None:
+    """Call *hook* for the spans of every traced call in this process."""
+    if hook not in _HOOKS:
+        _HOOKS.append(hook)
+
+
+def remove_hook(hook: SpanHook) -> None:
+    """Unregister a hook added with :func:`add_hook` (missing hooks are ignored)."""
+    try:
+        _HOOKS.remove(hook)
+    except ValueError:
+        pass
+
+
+def _describe(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+class Trace:
+    """Collects the spans of one traced call and forwards them to hooks."""
+
+    def __init__(self, hooks: _t.Iterable[SpanHook] = ()):
+        self.trace_id = uuid.uuid4().hex
+        self.spans: list[Span] = []
+        self._hooks = [*_HOOKS, *hooks]
+        self._origin = perf_counter()
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        *,
+        error: _t.Optional[str] = None,
+        **attrs: _t.Any,
+    ) -> Span:
+        """Add a finished span; *start* / *end* are :func:`time.perf_counter` values."""
+        item = Span(
+            name=name,
+            start_ms=round((start - self._origin) * 1000, 3),
+            duration_ms=round((end - start) * 1000, 3),
+            attrs=attrs,
+            error=error,
+        )
+        with self._lock:
+            self.spans.append(item)
+        for hook in self._hooks:
+            try:
+                hook(item, self)
+            except Exception:
+                # Instrumentation must never break an extraction
+                pass
+        return item
+
+    @contextmanager
+    def span(self, name: str, **attrs: _t.Any) -> _t.Iterator[dict]:
+        """Time the ``with`` block as span *name*.
+
+        Yields the mutable *attrs* dict so the block can add facts it learns
+        (e.g. the detected kind).  An exception marks the span as failed and
+        propagates; closing a generator early (``GeneratorExit``) does not.
+        """
+        start = perf_counter()
+        error = None
+        try:
+            yield attrs
+        except Exception as exc:
+            error = _describe(exc)
+            raise
+        finally:
+            self.record(name, start, perf_counter(), error=error, **attrs)
+
+    @contextmanager
+    def activate(self) -> _t.Iterator["Trace"]:
+        """Make this the trace that :func:`span` / :func:`record_span` record into."""
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+
+
+def tracing_enabled(hooks: _t.Sequence[SpanHook] = ()) -> bool:
+    """Whether a call with per-loader *hooks* has anyone listening."""
+    return bool(hooks or _HOOKS)
+
+
+@contextmanager
+def span(name: str, **attrs: _t.Any) -> _t.Iterator[dict]:
+    """:meth:`Trace.span` on the active trace; a no-op when nothing is traced."""
+    trace = _CURRENT.get()
+    if trace is None:
+        yield attrs
+        return
+    with trace.span(name, **attrs) as live:
+        yield live
+
+
+def record_span(name: str, seconds: float, **attrs: _t.Any) -> None:
+    """Record a stage that took *seconds* and just finished (e.g. in a worker)."""
+    trace = _CURRENT.get()
+    if trace is not None:
+        end = perf_counter()
+        trace.record(name, end - seconds, end, **attrs)
+
+
+def timed(func: _t.Callable[..., _t.Any], *args: _t.Any) -> tuple[_t.Any, float]:
+    """Pool task wrapper: ``(func(*args), seconds)`` measured in the worker."""
+    start = perf_counter()
+    result = func(*args)
+    return result, perf_counter() - start
@@ -0,0 +1,152 @@
+"""Pluggable OCR engine layer.
+
+All OCR extractors go through an :class:`OcrEngine` instead of calling
+`pytesseract` directly, so the backend can be swapped without touching the
+extraction pipelines.
+
+Available backends (select via ``OCR_ENGINE`` or :func:`get_engine`):
+    • ``tesseract``       – one tesseract process per image (via pytesseract).
+    • ``tesseract-batch`` – one tesseract process per *batch* of images using a
+      list file; the language model is loaded once per batch.  Falls back to
+      per-image calls if the combined output cannot be split reliably.
+"""
+from __future__ import annotations
+
+import abc
+import os
+import subprocess
+import tempfile
+import typing as _t
+from pathlib import Path
+
+from ..errors import OcrEngineNotFoundError
+from .options import DEFAULT_ENGINE
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from PIL import Image
+
+__all__ = [
+    "OcrEngine",
+    "TesseractEngine",
+    "BatchTesseractEngine",
+    "get_engine",
+    "DEFAULT_ENGINE",
+]
+
+#: Image input accepted by engines – a path on disk or a PIL image
+ImageInput = _t.Union[str, Path, "Image.Image"]
+
+
+class OcrEngine(abc.ABC):
+    """Abstract OCR backend."""
+
+    #: Registry name used by :func:`get_engine` / ``OCR_ENGINE``
+    NAME: str
+
+    @abc.abstractmethod
+    def image_to_string(self, image: ImageInput, lang: str = "eng") -> str:  # noqa: D401
+        """Return the text recognised in a single *image*."""
+
+    def images_to_strings(self, images: _t.Sequence[ImageInput], lang: str = "eng") -> list[str]:
+        """Return one text per entry of *images*, in order.
+
+        The default implementation simply loops over :meth:`image_to_string`;
+        batching backends override it.
+        """
+        return [self.image_to_string(img, lang=lang) for img in images]
+
+
+class TesseractEngine(OcrEngine):
+    """Per-image Tesseract backend (the historical behaviour)."""
+
+    NAME = "tesseract"
+
+    def image_to_string(self, image: ImageInput, lang: str = "eng") -> str:  # noqa: D401
+        import pytesseract  # type: ignore
+
+        if isinstance(image, Path):
+            image = str(image)
+        try:
+            # String paths are handed to the CLI untouched (no re-encode)
+            return pytesseract.image_to_string(image, lang=lang)
+        except pytesseract.TesseractNotFoundError as exc:
+            raise OcrEngineNotFoundError("tesseract binary not found") from exc
+
+
+class BatchTesseractEngine(TesseractEngine):
+    """Run a whole batch of images through a single tesseract invocation.
+
+    Tesseract accepts a text file listing image paths and renders every image
+    as one page of the output, separated by ``page_separator`` (form-feed by
+    default).  PIL images are written to a temporary directory first; paths
+    are used as-is.
+    """
+
+    NAME = "tesseract-batch"
+
+    def images_to_strings(self, images: _t.Sequence[ImageInput], lang: str = "eng") -> list[str]:
+        if len(images) <= 1:
+            return [self.image_to_string(img, lang=lang) for img in images]
+
+        import pytesseract  # type: ignore
+
+        with tempfile.TemporaryDirectory(prefix="extracttext_ocr_") as tmpdir:
+            paths: list[str] = []
+            for n, img in enumerate(images):
+                if isinstance(img, (str, Path)):
+                    paths.append(str(img))
+                else:
+                    target = os.path.join(tmpdir, f"{n:05d}.png")
+                    img.save(target)
+                    paths.append(target)
+
+            list_file = os.path.join(tmpdir, "images.txt")
+            with open(list_file, "w", encoding="utf-8") as fh:
+                fh.write("\n".join(paths) + "\n")
+
+            cmd = [pytesseract.pytesseract.tesseract_cmd, list_file, "stdout", "-l", lang]
+            try:
+                proc = subprocess.run(cmd, capture_output=True, check=False)
+            except FileNotFoundError as exc:
+                raise OcrEngineNotFoundError("tesseract binary not found") from exc
+
+            if proc.returncode == 0:
+                texts = _split_pages(proc.stdout.decode("utf-8", errors="replace"), len(paths))
+                if texts is not None:
+                    return texts
+
+            # Unexpected output shape or failure – degrade to one call per image
+            return [self.image_to_string(p, lang=lang) for p in paths]
+
+
+def _split_pages(output: str, expected: int) -> _t.Optional[list[str]]:
+    """Split combined tesseract output into *expected* page texts.
+
+    Tesseract 4 appends the separator after every page while Tesseract 5 only
+    inserts it between pages; both shapes are accepted.  Returns ``None`` when
+    the page count does not match.
+    """
+    parts = output.split("\f")
+    if len(parts) == expected + 1 and not parts[-1].strip():
+        parts = parts[:-1]
+    if len(parts) != expected:
+        return None
+    return parts
+
+
+_ENGINES: dict[str, type[OcrEngine]] = {
+    TesseractEngine.NAME: TesseractEngine,
+    BatchTesseractEngine.NAME: BatchTesseractEngine,
+}
+
+
+def get_engine(name: _t.Optional[str] = None) -> OcrEngine:
+    """Return the OCR engine called *name* (defaults to ``OCR_ENGINE`` env var).
+
+    Raises ``ValueError`` for unknown engine names.
+    """
+    name = name or os.getenv("OCR_ENGINE", DEFAULT_ENGINE)
+    try:
+        return _ENGINES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown OCR engine {name!r}; expected one of {sorted(_ENGINES)}") from None
@@ -0,0 +1,100 @@
+"""Per-page render resolution for PDF OCR (``OCR_DPI=auto``).
+
+A fixed 300 DPI over-renders large type and large-format pages (Tesseract's
+cost grows with the pixel count) and under-renders small print.  In *auto*
+mode each page is first rendered at a cheap probe resolution; the height of
+its text lines is estimated from the row-ink profile and the page is then
+rendered at the DPI that puts lines at :attr:`AdaptiveDpiOptions.target_text_px`
+pixels – Tesseract's sweet spot – within ``[min_dpi, max_dpi]``.  Finally the
+page dimensions cap the DPI so one raster never exceeds ``max_page_pixels``
+(this cap wins over ``min_dpi``, which matters for large-format drawings).
+
+Settings come from :meth:`AdaptiveDpiOptions.from_env`:
+    • ``OCR_DPI``             – ``auto`` enables the mode (numeric = fixed DPI).
+    • ``OCR_DPI_MIN`` / ``OCR_DPI_MAX`` – caps (default 150 / 400).
+    • ``OCR_DPI_PROBE``       – probe render resolution (default 72).
+    • ``OCR_TARGET_TEXT_PX``  – text-line height aimed for (default 40 px,
+      i.e. ~300 DPI for 11 pt body text).
+    • ``OCR_MAX_PAGE_PIXELS`` – per-page pixel budget (default 16 MP).
+"""
+from __future__ import annotations
+
+import statistics
+import typing as _t
+
+from PIL import Image  # type: ignore
+
+from .options import AdaptiveDpiOptions, adaptive_dpi_enabled
+from .preprocess import otsu_threshold
+
+__all__ = [
+    "AdaptiveDpiOptions",
+    "adaptive_dpi_enabled",
+    "estimate_line_height",
+    "choose_dpi",
+]
+
+#: Chosen resolutions are rounded down to a multiple of this, so neighbouring
+#: pages usually share a DPI and can be rendered in one poppler call.
+DPI_STEP = 25
+
+# Row-profile heuristics (probe resolution)
+_MIN_INK_LEVEL = 2  # mean ink per row (0–255) below which a row counts as blank
+_MIN_LINES = 3  # fewer text lines → no reliable estimate
+_MAX_INK_ROWS = 0.85  # photos / noisy scans ink almost every row
+
+
+def estimate_line_height(img: "Image.Image") -> _t.Optional[float]:
+    """Return the median text-line height of *img* in pixels, or ``None``.
+
+    The page is Otsu-thresholded and squashed to a single column (box
+    filter), which yields the ink fraction of every row without NumPy.  Runs
+    of inked rows are text lines; one-pixel rules and runs taller than an
+    eighth of the page (figures) are ignored.
+    """
+    gray = img if img.mode == "L" else img.convert("L")
+    if gray.height < 2:
+        return None
+    threshold = otsu_threshold(gray.histogram())
+    ink = gray.point([255 if level <= threshold else 0 for level in range(256)])
+    profile = ink.resize((1, ink.height), Image.Resampling.BOX).tobytes()
+
+    inked = [level >= _MIN_INK_LEVEL for level in profile]
+    if sum(inked) > _MAX_INK_ROWS * len(inked):
+        return None
+
+    runs: list[int] = []
+    length = 0
+    for row in inked + [False]:
+        if row:
+            length += 1
+        elif length:
+            runs.append(length)
+            length = 0
+
+    tallest = gray.height / 8
+    lines = [run for run in runs if 2 <= run <= tallest]
+    if len(lines) < _MIN_LINES:
+        return None
+    return float(statistics.median(lines))
+
+
+def choose_dpi(probe: "Image.Image", options: _t.Optional[AdaptiveDpiOptions] = None) -> int:
+    """Return the render DPI for the page whose probe raster is *probe*.
+
+    *probe* must have been rendered at ``options.probe_dpi``.
+    """
+    options = options or AdaptiveDpiOptions.from_env()
+    line_height = estimate_line_height(probe)
+    if line_height is None:
+        dpi = float(options.fallback_dpi)
+    else:
+        dpi = options.target_text_px * options.probe_dpi / line_height
+    dpi = min(max(dpi, options.min_dpi), options.max_dpi)
+
+    # Page-size budget: width × height (inches) × dpi² ≤ max_page_pixels
+    area = (probe.width / options.probe_dpi) * (probe.height / options.probe_dpi)
+    if area and options.max_page_pixels:
+        dpi = min(dpi, (options.max_page_pixels / area) ** 0.5)
+
+    return max(DPI_STEP, int(dpi) // DPI_STEP * DPI_STEP)
@@ -0,0 +1,70 @@
+"""Environment-driven OCR settings, free of imaging dependencies.
+
+Kept apart from :mod:`extracttext.ocr.preprocess` and
+:mod:`extracttext.ocr.dpi` (which import Pillow) so that the result-cache key
+can read them without loading the OCR stack.  Both modules re-export their
+options class.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+__all__ = [
+    "DEFAULT_ENGINE",
+    "PreprocessOptions",
+    "AdaptiveDpiOptions",
+    "adaptive_dpi_enabled",
+]
+
+DEFAULT_ENGINE = "tesseract-batch"
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() not in ("0", "false", "no", "off", "")
+
+
+@dataclass(frozen=True)
+class PreprocessOptions:
+    """Knobs of the pre-OCR stage (see :mod:`extracttext.ocr.preprocess`)."""
+
+    enabled: bool = True
+    target_dpi: int = 300
+    max_side: int = 3300
+    grayscale: bool = True
+    binarize: bool = False
+
+    @classmethod
+    def from_env(cls) -> "PreprocessOptions":
+        return cls(
+            enabled=_env_flag("OCR_PREPROCESS", "1"),
+            target_dpi=int(os.getenv("OCR_TARGET_DPI", "300")),
+            max_side=int(os.getenv("OCR_MAX_SIDE", "3300")),
+            binarize=_env_flag("OCR_BINARIZE", "0"),
+        )
+
+
+@dataclass(frozen=True)
+class AdaptiveDpiOptions:
+    """Knobs of the per-page DPI selection (see :mod:`extracttext.ocr.dpi`)."""
+
+    min_dpi: int = 150
+    max_dpi: int = 400
+    probe_dpi: int = 72
+    target_text_px: int = 40
+    max_page_pixels: int = 16_000_000
+    fallback_dpi: int = 300
+
+    @classmethod
+    def from_env(cls) -> "AdaptiveDpiOptions":
+        return cls(
+            min_dpi=int(os.getenv("OCR_DPI_MIN", "150")),
+            max_dpi=int(os.getenv("OCR_DPI_MAX", "400")),
+            probe_dpi=int(os.getenv("OCR_DPI_PROBE", "72")),
+            target_text_px=int(os.getenv("OCR_TARGET_TEXT_PX", "40")),
+            max_page_pixels=int(os.getenv("OCR_MAX_PAGE_PIXELS", "16000000")),
+        )
+
+
+def adaptive_dpi_enabled() -> bool:
+    return os.getenv("OCR_DPI", "300").strip().lower() == "auto"
@@ -0,0 +1,184 @@
+"""Bounded OCR scheduling shared by the PDF and multi-frame image extractors.
+
+Both extractors produce page rasters in the calling thread and hand their
+*paths* to the worker pool in batches.  :class:`OcrScheduler` keeps at most
+``OCR_MAX_INFLIGHT`` rasters alive, enforces the caller's deadline on every
+wait and, on early exit, cancels queued batches.  Nothing here imports
+pdf2image, so plain image OCR does not pay for it.
+"""
+from __future__ import annotations
+
+import math
+import os
+import time
+import typing as _t
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from ..errors import DeadlineExceededError
+from ..instrumentation import record_span, timed
+from ..profiling import profiled
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor, Future
+
+    from .options import PreprocessOptions
+
+__all__ = [
+    "OcrScheduler",
+    "batch_size",
+    "in_page_order",
+    "max_inflight",
+    "ocr_batch",
+    "raster_dir",
+]
+
+
+def ocr_batch(paths_lang_engine: tuple[list[str], str, str, _t.Optional[int], "PreprocessOptions"]) -> list[str]:
+    """Run OCR on a batch of page rasters rendered to *paths* at *dpi*.
+
+    *dpi* is ``None`` for adaptively chosen resolutions (``OCR_DPI=auto``)
+    and for rasters the caller already normalised, which the pre-OCR stage
+    then leaves alone.
+
+    Paths are handed to the OCR engine untouched (no decode/re-encode in
+    Python) unless the pre-OCR stage still has work to do, e.g. binarisation;
+    batching engines process the whole batch with one model load.  Rasters
+    are removed as soon as they have been read, keeping the scratch
+    directory small.
+    """
+
+    from extracttext.ocr import get_engine  # local import inside process
+    from extracttext.ocr.preprocess import preprocess_file
+
+    paths, lang, engine_name, dpi, options = paths_lang_engine
+    try:
+        for img_path in paths:
+            preprocess_file(img_path, options, dpi=dpi)
+        return [t.strip() for t in get_engine(engine_name).images_to_strings(paths, lang=lang)]
+    finally:
+        for img_path in paths:
+            try:
+                os.remove(img_path)
+            except OSError:
+                pass
+
+
+def raster_dir() -> _t.Optional[str]:
+    """Return the scratch directory for page rasters.
+
+    ``OCR_RASTER_DIR`` wins when set; otherwise RAM-backed ``/dev/shm`` is used
+    if writable, falling back to the platform temp directory.
+    """
+    override = os.getenv("OCR_RASTER_DIR")
+    if override:
+        return override
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+def max_inflight(minimum: int = 1) -> int:
+    """``OCR_MAX_INFLIGHT`` (default ``2 × cpu_count``), at least *minimum*."""
+    return max(minimum, int(os.getenv("OCR_MAX_INFLIGHT", str(2 * (os.cpu_count() or 1)))))
+
+
+def batch_size(page_count: int) -> int:
+    """Pages per OCR task for a document of *page_count* pages.
+
+    Large batches amortise model loading (``OCR_BATCH_SIZE``, default 4);
+    small documents still spread across every worker rather than queueing
+    behind one batch.
+    """
+    cpus = os.cpu_count() or 1
+    return max(1, min(int(os.getenv("OCR_BATCH_SIZE", "4")), math.ceil(max(1, page_count) / cpus)))
+
+
+def in_page_order(
+    pairs: _t.Iterable[tuple[int, str]], page_numbers: _t.Sequence[int]
+) -> _t.Iterator[tuple[int, str]]:
+    """Re-order completion-order *pairs* into *page_numbers* order.
+
+    Only pages that finished ahead of an earlier one are buffered, which the
+    in-flight cap of the OCR pipeline keeps small.
+    """
+    buffered: dict[int, str] = {}
+    order = iter(page_numbers)
+    expected = next(order, None)
+    for n, text in pairs:
+        buffered[n] = text
+        while expected is not None and expected in buffered:
+            yield expected, buffered.pop(expected)
+            expected = next(order, None)
+
+
+class OcrScheduler:
+    """Submit raster batches to *executor* with a bounded number in flight.
+
+    Use as a context manager; :meth:`reserve` and :meth:`drain` yield
+    ``(page_number, text)`` pairs as batches complete (any order).  Every
+    finished batch is recorded as an ``ocr`` span of the active trace.
+    """
+
+    def __init__(
+        self,
+        executor: "Executor",
+        *,
+        lang: str,
+        engine_name: str,
+        limit: int,
+        deadline: _t.Optional[float] = None,
+    ) -> None:
+        self._pool = executor
+        self._lang = lang
+        self._engine_name = engine_name
+        self._limit = limit
+        self._deadline = deadline
+        self._pending: dict["Future", list[int]] = {}  # future -> page numbers of its batch
+        self.inflight = 0
+
+    def remaining(self) -> _t.Optional[float]:
+        """Seconds left before the deadline; raises once it has passed."""
+        if self._deadline is None:
+            return None
+        left = self._deadline - time.monotonic()
+        if left <= 0:
+            raise DeadlineExceededError(f"OCR deadline exceeded with {self.inflight} page(s) pending")
+        return left
+
+    def reserve(self, count: int) -> _t.Iterator[tuple[int, str]]:
+        """Wait until *count* more rasters fit under the cap, then check the deadline."""
+        yield from self._drain_to(max(0, self._limit - count))
+        self.remaining()
+
+    def submit(
+        self, paths: list[str], numbers: list[int], dpi: _t.Optional[int], preprocess: "PreprocessOptions"
+    ) -> None:
+        """Queue one OCR task for the rasters *paths* of pages *numbers*."""
+        payload = (paths, self._lang, self._engine_name, dpi, preprocess)
+        self._pending[self._pool.submit(timed, profiled(ocr_batch), payload)] = numbers
+        self.inflight += len(paths)
+
+    def drain(self) -> _t.Iterator[tuple[int, str]]:
+        """Yield the remaining results."""
+        yield from self._drain_to(0)
+
+    def _drain_to(self, limit: int) -> _t.Iterator[tuple[int, str]]:
+        while self.inflight > limit:
+            done, _ = wait(self._pending, timeout=self.remaining(), return_when=FIRST_COMPLETED)
+            for fut in done:
+                numbers = self._pending.pop(fut)
+                self.inflight -= len(numbers)
+                texts, seconds = fut.result()
+                record_span("ocr", seconds, pages=[n + 1 for n in numbers], engine=self._engine_name)
+                yield from zip(numbers, texts)
+
+    def __enter__(self) -> "OcrScheduler":
+        return self
+
+    def __exit__(self, *exc_info: _t.Any) -> None:
+        # Early exit / failure: drop queued pages, let running ones
+        # finish – unless the deadline passed, then abandon them too
+        for fut in self._pending:
+            fut.cancel()
+        if self._deadline is None or time.monotonic() < self._deadline:
+            wait(self._pending)
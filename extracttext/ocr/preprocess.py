@@ -0,0 +1,157 @@
+"""Image normalisation applied before OCR.
+
+Tesseract's runtime grows with the pixel count, yet it needs only ~300 DPI
+grayscale input.  :func:`prepare_image` therefore
+
+    1. lets the JPEG decoder produce a reduced image directly (*draft* mode,
+       1/2 – 1/8 scale) instead of decoding every pixel,
+    2. downscales to the target resolution – by DPI metadata when the image
+       carries it, otherwise by capping the longest side,
+    3. converts to 8-bit grayscale,
+    4. optionally binarises with an Otsu threshold (vectorised with NumPy when
+       it is installed, a Pillow lookup table otherwise).
+
+Images are never upscaled.  Settings come from :meth:`PreprocessOptions.from_env`:
+    • ``OCR_PREPROCESS`` – ``0`` disables the stage (legacy RGB hand-off).
+    • ``OCR_TARGET_DPI`` – resolution images are reduced to (default 300).
+    • ``OCR_MAX_SIDE``   – longest side in pixels for images without usable
+      DPI metadata, e.g. phone photos (default 3300 ≈ A4 at 280 DPI).
+    • ``OCR_BINARIZE``   – ``1`` enables Otsu binarisation (default off).
+"""
+from __future__ import annotations
+
+import typing as _t
+
+from PIL import Image  # type: ignore
+
+from .options import PreprocessOptions
+
+try:  # Optional dependency – vectorised binarisation
+    import numpy as _np  # type: ignore
+except Exception:  # pragma: no cover – treat *any* failure as unavailable
+    _np = None
+
+__all__ = [
+    "PreprocessOptions",
+    "prepare_image",
+    "preprocess_file",
+    "otsu_threshold",
+]
+
+
+def _scale_for(size: tuple[int, int], dpi: _t.Optional[float], options: PreprocessOptions) -> float:
+    """Downscale factor (≤ 1) bringing an image of *size* / *dpi* to the target."""
+    if dpi and dpi >= options.target_dpi:
+        return options.target_dpi / dpi
+    if options.max_side and max(size) > options.max_side:
+        # No trustworthy resolution metadata (phone photos say 72) – pixel budget
+        return options.max_side / max(size)
+    return 1.0
+
+
+def _image_dpi(img: "Image.Image") -> _t.Optional[float]:
+    dpi = img.info.get("dpi")
+    if not dpi:
+        return None
+    try:
+        return float(max(dpi))
+    except (TypeError, ValueError):
+        return None
+
+
+def prepare_image(
+    img: "Image.Image", options: _t.Optional[PreprocessOptions] = None, *, dpi: _t.Optional[float] = None
+) -> "Image.Image":
+    """Return *img* normalised for OCR according to *options*.
+
+    *dpi* overrides the image's own resolution metadata (e.g. the render DPI
+    of a PDF page).  Must be called before the image data is loaded for the
+    JPEG draft shortcut to apply.
+    """
+    options = options or PreprocessOptions.from_env()
+    if not options.enabled:
+        return img if img.mode == "RGB" else img.convert("RGB")
+
+    dpi = dpi or _image_dpi(img)
+    scale = _scale_for(img.size, dpi, options)
+    target = (max(1, round(img.size[0] * scale)), max(1, round(img.size[1] * scale)))
+
+    if img.format == "JPEG" and (scale < 1.0 or options.grayscale):
+        # Decoder-level reduction: never smaller than *target*, so quality holds
+        img.draft("L" if options.grayscale else "RGB", target)
+
+    if options.grayscale and img.mode != "L":
+        img = img.convert("L")
+    elif not options.grayscale and img.mode != "RGB":
+        img = img.convert("RGB")
+
+    if img.size[0] > target[0]:
+        img = img.resize(target, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+    if options.binarize:
+        gray = img if img.mode == "L" else img.convert("L")
+        img = _binarize(gray)
+
+    return img
+
+
+def otsu_threshold(histogram: _t.Sequence[int]) -> int:
+    """Return the Otsu threshold for a 256-bin grayscale *histogram*."""
+    if _np is not None:
+        hist = _np.asarray(histogram[:256], dtype=_np.float64)
+        levels = _np.arange(256, dtype=_np.float64)
+        weight_bg = _np.cumsum(hist)
+        weight_fg = weight_bg[-1] - weight_bg
+        mass_bg = _np.cumsum(hist * levels)
+        mean_bg = mass_bg / _np.maximum(weight_bg, 1)
+        mean_fg = (mass_bg[-1] - mass_bg) / _np.maximum(weight_fg, 1)
+        between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        return int(_np.argmax(between))
+
+    total = sum(histogram[:256])
+    total_mass = sum(i * h for i, h in enumerate(histogram[:256]))
+    weight_bg = mass_bg = 0
+    best, best_between = 0, -1.0
+    for level in range(256):
+        weight_bg += histogram[level]
+        if not weight_bg:
+            continue
+        weight_fg = total - weight_bg
+        if not weight_fg:
+            break
+        mass_bg += level * histogram[level]
+        mean_bg = mass_bg / weight_bg
+        mean_fg = (total_mass - mass_bg) / weight_fg
+        between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if between > best_between:
+            best, best_between = level, between
+    return best
+
+
+def _binarize(gray: "Image.Image") -> "Image.Image":
+    """Otsu-binarise an ``L`` image to pure black/white (still mode ``L``)."""
+    threshold = otsu_threshold(gray.histogram())
+    if _np is not None:
+        arr = _np.asarray(gray)
+        return Image.fromarray(_np.where(arr > threshold, 255, 0).astype(_np.uint8), mode="L")
+    lut = [255 if level > threshold else 0 for level in range(256)]
+    return gray.point(lut)
+
+
+def preprocess_file(path: str, options: _t.Optional[PreprocessOptions] = None, *, dpi: _t.Optional[float] = None) -> None:
+    """Apply :func:`prepare_image` to the raster at *path* in place.
+
+    Used for PDF page rasters, which poppler already renders as grayscale at
+    the requested DPI: the file is only decoded when there is work left
+    (binarisation, or a render DPI above the target).
+    """
+    options = options or PreprocessOptions.from_env()
+    if not options.enabled:
+        return
+    needs_downscale = dpi is not None and dpi > options.target_dpi
+    if not (options.binarize or needs_downscale):
+        return
+
+    with Image.open(path) as img:
+        img.load()
+        prepare_image(img, options, dpi=dpi).save(path, format=img.format)
@@ -0,0 +1,133 @@
+"""Poppler's command-line tools as a fast PDF text backend.
+
+``pdftotext`` runs poppler's C++ text extraction in a subprocess – several
+times faster than pdfminer's pure-Python layout analysis – and ``pdfinfo``
+reads page count, producer and encryption without parsing the PDF in
+Python.  Both ship with ``poppler-utils``, which pdf2image needs anyway.
+
+The PDF text engine is chosen with ``PDF_TEXT_ENGINE``:
+    • ``auto``      – (default) ``pdftotext`` when it is on ``PATH``, else
+      ``pdfminer``; a document pdftotext fails on is retried with pdfminer.
+    • ``pdftotext`` – poppler only; failures are errors.
+    • ``pdfminer``  – pdfminer.six only (the historical behaviour).
+
+``PDFTOTEXT_MODE`` selects pdftotext's output mode:
+    • ``reading`` – (default) reading order, comparable to pdfminer's output.
+    • ``layout``  – keep the physical layout (columns, table alignment).
+    • ``raw``     – content-stream order; fastest, but columns may interleave.
+
+Like pdfminer, pdftotext ends every page with a form-feed, so whole-document
+text has the same shape whichever engine produced it.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import typing as _t
+from pathlib import Path
+
+__all__ = [
+    "pdf_text_engine_setting",
+    "resolve_pdf_text_engine",
+    "pdftotext_mode",
+    "pdftotext_available",
+    "pdftotext",
+    "pdfinfo",
+    "split_pages",
+    "DEFAULT_PDF_TEXT_ENGINE",
+    "DEFAULT_PDFTOTEXT_MODE",
+]
+
+DEFAULT_PDF_TEXT_ENGINE = "auto"
+_PDF_TEXT_ENGINES = ("auto", "pdftotext", "pdfminer")
+
+DEFAULT_PDFTOTEXT_MODE = "reading"
+_PDFTOTEXT_MODES: dict[str, list[str]] = {"reading": [], "layout": ["-layout"], "raw": ["-raw"]}
+
+PdfSource = _t.Union[str, Path, bytes, bytearray, memoryview]
+
+
+def pdf_text_engine_setting() -> str:
+    """Return the configured ``PDF_TEXT_ENGINE`` (``ValueError`` when unknown)."""
+    engine = os.getenv("PDF_TEXT_ENGINE", DEFAULT_PDF_TEXT_ENGINE)
+    if engine not in _PDF_TEXT_ENGINES:
+        raise ValueError(f"Unknown PDF text engine {engine!r}; expected one of {list(_PDF_TEXT_ENGINES)}")
+    return engine
+
+
+def resolve_pdf_text_engine(setting: _t.Optional[str] = None) -> str:
+    """Return the engine that actually runs: ``"pdftotext"`` or ``"pdfminer"``."""
+    setting = setting or pdf_text_engine_setting()
+    if setting == "auto":
+        return "pdftotext" if pdftotext_available() else "pdfminer"
+    return setting
+
+
+def pdftotext_mode() -> str:
+    """Return the configured ``PDFTOTEXT_MODE`` (``ValueError`` when unknown)."""
+    mode = os.getenv("PDFTOTEXT_MODE", DEFAULT_PDFTOTEXT_MODE)
+    if mode not in _PDFTOTEXT_MODES:
+        raise ValueError(f"Unknown pdftotext mode {mode!r}; expected one of {list(_PDFTOTEXT_MODES)}")
+    return mode
+
+
+def pdftotext_available() -> bool:
+    """Whether poppler's ``pdftotext`` and ``pdfinfo`` are on ``PATH``."""
+    return shutil.which("pdftotext") is not None and shutil.which("pdfinfo") is not None
+
+
+def _run(tool: str, args: list[str], source: PdfSource, *trailing: str) -> str:
+    """Run a poppler *tool* on *source* (a path, or bytes piped to stdin)."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        target, data = "-", bytes(source)
+    else:
+        target, data = str(source), None
+    try:
+        proc = subprocess.run([tool, *args, target, *trailing], input=data, capture_output=True)
+    except FileNotFoundError as exc:
+        raise RuntimeError(f"{tool} binary not found") from exc
+    if proc.returncode != 0:
+        message = proc.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"{tool} failed (exit {proc.returncode}): {message}")
+    return proc.stdout.decode("utf-8", errors="replace")
+
+
+def pdftotext(
+    source: PdfSource,
+    *,
+    first_page: _t.Optional[int] = None,
+    last_page: _t.Optional[int] = None,
+    mode: _t.Optional[str] = None,
+) -> str:
+    """Return the text layer of pages *first_page*–*last_page* (1-based, inclusive).
+
+    Every page ends with a form-feed; see :func:`split_pages`.  *mode*
+    defaults to ``PDFTOTEXT_MODE``.
+    """
+    args = ["-enc", "UTF-8", *_PDFTOTEXT_MODES[mode or pdftotext_mode()]]
+    if first_page is not None:
+        args += ["-f", str(first_page)]
+    if last_page is not None:
+        args += ["-l", str(last_page)]
+    return _run("pdftotext", args, source, "-")  # text to stdout
+
+
+def split_pages(text: str) -> list[str]:
+    """Split :func:`pdftotext` output into one string per page."""
+    if not text:
+        return []
+    pages = text.split("\f")
+    if text.endswith("\f"):
+        pages.pop()  # nothing follows the final page's form-feed
+    return pages
+
+
+def pdfinfo(source: PdfSource) -> dict[str, str]:
+    """Return ``pdfinfo``'s ``Key: value`` report for *source*."""
+    info: dict[str, str] = {}
+    for line in _run("pdfinfo", ["-enc", "UTF-8"], source).splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            info.setdefault(key.strip(), value.strip())
+    return info
@@ -0,0 +1,252 @@
+"""CPU and allocation profiling of extractions.
+
+:func:`profile` wraps a block – typically one :func:`extracttext.load` call –
+in :mod:`cProfile` and :mod:`tracemalloc`.  Work the block schedules on the
+process pool (OCR batches, offloaded whole-document extraction) is profiled
+too: while a session is active, :func:`profiled` wraps pool tasks so every
+worker records its own profile and allocation snapshot into the session
+directory, and the parent merges them when the block ends.
+
+Artifacts written to the session directory:
+
+* ``profile.pstats`` – merged CPU profile of this process and the workers
+  (open with :mod:`pstats`, ``snakeviz`` or ``gprof2dot``);
+* ``summary.txt``    – top-N functions by cumulative and own time, plus the
+  top-N allocation sites and peak traced memory;
+* ``memory.tracemalloc`` – this process's :class:`tracemalloc.Snapshot`;
+* ``workers/``       – one ``.pstats`` / ``.tracemalloc`` / ``.json`` triple
+  per profiled worker task.
+
+Allocation snapshots are taken when the profiled work ends, so they list
+what is still allocated then; the peak is reported separately.  Only one
+session runs at a time per process (the profilers are process-global on
+recent Pythons), concurrent sessions wait for each other.
+"""
+from __future__ import annotations
+
+import functools
+import io
+import json
+import os
+import threading
+import time
+import typing as _t
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+__all__ = [
+    "ProfileReport",
+    "profile",
+    "profiled",
+    "DEFAULT_TOP",
+]
+
+DEFAULT_TOP = 30
+
+_SESSION_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class _Session:
+    directory: str
+    parent_pid: int
+    memory: bool
+
+
+_ACTIVE: ContextVar[_t.Optional[_Session]] = ContextVar("extracttext_profile", default=None)
+
+
+@dataclass
+class ProfileReport:
+    """Where a :func:`profile` session put its artifacts (filled in on exit)."""
+
+    directory: Path
+    pstats_path: _t.Optional[Path] = None
+    summary_path: _t.Optional[Path] = None
+    snapshot_path: _t.Optional[Path] = None  # ``None`` with ``memory=False``
+    wall_ms: float = 0.0
+    worker_tasks: int = 0
+    peak_memory_bytes: _t.Optional[int] = None  # this process only
+    worker_peak_memory_bytes: _t.Optional[int] = None  # largest single worker task
+    worker_profiles: list = field(default_factory=list)
+
+    def dict(self) -> dict:
+        return {key: (str(value) if isinstance(value, Path) else value) for key, value in asdict(self).items()}
+
+
+def profiled(func: _t.Callable[..., _t.Any]) -> _t.Callable[..., _t.Any]:
+    """Return *func* wrapped to profile itself in a pool worker.
+
+    Outside a :func:`profile` session *func* is returned unchanged, so call
+    sites can wrap every submitted task unconditionally.
+    """
+    session = _ACTIVE.get()
+    if session is None:
+        return func
+    return functools.partial(_profiled_call, session, func)
+
+
+def _reset_after_fork() -> None:
+    """Drop profilers a pool worker inherited from a parent forked mid-session.
+
+    Called from the pool initializer; the session lock is copied by ``fork``,
+    so it tells whether the parent was profiling at that moment.
+    """
+    if not _SESSION_LOCK.locked():
+        return
+
+    import sys
+    import tracemalloc
+
+    sys.setprofile(None)
+    monitoring = getattr(sys, "monitoring", None)  # Python 3.12+ cProfile
+    if monitoring is not None and monitoring.get_tool(monitoring.PROFILER_ID) is not None:
+        monitoring.set_events(monitoring.PROFILER_ID, 0)
+        monitoring.free_tool_id(monitoring.PROFILER_ID)
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def _profiled_call(session: _Session, func: _t.Callable[..., _t.Any], *args: _t.Any) -> _t.Any:
+    """Pool task: run *func* under cProfile / tracemalloc and dump the results."""
+    if os.getpid() == session.parent_pid:
+        # Inline executor – already covered by the session's own profiler
+        return func(*args)
+
+    import cProfile
+    import tracemalloc
+
+    trace_memory = session.memory and not tracemalloc.is_tracing()
+    if trace_memory:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        return func(*args)
+    finally:
+        profiler.disable()
+        seconds = time.perf_counter() - started
+        stem = Path(session.directory) / "workers" / f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        profiler.dump_stats(f"{stem}.pstats")
+        info = {"pid": os.getpid(), "task": getattr(func, "__qualname__", repr(func)), "seconds": round(seconds, 4)}
+        if trace_memory:
+            info["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.take_snapshot().dump(f"{stem}.tracemalloc")
+            tracemalloc.stop()
+        Path(f"{stem}.json").write_text(json.dumps(info))
+
+
+@contextmanager
+def profile(
+    directory: _t.Union[str, Path], *, top: int = DEFAULT_TOP, memory: bool = True
+) -> _t.Iterator[ProfileReport]:
+    """Profile the ``with`` block and write artifacts into *directory*.
+
+    *top* bounds the tables of ``summary.txt``; ``memory=False`` skips
+    tracemalloc, whose bookkeeping slows allocation-heavy code noticeably.
+    The yielded :class:`ProfileReport` is complete once the block exits.
+    """
+    import cProfile
+    import tracemalloc
+
+    directory = Path(directory).resolve()  # workers may run elsewhere
+    (directory / "workers").mkdir(parents=True, exist_ok=True)
+    for stale in (directory / "workers").iterdir():
+        # A reused directory must not mix in an earlier session's workers
+        stale.unlink()
+    report = ProfileReport(directory=directory)
+
+    with _SESSION_LOCK:
+        trace_memory = memory and not tracemalloc.is_tracing()
+        if trace_memory:
+            tracemalloc.start()
+        token = _ACTIVE.set(_Session(str(directory), os.getpid(), memory))
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield report
+        finally:
+            profiler.disable()
+            report.wall_ms = round((time.perf_counter() - started) * 1000, 2)
+            _ACTIVE.reset(token)
+            snapshot = None
+            if trace_memory:
+                report.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+                snapshot = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+            _write_artifacts(report, profiler, snapshot, top)
+
+
+def _write_artifacts(report: ProfileReport, profiler: _t.Any, snapshot: _t.Any, top: int) -> None:
+    import pstats
+
+    directory = report.directory
+    workers = sorted((directory / "workers").glob("*.pstats"))
+    report.worker_profiles = [str(p) for p in workers]
+    report.worker_tasks = len(workers)
+
+    stats = pstats.Stats(profiler)
+    for path in workers:
+        stats.add(str(path))
+    report.pstats_path = directory / "profile.pstats"
+    stats.dump_stats(str(report.pstats_path))
+
+    if snapshot is not None:
+        report.snapshot_path = directory / "memory.tracemalloc"
+        snapshot.dump(str(report.snapshot_path))
+
+    worker_peaks = []
+    for path in (directory / "workers").glob("*.json"):
+        peak = json.loads(path.read_text()).get("peak_memory_bytes")
+        if peak is not None:
+            worker_peaks.append(peak)
+    report.worker_peak_memory_bytes = max(worker_peaks) if worker_peaks else None
+
+    out = io.StringIO()
+    out.write(f"wall time: {report.wall_ms:.1f} ms, profiled worker tasks: {report.worker_tasks}\n")
+    if report.peak_memory_bytes is not None:
+        out.write(f"peak traced memory: {report.peak_memory_bytes / 1024 / 1024:.1f} MiB (this process)")
+        if report.worker_peak_memory_bytes is not None:
+            out.write(f", {report.worker_peak_memory_bytes / 1024 / 1024:.1f} MiB (largest worker task)")
+        out.write("\n")
+
+    for key, title in (("cumulative", "cumulative time"), ("tottime", "own time")):
+        out.write(f"\n=== Top {top} functions by {title} (all processes) ===\n")
+        pstats.Stats(str(report.pstats_path), stream=out).sort_stats(key).print_stats(top)
+
+    if snapshot is not None:
+        out.write(f"\n=== Top {top} allocation sites still live at the end (this process) ===\n")
+        _write_allocations(out, snapshot.statistics("lineno"), top)
+        worker_snapshots = sorted((directory / "workers").glob("*.tracemalloc"))
+        if worker_snapshots:
+            out.write(f"\n=== Top {top} allocation sites still live at task end (workers, summed) ===\n")
+            _write_allocations(out, _merged_statistics(worker_snapshots), top)
+
+    report.summary_path = directory / "summary.txt"
+    report.summary_path.write_text(out.getvalue())
+
+
+def _merged_statistics(paths: _t.Iterable[Path]) -> list:
+    """Allocation statistics of several snapshots, summed per source line."""
+    import tracemalloc
+
+    totals: dict = {}
+    for path in paths:
+        for stat in tracemalloc.Snapshot.load(str(path)).statistics("lineno"):
+            size, count = totals.get(stat.traceback, (0, 0))
+            totals[stat.traceback] = (size + stat.size, count + stat.count)
+    return [
+        tracemalloc.Statistic(traceback, size, count)
+        for traceback, (size, count) in sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+    ]
+
+
+def _write_allocations(out: io.StringIO, statistics: _t.Sequence[_t.Any], top: int) -> None:
+    for stat in statistics[:top]:
+        frame = stat.traceback[0]
+        out.write(f"{stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks  {frame.filename}:{frame.lineno}\n")
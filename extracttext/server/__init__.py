@@ -6,13 +6,59 @@ Launch with:
     uvicorn extracttext.server:app --host 0.0.0.0 --port 6060
 """
 
+import asyncio
+import functools
+import json
+import os
+import tempfile
+import threading
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
 from time import perf_counter
+from typing import Optional
 
 from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from extracttext import load as extract_text
+from extracttext import DataLoader
+from extracttext.cache import build_default_cache
+from extracttext.concurrency import get_thread_executor, prewarm_default_executor
 
-app = FastAPI(title="ExtractText API")
+from .admission import AdmissionController, AdmissionRejected, classify_upload
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsRegistry
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    # Spawn the OCR worker processes before the first upload arrives
+    await asyncio.get_running_loop().run_in_executor(None, prewarm_default_executor)
+    yield
+
+
+app = FastAPI(title="ExtractText API", lifespan=_lifespan)
+
+# Per-stage histograms served on /metrics; fed by the loader's span hook
+_METRICS = MetricsRegistry()
+
+# One loader for the whole process so repeated uploads hit the result cache
+# (configure via EXTRACTTEXT_CACHE_* environment variables).  Built on the
+# first request: importing the app must not create the on-disk cache.
+_LOADER: Optional[DataLoader] = None
+_LOADER_LOCK = threading.Lock()
+
+
+def _loader() -> DataLoader:
+    global _LOADER
+    if _LOADER is None:
+        with _LOADER_LOCK:
+            if _LOADER is None:
+                _LOADER = DataLoader(cache=build_default_cache(), in_memory=True, hooks=[_METRICS.hook])
+    return _LOADER
+
+
+# Bounded per-class concurrency; see extracttext.server.admission
+_ADMISSION = AdmissionController.from_env()
 
 # Allow requests from any origin (handy for demos / local testing)
 app.add_middleware(
@@ -25,26 +71,186 @@ app.add_middleware(
 
 
 @app.post("/gettext")
-async def gettext(file: UploadFile = File(...)):
+async def gettext(file: UploadFile = File(...), trace: bool = False, profile: bool = False):
     """Extract raw text from an uploaded document.
 
     Accepts *any* file type supported by `extracttext.load()`.  Returns the JSON
     envelope serialisable via `ExtractionResult.dict()`, plus a few extras.
+    ``?trace=true`` adds the per-stage ``spans`` to the envelope.
+
+    ``?profile=true`` profiles the extraction (see :mod:`extracttext.profiling`)
+    into a fresh sub-directory of ``EXTRACTTEXT_PROFILE_DIR`` and reports the
+    artifact paths under ``profile``; without that variable profiling is
+    disabled and the request is refused with ``403``.
+
+    Requests beyond the configured capacity of their document class (OCR vs
+    text) are rejected with ``429`` and a ``Retry-After`` header.
     """
+    profile_dir = _profile_directory() if profile else None
+    report = None
     try:
-        data = await file.read()
-        start = perf_counter()
-
-        result = extract_text(data, filename=file.filename)
-        elapsed_ms = (perf_counter() - start) * 1000
+        async with _ADMISSION.admit(classify_upload(file.filename, file.file)) as ticket:
+            start = perf_counter()
 
-        payload = result.dict()
-        payload["elapsed_ms"] = round(elapsed_ms, 2)
-        payload["char_count"] = len(result.text_payload)
-        return payload
+            if profile_dir is not None:
+                call = functools.partial(_profiled_load, file.file, file.filename, trace, profile_dir)
+                result, report = await asyncio.get_running_loop().run_in_executor(get_thread_executor(), call)
+            else:
+                # The loader reads the spooled upload in memory (no temp file);
+                # CPU-bound work runs on the executors.
+                result = await _loader().aload(file.file, filename=file.filename, trace=trace)
+            elapsed_ms = (perf_counter() - start) * 1000
+    except AdmissionRejected as exc:
+        return _rejected(exc)
     except Exception as exc:  # pragma: no cover – pass through verbatim
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+    payload = result.dict()
+    payload["elapsed_ms"] = round(elapsed_ms, 2)
+    payload["char_count"] = len(result.text_payload)
+    payload["queue_wait_ms"] = ticket.queue_wait_ms
+    payload["queue_depth"] = ticket.queue_depth
+    if report is not None:
+        payload["profile"] = report.dict()
+    return payload
+
+
+def _profile_directory() -> Path:
+    root = os.getenv("EXTRACTTEXT_PROFILE_DIR")
+    if not root:
+        raise HTTPException(status_code=403, detail="Profiling is disabled; set EXTRACTTEXT_PROFILE_DIR")
+    return Path(root) / uuid.uuid4().hex
+
+
+def _profiled_load(upload, filename, trace: bool, directory: Path):
+    """Synchronous load under :func:`extracttext.profiling.profile` (runs on the I/O pool).
+
+    Profiling covers the calling thread, so the document is processed here
+    rather than via ``aload``; OCR batches still fan out and are profiled in
+    the workers.  The result cache is bypassed – a profiled cache hit would
+    show no extraction at all.
+    """
+    from extracttext.profiling import profile
+
+    shared = _loader()
+    loader = DataLoader(in_memory=shared.in_memory, hooks=shared.hooks)
+    with profile(directory) as report:
+        result = loader.load(upload, filename=filename, trace=trace)
+    return result, report
+
+
+#: Largest upload ``/gettext/stream`` spools to disk (``EXTRACTTEXT_MAX_UPLOAD_BYTES``)
+DEFAULT_MAX_UPLOAD_BYTES = 1024 * 1024 * 1024
+
+_SPOOL_CHUNK_BYTES = 1024 * 1024
+
+
+class _UploadTooLarge(Exception):
+    pass
+
+
+def _spool_upload(upload, filename, limit: int) -> Path:
+    """Copy *upload* to a temporary file in bounded chunks (runs on the I/O pool)."""
+    suffix = f"_{Path(filename).name}" if filename else ""
+    tmp = tempfile.NamedTemporaryFile(delete=False, prefix="extracttext_upload_", suffix=suffix)
+    try:
+        with tmp:
+            copied = 0
+            while chunk := upload.read(_SPOOL_CHUNK_BYTES):
+                copied += len(chunk)
+                if copied > limit:
+                    raise _UploadTooLarge()
+                tmp.write(chunk)
+    except BaseException:
+        os.remove(tmp.name)
+        raise
+    return Path(tmp.name)
+
+
+@app.post("/gettext/stream")
+async def gettext_stream(file: UploadFile = File(...)):
+    """Streaming variant of ``/gettext`` emitting NDJSON.
+
+    One line per page (``TextFragment.dict()``) is sent as soon as the page
+    is extracted, followed by a summary line ``{"done": true, ...}``.  A
+    failure after streaming started is reported as a final
+    ``{"done": false, "error": ...}`` line.  Admission works as for
+    ``/gettext``; the slot is held until the stream ends.
+
+    The upload is spooled to a temporary file in 1 MiB chunks – never held
+    in memory – and deleted when the stream ends.  Uploads larger than
+    ``EXTRACTTEXT_MAX_UPLOAD_BYTES`` (default 1 GiB) are refused with ``413``.
+    """
+    admission = _ADMISSION.admit(classify_upload(file.filename, file.file))
+    try:
+        ticket = await admission.__aenter__()
+    except AdmissionRejected as exc:
+        return _rejected(exc)
+
+    limit = int(os.getenv("EXTRACTTEXT_MAX_UPLOAD_BYTES", str(DEFAULT_MAX_UPLOAD_BYTES)))
+    try:
+        # The upload is closed when this handler returns, before the body streams
+        spool = functools.partial(_spool_upload, file.file, file.filename, limit)
+        path = await asyncio.get_running_loop().run_in_executor(get_thread_executor(), spool)
+    except _UploadTooLarge:
+        await admission.__aexit__(None, None, None)
+        raise HTTPException(status_code=413, detail=f"Upload exceeds {limit} bytes") from None
+    except BaseException:
+        await admission.__aexit__(None, None, None)
+        raise
+
+    async def _ndjson():
+        start = perf_counter()
+        pages = 0
+        try:
+            async for fragment in _loader().aiter_text(path, filename=file.filename):
+                pages += 1
+                yield fragment.json() + "\n"
+            summary = {
+                "done": True,
+                "pages": pages,
+                "elapsed_ms": round((perf_counter() - start) * 1000, 2),
+                "queue_wait_ms": ticket.queue_wait_ms,
+                "queue_depth": ticket.queue_depth,
+            }
+        except Exception as exc:
+            summary = {"done": False, "pages": pages, "error": str(exc)}
+        finally:
+            path.unlink(missing_ok=True)
+            await admission.__aexit__(None, None, None)
+        yield json.dumps(summary) + "\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint.
+
+    Histograms of ``/gettext`` durations per document type and pipeline stage
+    (see :mod:`extracttext.server.metrics`) plus the current admission
+    queues.  Streamed extractions are not included.
+    """
+    stats = _ADMISSION.stats()
+    gauges = [
+        (
+            f"extracttext_admission_{key}",
+            f"Requests currently {key} per document class.",
+            "doc_class",
+            {name: counts[key] for name, counts in stats.items()},
+        )
+        for key in ("running", "waiting")
+    ]
+    return PlainTextResponse(_METRICS.render(gauges), media_type=METRICS_CONTENT_TYPE)
+
+
+def _rejected(exc: AdmissionRejected) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        headers={"Retry-After": str(exc.retry_after)},
+        content={"detail": str(exc), "queue_depth": exc.queue_depth, "retry_after": exc.retry_after},
+    )
+
 
 def _run_dev_server():
     """Convenience entry-point when invoking `python -m extracttext.server`."""
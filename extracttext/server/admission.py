@@ -0,0 +1,144 @@
+"""Admission control for the extraction server.
+
+Each document class (``ocr`` vs ``text``) gets its own concurrency limit and
+a bounded wait queue.  Requests arriving while the queue is full are rejected
+immediately with an estimated ``Retry-After`` instead of piling up, so the
+service degrades gracefully under bursts.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import typing as _t
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionRejected",
+    "AdmissionTicket",
+    "classify_upload",
+    "OCR_CLASS",
+    "TEXT_CLASS",
+]
+
+OCR_CLASS = "ocr"
+TEXT_CLASS = "text"
+
+# Extensions that (potentially) require rasterisation + OCR
+_OCR_SUFFIXES = {".pdf", ".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".gif"}
+
+
+class AdmissionRejected(Exception):
+    """Raised when a class's wait queue is full."""
+
+    def __init__(self, doc_class: str, retry_after: int, queue_depth: int):
+        super().__init__(f"{doc_class!r} queue is full ({queue_depth} waiting); retry in {retry_after}s")
+        self.doc_class = doc_class
+        self.retry_after = retry_after
+        self.queue_depth = queue_depth
+
+
+@dataclass
+class AdmissionTicket:
+    """Queue statistics for one admitted request (reported in the response)."""
+
+    doc_class: str
+    queue_depth: int  # requests already waiting when this one arrived
+    queue_wait_ms: float = 0.0
+
+
+class _ClassState:
+    def __init__(self, concurrency: int, max_queue: int):
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.waiting = 0
+        self.running = 0
+        # Exponentially weighted mean service time, seeds Retry-After estimates
+        self.avg_service_s = 1.0
+
+
+class AdmissionController:
+    """Per-class semaphores with bounded queues.
+
+    *limits* maps a document class to ``(concurrency, max_queue)``.
+    """
+
+    def __init__(self, limits: _t.Mapping[str, _t.Tuple[int, int]]):
+        self._limits = dict(limits)
+        self._states: dict[str, _ClassState] = {}
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        """Build limits from ``EXTRACTTEXT_{OCR,TEXT}_CONCURRENCY`` / ``EXTRACTTEXT_MAX_QUEUE``."""
+        cpus = os.cpu_count() or 1
+        max_queue = int(os.getenv("EXTRACTTEXT_MAX_QUEUE", "32"))
+        return cls(
+            {
+                OCR_CLASS: (int(os.getenv("EXTRACTTEXT_OCR_CONCURRENCY", str(cpus))), max_queue),
+                TEXT_CLASS: (int(os.getenv("EXTRACTTEXT_TEXT_CONCURRENCY", str(2 * cpus))), max_queue),
+            }
+        )
+
+    def _state(self, doc_class: str) -> _ClassState:
+        # Created lazily so the semaphores bind to the running event loop
+        state = self._states.get(doc_class)
+        if state is None:
+            concurrency, max_queue = self._limits[doc_class]
+            state = self._states[doc_class] = _ClassState(concurrency, max_queue)
+        return state
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Current ``running`` / ``waiting`` counts per class."""
+        return {name: {"running": s.running, "waiting": s.waiting} for name, s in self._states.items()}
+
+    @asynccontextmanager
+    async def admit(self, doc_class: str) -> _t.AsyncIterator[AdmissionTicket]:
+        """Wait for a slot in *doc_class*; raise :class:`AdmissionRejected` if the queue is full."""
+        state = self._state(doc_class)
+
+        must_wait = state.semaphore.locked() or state.waiting > 0
+        if must_wait and state.waiting >= state.max_queue:
+            # Time for everyone ahead of us to drain through the slots
+            backlog = (state.waiting + 1) / state.concurrency
+            raise AdmissionRejected(doc_class, max(1, math.ceil(backlog * state.avg_service_s)), state.waiting)
+
+        ticket = AdmissionTicket(doc_class=doc_class, queue_depth=state.waiting)
+        queued_at = perf_counter()
+        state.waiting += 1
+        try:
+            await state.semaphore.acquire()
+        finally:
+            state.waiting -= 1
+        ticket.queue_wait_ms = round((perf_counter() - queued_at) * 1000, 2)
+
+        state.running += 1
+        started = perf_counter()
+        try:
+            yield ticket
+        finally:
+            state.running -= 1
+            state.semaphore.release()
+            state.avg_service_s = 0.8 * state.avg_service_s + 0.2 * (perf_counter() - started)
+
+
+def classify_upload(filename: _t.Optional[str], fp: _t.Optional[_t.BinaryIO] = None) -> str:
+    """Cheap classification of an upload, from its header when *fp* is given.
+
+    The signature sniffing of :func:`extracttext.detector.sniff_kind` wins, so
+    a scanned PDF uploaded as ``scan.bin`` still counts against the OCR limit;
+    the filename decides only when the content is not recognised.  *fp* is
+    rewound afterwards.
+    """
+    suffix = Path(filename or "").suffix.lower()
+    if fp is not None:
+        from extracttext.detector import KIND_IMAGE, KIND_PDF, sniff_kind
+
+        kind = sniff_kind(fp, suffix)
+        if kind is not None:
+            return OCR_CLASS if kind in (KIND_PDF, KIND_IMAGE) else TEXT_CLASS
+    return OCR_CLASS if suffix in _OCR_SUFFIXES else TEXT_CLASS
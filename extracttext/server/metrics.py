@@ -0,0 +1,157 @@
+"""Prometheus metrics for the extraction server.
+
+:class:`MetricsRegistry` is a span hook (see :mod:`extracttext.instrumentation`):
+when the final ``load`` span of a traced call arrives it turns the whole trace
+into histogram observations, labelled by document type:
+
+* ``extracttext_load_duration_seconds{document_type, status}`` – whole calls;
+* ``extracttext_stage_duration_seconds{document_type, stage}`` – ``normalise``,
+  ``cache``, ``probe``, ``extract``, ``dpi_probe``, ``render`` and ``ocr``
+  spans (a stage seen several times in one call is observed each time);
+* ``extracttext_extractor_attempts_total{extractor, status}`` – every
+  attempted extractor, so fallbacks show up as ``error`` attempts.
+
+:meth:`MetricsRegistry.render` emits the Prometheus text exposition format
+(version 0.0.4) without any client library.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import typing as _t
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from extracttext.instrumentation import Span, Trace
+
+__all__ = [
+    "MetricsRegistry",
+    "CONTENT_TYPE",
+    "DEFAULT_BUCKETS",
+]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+#: Seconds – from cached text files up to long scanned documents
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_UNKNOWN = "unknown"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: _t.Sequence[str], values: _t.Sequence[str], **extra: str) -> str:
+    pairs = [*zip(names, values), *extra.items()]
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Histogram:
+    def __init__(self, name: str, help_text: str, label_names: _t.Sequence[str], buckets: _t.Sequence[float]):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label values → (per-bucket counts, sum, count)
+        self.series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        series = self.series.setdefault(labels, [[0] * len(self.buckets), 0.0, 0])
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[0][i] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels in sorted(self.series):
+            counts, total, count = self.series[labels]
+            for bound, n in zip(self.buckets, counts):
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, labels, le=_number(bound))} {n}")
+            lines.append(f"{self.name}_bucket{_labels(self.label_names, labels, le='+Inf')} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {count}")
+        return lines
+
+
+class _Counter:
+    def __init__(self, name: str, help_text: str, label_names: _t.Sequence[str]):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self.series: dict[tuple[str, ...], int] = {}
+
+    def inc(self, labels: tuple[str, ...]) -> None:
+        self.series[labels] = self.series.get(labels, 0) + 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels in sorted(self.series):
+            lines.append(f"{self.name}{_labels(self.label_names, labels)} {self.series[labels]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Thread-safe histograms fed by span hooks; register :meth:`hook`."""
+
+    def __init__(self, buckets: _t.Sequence[float] = DEFAULT_BUCKETS):
+        self._lock = threading.Lock()
+        self._load = _Histogram(
+            "extracttext_load_duration_seconds",
+            "Time to extract one document.",
+            ("document_type", "status"),
+            buckets,
+        )
+        self._stage = _Histogram(
+            "extracttext_stage_duration_seconds",
+            "Time spent per pipeline stage.",
+            ("document_type", "stage"),
+            buckets,
+        )
+        self._attempts = _Counter(
+            "extracttext_extractor_attempts_total",
+            "Extractor attempts, including failed ones that fell back.",
+            ("extractor", "status"),
+        )
+
+    def hook(self, span: "Span", trace: "Trace") -> None:
+        """Span hook: observe the whole trace once its ``load`` span finished."""
+        if span.name == "load":
+            self.observe(trace.spans)
+
+    def observe(self, spans: _t.Sequence["Span"]) -> None:
+        """Record the spans of one traced call (the ``load`` span last)."""
+        root = spans[-1]
+        # Failed calls never learnt a type – use the last extractor tried
+        doc_type = root.attrs.get("document_type")
+        if doc_type is None:
+            tried = [s.attrs["document_type"] for s in spans if s.name == "extract"]
+            doc_type = tried[-1] if tried else _UNKNOWN
+
+        with self._lock:
+            self._load.observe((doc_type, "error" if root.error else "ok"), root.duration_ms / 1000)
+            for item in spans[:-1]:
+                self._stage.observe((doc_type, item.name), item.duration_ms / 1000)
+                if item.name == "extract":
+                    self._attempts.inc((item.attrs.get("extractor", _UNKNOWN), "error" if item.error else "ok"))
+
+    def render(self, gauges: _t.Iterable[tuple[str, str, str, _t.Mapping[str, float]]] = ()) -> str:
+        """Prometheus text exposition of every metric.
+
+        *gauges* adds point-in-time values as ``(name, help, label, samples)``
+        where *samples* maps the label's values to numbers.
+        """
+        with self._lock:
+            lines = [*self._load.render(), *self._stage.render(), *self._attempts.render()]
+        for name, help_text, label, samples in gauges:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            for value in sorted(samples):
+                lines.append(f"{name}{_labels((label,), (value,))} {_number(samples[value])}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,49 @@
+from pathlib import Path
+import time
+import tracemalloc
+
+import docx
+
+from extracttext.extractors.docx import DocxExtractor
+
+PARAGRAPHS = 6000  # roughly a 500-page contract
+TABLES = 100
+
+
+def _build_large_docx(path: Path) -> None:
+    document = docx.Document()
+    for n in range(PARAGRAPHS):
+        document.add_paragraph(f"Clause {n}. The parties agree that the obligations herein shall survive termination.")
+        if n % (PARAGRAPHS // TABLES) == 0:
+            table = document.add_table(rows=5, cols=4)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f"r{r}c{c}"
+    document.save(str(path))
+
+
+def _measure(monkeypatch, engine: str, path: Path) -> tuple[float, float, str]:
+    monkeypatch.setenv("DOCX_ENGINE", engine)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    text = DocxExtractor().extract_text(path)
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return elapsed, peak, text
+
+
+def test_docx_engines_benchmark(tmp_path, monkeypatch):
+    path = tmp_path / "contract.docx"
+    _build_large_docx(path)
+
+    legacy_s, legacy_mb, legacy_text = _measure(monkeypatch, "python-docx", path)
+    stream_s, stream_mb, stream_text = _measure(monkeypatch, "stream", path)
+
+    print(
+        f"[docx-bench] python-docx {legacy_s:.2f}s / {legacy_mb:.0f} MB peak, "
+        f"stream {stream_s:.2f}s / {stream_mb:.0f} MB peak → {legacy_s / stream_s:.1f}× faster"
+    )
+
+    assert sorted(stream_text.splitlines()) == sorted(legacy_text.splitlines())
+    assert stream_s < legacy_s
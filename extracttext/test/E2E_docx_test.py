@@ -17,7 +17,7 @@ def test_e2e_docx():
 
     print("[E2E] detecting file type…")
     chosen = None
-    for ext in loader._iter_extractors():
+    for ext in (spec.load() for spec in loader._iter_specs()):
         if ext.can_process(path_norm):
             chosen = ext
             break
@@ -24,7 +24,7 @@ def test_e2e_image():
 
     print("[E2E] detecting file type…")
     chosen = None
-    for ext in loader._iter_extractors():
+    for ext in (spec.load() for spec in loader._iter_specs()):
         if ext.can_process(path_norm):
             chosen = ext
             break
@@ -15,22 +15,39 @@ OCR_OK = all(shutil.which(cmd) for cmd in ("tesseract", "pdftoppm"))
 
 
 @pytest.mark.skipif(not OCR_OK, reason="OCR binaries (tesseract, pdftoppm) not installed")
-def test_e2e_ocr_performance():
-    """Measure OCR runtime on a ~5 MB scanned PDF sample."""
-
-    if not SAMPLE_PDF.exists():
-        pytest.skip("Performance sample PDF not found")
-
-    print(f"[E2E] receiving file '{SAMPLE_PDF.name}' ({SAMPLE_PDF.stat().st_size/1024/1024:.1f} MB)…")
+def test_e2e_ocr_performance(tmp_path):
+    """Measure OCR runtime on a ~5 MB scanned PDF sample.
+
+    Falls back to an 8-page scanned PDF from the synthetic benchmark corpus
+    when the sample is not checked out (see ``python -m extracttext.bench``).
+    """
+
+    sample = SAMPLE_PDF
+    if not sample.exists():
+        from extracttext.bench import CorpusSpec, generate_corpus
+
+        spec = CorpusSpec(
+            scanned_pdf_pages=8,
+            text_pdf_pages=1,
+            mixed_pdf_pages=1,
+            tiff_frames=1,
+            docx_paragraphs=1,
+            csv_rows=1,
+            log_lines=1,
+        )
+        generate_corpus(tmp_path, spec)
+        sample = tmp_path / "scanned.pdf"
+
+    print(f"[E2E] receiving file '{sample.name}' ({sample.stat().st_size/1024/1024:.1f} MB)…")
 
     loader = DataLoader(prefer_ocr=True)
 
     # Timing starts
     t0 = time.perf_counter()
-    path_norm, _, cleanup = loader._normalise_source(SAMPLE_PDF)
+    path_norm, _, cleanup = loader._normalise_source(sample)
 
     # Detect extractor
-    for ext in loader._iter_extractors():
+    for ext in (spec.load() for spec in loader._iter_specs()):
         if ext.can_process(path_norm):
             chosen = ext
             break
@@ -0,0 +1,55 @@
+from difflib import SequenceMatcher
+from io import BytesIO
+from pathlib import Path
+import shutil
+import time
+
+import pytest
+from PIL import Image
+
+from extracttext.extractors.image_ocr import ImageOcrExtractor
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+TESSERACT_OK = shutil.which("tesseract") is not None
+ROUNDS = 3
+
+
+def _phone_photo() -> bytes:
+    """The sample image blown up to a 4000 px wide colour JPEG, like a phone shot."""
+    img = Image.open(SAMPLES_DIR / "image.png").convert("RGB")
+    scale = 4000 / img.width
+    img = img.resize((4000, round(img.height * scale)), Image.Resampling.BICUBIC)
+    buf = BytesIO()
+    img.save(buf, format="JPEG", quality=92, dpi=(72, 72))
+    return buf.getvalue()
+
+
+def _run(monkeypatch, data: bytes, **env: str) -> tuple[float, str]:
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        text = ImageOcrExtractor().extract_text(data)
+    return (time.perf_counter() - t0) / ROUNDS, " ".join(text.split())
+
+
+@pytest.mark.skipif(not TESSERACT_OK, reason="tesseract binary not installed")
+def test_preprocess_throughput_and_accuracy(monkeypatch):
+    photo = _phone_photo()
+    reference = " ".join(ImageOcrExtractor().extract_text((SAMPLES_DIR / "image.png").read_bytes()).split())
+
+    raw_s, raw_text = _run(monkeypatch, photo, OCR_PREPROCESS="0")
+    prep_s, prep_text = _run(monkeypatch, photo, OCR_PREPROCESS="1", OCR_MAX_SIDE="2000")
+    bin_s, bin_text = _run(monkeypatch, photo, OCR_PREPROCESS="1", OCR_MAX_SIDE="2000", OCR_BINARIZE="1")
+
+    def _acc(text: str) -> float:
+        return SequenceMatcher(None, reference, text).ratio()
+
+    print(
+        f"[preprocess-bench] raw {raw_s:.2f}s acc={_acc(raw_text):.3f} | "
+        f"preprocessed {prep_s:.2f}s acc={_acc(prep_text):.3f} | "
+        f"+binarize {bin_s:.2f}s acc={_acc(bin_text):.3f}"
+    )
+
+    assert prep_s < raw_s
+    assert _acc(prep_text) >= _acc(raw_text)
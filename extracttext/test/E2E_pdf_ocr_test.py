@@ -34,7 +34,7 @@ def test_dataloader_e2e_pdf_ocr():
     # ------------------------------------------------------------------
     print("[E2E] detecting file type…")
     chosen = None
-    for ext in loader._iter_extractors():
+    for ext in (spec.load() for spec in loader._iter_specs()):
         if ext.can_process(path_norm):
             chosen = ext
             break
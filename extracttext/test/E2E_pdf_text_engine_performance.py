@@ -0,0 +1,36 @@
+from pathlib import Path
+import random
+import time
+
+import pytest
+
+from extracttext import poppler
+from extracttext.bench.corpus import _page_lines, _pdf
+from extracttext.extractors.pdf_text import PdfTextExtractor
+
+PAGES = 200
+
+
+def _measure(monkeypatch, engine: str, path: Path) -> tuple[float, list[str]]:
+    monkeypatch.setenv("PDF_TEXT_ENGINE", engine)
+    t0 = time.perf_counter()
+    pages = PdfTextExtractor().extract_pages(path)
+    return time.perf_counter() - t0, pages
+
+
+@pytest.mark.skipif(not poppler.pdftotext_available(), reason="poppler (pdftotext, pdfinfo) not installed")
+def test_pdf_text_engines_benchmark(tmp_path, monkeypatch):
+    rng = random.Random(1234)
+    path = tmp_path / "report.pdf"
+    path.write_bytes(_pdf([("text", _page_lines(rng)) for _ in range(PAGES)], 150))
+
+    pdfminer_s, pdfminer_pages = _measure(monkeypatch, "pdfminer", path)
+    pdftotext_s, pdftotext_pages = _measure(monkeypatch, "pdftotext", path)
+
+    print(
+        f"[pdf-text-bench] {PAGES} pages: pdfminer {pdfminer_s:.2f}s, "
+        f"pdftotext {pdftotext_s:.2f}s → {pdfminer_s / pdftotext_s:.1f}× faster"
+    )
+
+    assert [p.split() for p in pdftotext_pages] == [p.split() for p in pdfminer_pages]
+    assert pdftotext_s < pdfminer_s
@@ -0,0 +1,70 @@
+from io import BytesIO
+from pathlib import Path
+import pickle
+import shutil
+import tempfile
+import time
+
+import pytest
+
+import pdf2image
+
+from extracttext.ocr.pipeline import raster_dir
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+SAMPLE_PDF = SAMPLES_DIR / "pdf-notext.pdf"
+
+POPPLER_OK = shutil.which("pdftoppm") is not None
+
+ROUNDS = 10
+DPI = 300
+
+
+def _legacy_handoff() -> float:
+    """Parent CPU seconds per page: decode in parent, PNG-encode, pickle bytes."""
+    pages = 0
+    cpu0 = time.process_time()
+    for _ in range(ROUNDS):
+        for page in pdf2image.convert_from_path(str(SAMPLE_PDF), dpi=DPI):
+            pages += 1
+            if page.mode != "RGB":
+                page = page.convert("RGB")
+            buf = BytesIO()
+            page.save(buf, format="PNG")
+            pickle.dumps((buf.getvalue(), "eng"))
+    return (time.process_time() - cpu0) / pages
+
+
+def _path_handoff() -> float:
+    """Parent CPU seconds per page: poppler writes PGM to scratch, pickle the path."""
+    pages = 0
+    cpu0 = time.process_time()
+    with tempfile.TemporaryDirectory(dir=raster_dir()) as tmpdir:
+        for _ in range(ROUNDS):
+            paths = pdf2image.convert_from_path(
+                str(SAMPLE_PDF),
+                dpi=DPI,
+                output_folder=tmpdir,
+                paths_only=True,
+                fmt="ppm",
+                grayscale=True,
+            )
+            for p in paths:
+                pickle.dumps((p, "eng"))
+            pages += len(paths)
+    return (time.process_time() - cpu0) / pages
+
+
+@pytest.mark.skipif(not POPPLER_OK, reason="poppler (pdftoppm) not installed")
+def test_e2e_raster_handoff_performance():
+    """Compare parent-side CPU per page for PNG/pickle vs. path hand-off."""
+
+    legacy = _legacy_handoff()
+    by_path = _path_handoff()
+
+    print(f"[E2E] scratch dir: {raster_dir() or tempfile.gettempdir()}")
+    print(f"[E2E] PNG + pickle hand-off : {legacy * 1000:8.2f} ms parent CPU / page")
+    print(f"[E2E] path hand-off         : {by_path * 1000:8.2f} ms parent CPU / page")
+    print(f"[E2E] saved                 : {(legacy - by_path) * 1000:8.2f} ms / page")
+
+    assert by_path < legacy
@@ -0,0 +1,51 @@
+from pathlib import Path
+import resource
+import time
+
+import chardet
+
+from extracttext.extractors.text_file import TextExtractor
+
+LOG_LINE = "2024-05-01T12:00:00.000Z INFO worker-7 request handled in 12ms – café ✓\n"
+SIZE_MB = 100
+
+
+def _write_log(path: Path) -> int:
+    block = (LOG_LINE * 1000).encode("utf-8")
+    with open(path, "wb") as fh:
+        for _ in range(SIZE_MB * 1024 * 1024 // len(block)):
+            fh.write(block)
+    return path.stat().st_size
+
+
+def _legacy_extract(path: Path) -> str:
+    """Historical approach: read everything, chardet over every byte."""
+    raw = path.read_bytes()
+    encoding = chardet.detect(raw)["encoding"] or "utf-8"
+    return raw.decode(encoding)
+
+
+def test_large_log_decode(tmp_path):
+    path = tmp_path / "big.log"
+    size = _write_log(path)
+
+    rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    chars = sum(len(chunk) for chunk in TextExtractor().iter_pages(path))
+    streamed_s = time.perf_counter() - t0
+    rss_growth_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss0) / 1024
+
+    # chardet over the full file takes far too long – time a 10 MB prefix
+    prefix = path.with_suffix(".prefix")
+    prefix.write_bytes(path.read_bytes()[: 10 * 1024 * 1024])
+    t0 = time.perf_counter()
+    _legacy_extract(prefix)
+    legacy_s = (time.perf_counter() - t0) * size / prefix.stat().st_size
+
+    print(
+        f"[text-decode] {size / 2**20:.0f} MB: streamed {streamed_s:.2f}s "
+        f"(peak RSS +{rss_growth_mb:.0f} MB), legacy ≈{legacy_s:.1f}s (extrapolated)"
+    )
+
+    assert chars > 0
+    assert streamed_s < legacy_s
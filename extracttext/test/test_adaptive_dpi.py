@@ -0,0 +1,79 @@
+import os
+
+from PIL import Image, ImageDraw
+
+from extracttext.extractors.pdf_ocr import PdfOcrExtractor
+from extracttext.ocr.dpi import AdaptiveDpiOptions, choose_dpi, estimate_line_height
+
+A4_AT_72 = (595, 842)
+
+
+def _page(line_px: int, size=A4_AT_72, lines: int = 20) -> Image.Image:
+    """Probe-resolution page with *lines* rows of "words" *line_px* tall."""
+    img = Image.new("L", size, 255)
+    draw = ImageDraw.Draw(img)
+    y = 60
+    for _ in range(lines):
+        if y + line_px > size[1] - 60:
+            break
+        for x in range(50, size[0] - 80, 45):
+            draw.rectangle([x, y, x + 30, y + line_px - 1], fill=20)
+        y += line_px * 2
+    return img
+
+
+def test_line_height_estimate():
+    assert estimate_line_height(_page(10)) == 10
+    assert estimate_line_height(_page(24)) == 24
+    # Blank pages and photos give no estimate
+    assert estimate_line_height(Image.new("L", A4_AT_72, 255)) is None
+    assert estimate_line_height(Image.effect_noise(A4_AT_72, 64)) is None
+
+
+def test_dpi_follows_text_size_within_caps():
+    options = AdaptiveDpiOptions()
+
+    body = choose_dpi(_page(10), options)  # ~11 pt body text
+    large = choose_dpi(_page(30), options)  # headline-sized type
+    small = choose_dpi(_page(5), options)  # footnote print
+    blank = choose_dpi(Image.new("L", A4_AT_72, 255), options)
+
+    print(f"[adaptive dpi] body={body} large={large} small={small} blank={blank}")
+
+    assert body == 275
+    assert large == options.min_dpi
+    assert small == options.max_dpi
+    assert blank == options.fallback_dpi
+
+
+def test_large_format_page_capped_by_pixel_budget():
+    options = AdaptiveDpiOptions()
+    a0 = _page(10, size=(2384, 3370), lines=60)
+
+    dpi = choose_dpi(a0, options)
+    pixels = (2384 * dpi / 72) * (3370 * dpi / 72)
+
+    assert dpi < options.min_dpi
+    assert pixels <= options.max_page_pixels
+
+
+def test_plan_groups_pages_by_dpi(monkeypatch, tmp_path):
+    probes = [_page(10), _page(10), _page(30)]
+    rendered = []
+
+    def fake_render(self, path, dpi, output_folder, first_page, last_page):
+        paths = []
+        for n in range(first_page, last_page + 1):
+            out = tmp_path / f"probe-{n}.pgm"
+            probes[n - 1].save(out)
+            paths.append(str(out))
+        rendered.append((dpi, first_page, last_page))
+        return paths
+
+    monkeypatch.setattr(PdfOcrExtractor, "_render", fake_render)
+
+    runs = PdfOcrExtractor()._plan_dpi(tmp_path / "doc.pdf", str(tmp_path), 0, 2, AdaptiveDpiOptions())
+
+    assert rendered == [(72, 1, 3)]  # one probe render per window
+    assert runs == [(0, 1, 275), (2, 2, 150)]
+    assert not [p for p in os.listdir(tmp_path) if p.startswith("probe-")]
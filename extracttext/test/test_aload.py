@@ -0,0 +1,54 @@
+from pathlib import Path
+import asyncio
+import random
+import time
+
+import pytest
+
+from extracttext import DataLoader, DocumentType, aload
+from extracttext.bench.corpus import _page_lines, _pdf
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def test_aload_matches_load():
+    path = SAMPLES_DIR / "pdf_text.pdf"
+
+    res = asyncio.run(aload(path))
+
+    assert res.document_type == DocumentType.PDF_TEXT
+    assert res.text_payload == DataLoader().load(path).text_payload
+
+
+@pytest.mark.parametrize("hybrid_pdf", [False, True])
+def test_aload_keeps_event_loop_responsive(monkeypatch, hybrid_pdf):
+    monkeypatch.setenv("PDF_TEXT_ENGINE", "pdfminer")  # pure-Python, holds the GIL
+    rng = random.Random(5)
+    data = _pdf([("text", _page_lines(rng, 40)) for _ in range(10)], 150)
+
+    async def _main():
+        ticks = 0
+        done = False
+
+        async def _ticker():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker = asyncio.create_task(_ticker())
+        started = time.perf_counter()
+        loads = (DataLoader(hybrid_pdf=hybrid_pdf).aload(data, filename="doc.pdf") for _ in range(4))
+        results = await asyncio.gather(*loads)
+        elapsed = time.perf_counter() - started
+        done = True
+        await ticker
+        return ticks, elapsed, results
+
+    ticks, elapsed, results = asyncio.run(_main())
+
+    print(f"[aload] event loop ticked {ticks}× in {elapsed:.2f}s during 4 concurrent loads")
+
+    assert all(r.document_type == DocumentType.PDF_TEXT for r in results)
+    # pdfminer on a loop-side thread starves the loop to ~25 ms per tick
+    assert elapsed / ticks < 0.01
@@ -0,0 +1,114 @@
+import json
+
+from extracttext import DocumentType, load
+from extracttext.bench import CorpusSpec, compare, generate_corpus, load_manifest, run_benchmarks
+from extracttext.bench.__main__ import main as bench_main
+from extracttext.bench.runner import _peak_rss_mb, _percentile
+from extracttext.concurrency import get_default_executor
+from extracttext.detector import probe_document
+
+CHEAP = ["text.pdf", "large.docx", "large.csv", "large.log"]
+
+
+def test_corpus_is_deterministic(tmp_path):
+    first = generate_corpus(tmp_path / "a", CorpusSpec.tiny())
+    second = generate_corpus(tmp_path / "b", CorpusSpec.tiny())
+    other_seed = generate_corpus(tmp_path / "c", CorpusSpec.tiny(seed=99))
+
+    assert [d.sha256 for d in first] == [d.sha256 for d in second]
+    assert [d.sha256 for d in first] != [d.sha256 for d in other_seed]
+
+    spec, documents = load_manifest(tmp_path / "a")
+    assert spec == CorpusSpec.tiny() and documents == first
+
+
+def test_corpus_documents_route_to_their_type(tmp_path):
+    documents = generate_corpus(tmp_path, CorpusSpec.tiny())
+
+    scanned = probe_document(tmp_path / "scanned.pdf")
+    assert scanned.page_count == 1 and not scanned.has_text_layer
+    assert probe_document(tmp_path / "mixed.pdf").page_count == 2
+
+    for doc in documents:
+        if doc.name in CHEAP:
+            result = load(tmp_path / doc.name)
+            print(f"[bench corpus] {doc.name}: {result.document_type.value}, {len(result.text_payload)} chars")
+            assert result.document_type == DocumentType(doc.document_type)
+            assert result.text_payload.strip()
+
+
+def test_run_reports_percentiles_and_rss(tmp_path):
+    generate_corpus(tmp_path, CorpusSpec.tiny())
+
+    report = run_benchmarks(tmp_path, repeat=3, warmup=0, only=CHEAP, isolate=False)
+    json.dumps(report)  # machine-readable
+
+    assert report["schema"] == 1
+    assert len(report["results"]) == 2 * len(CHEAP)  # extractor + loader per document
+    for result in report["results"]:
+        assert result["status"] == "ok", result["detail"]
+        latency = result["latency_ms"]
+        assert latency["min"] <= latency["p50"] <= latency["p95"] <= latency["max"]
+        assert result["throughput"]["mb_per_s"] > 0
+        assert result["peak_rss_mb"] > 0
+
+
+def test_percentile_interpolates():
+    assert _percentile([1.0], 95) == 1.0
+    assert _percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert _percentile([0.0, 10.0], 95) == 9.5
+
+
+def _report(p50: float, rss: float = 60.0, status: str = "ok") -> dict:
+    return {
+        "results": [
+            {
+                "key": "large.log:TextExtractor",
+                "status": status,
+                "latency_ms": {"p50": p50, "p95": p50 * 1.2, "mean": p50},
+                "throughput": {"mb_per_s": 100 / p50},
+                "peak_rss_mb": rss,
+            }
+        ]
+    }
+
+
+def test_compare_flags_regressions_beyond_noise(tmp_path, capsys):
+    assert not compare(_report(100), _report(105)).regressions  # within 10 %
+    assert not compare(_report(0.2), _report(0.6)).regressions  # sub-ms jitter
+
+    slower = compare(_report(100), _report(150))
+    assert {c.metric for c in slower.regressions} == {"p50_ms", "p95_ms", "mb_per_s"}
+
+    fatter = compare(_report(100), _report(100, rss=120))
+    assert [c.metric for c in fatter.regressions] == ["peak_rss_mb"]
+
+    base, cur = tmp_path / "base.json", tmp_path / "cur.json"
+    base.write_text(json.dumps(_report(100)))
+    cur.write_text(json.dumps(_report(150)))
+    assert bench_main(["compare", str(base), str(cur)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    assert bench_main(["compare", str(base), str(base)]) == 0
+
+
+def test_compare_flags_cases_that_start_failing(tmp_path, capsys):
+    broken = compare(_report(100), _report(100, status="error"))
+
+    assert broken.failed == ["large.log:TextExtractor"] and not broken.missing
+    assert broken.regressed and "fails in the current run  REGRESSION" in broken.format()
+    assert not compare(_report(100, status="error"), _report(100, status="error")).regressed
+
+    base, cur = tmp_path / "base.json", tmp_path / "cur.json"
+    base.write_text(json.dumps(_report(100)))
+    cur.write_text(json.dumps(_report(100, status="error")))
+    assert bench_main(["compare", str(base), str(cur)]) == 1
+
+
+def _touch(mib: int) -> int:
+    return len(bytearray(mib * 1024 * 1024))
+
+
+def test_peak_rss_includes_pool_workers():
+    get_default_executor().submit(_touch, 300).result()  # only a worker grows
+
+    assert _peak_rss_mb() >= 300
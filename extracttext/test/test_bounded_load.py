@@ -0,0 +1,152 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+import extracttext.encoding
+import extracttext.ocr
+from extracttext import DataLoader, DocumentType, load
+from extracttext.cache import MemoryCache
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def _pdf(page_texts) -> bytes:
+    """Minimal multi-page PDF with one line of Helvetica text per page."""
+    n = len(page_texts)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(n)), n),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(page_texts):
+        stream = b"BT /F1 24 Tf 72 700 Td (%s) Tj ET" % text.encode()
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+PAGES = [f"Page number {i}" for i in range(6)]
+
+
+def test_pdf_page_selection():
+    data = _pdf(PAGES)
+
+    result = DataLoader().load(data, filename="doc.pdf", pages=range(2))
+    print(f"[bounded] pages 0-1 → {result.text_payload!r}")
+
+    assert result.document_type == DocumentType.PDF_TEXT
+    assert [p.strip() for p in result.text_payload.split("\f")] == PAGES[:2]
+    assert not result.partial
+
+    picked = load(data, filename="doc.pdf", pages=[4, 1])
+    assert [p.strip() for p in picked.text_payload.split("\f")] == [PAGES[1], PAGES[4]]
+
+    beyond = load(data, filename="doc.pdf", pages=range(10, 12))
+    assert beyond.text_payload == "" and beyond.document_type == DocumentType.PDF_TEXT
+
+
+def test_max_chars_stops_decoding_early(monkeypatch, tmp_path):
+    path = tmp_path / "big.log"
+    line = "2024-01-01 12:00:00 INFO something happened in the service\n"
+    path.write_text(line * 100_000)  # ~6 MB
+
+    decoded = []
+    real = extracttext.encoding.iter_decoded
+
+    def counting(source, chunk_size=None):
+        for chunk in real(source, chunk_size):
+            decoded.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr(extracttext.encoding, "iter_decoded", counting)
+    monkeypatch.setenv("EXTRACTTEXT_TEXT_CHUNK_BYTES", str(64 * 1024))
+
+    result = load(path, max_chars=1000)
+
+    assert result.text_payload == (line * 20)[:1000]
+    assert result.partial
+    assert sum(decoded) < 256 * 1024, "only the first chunks may be decoded"
+
+    whole = load(path, max_chars=10**9)
+    assert not whole.partial and len(whole.text_payload) == len(line) * 100_000
+
+
+def test_unpaginated_document_is_page_zero():
+    path = SAMPLES_DIR / "text.txt"
+    full = load(path).text_payload
+
+    assert load(path, pages=[0]).text_payload == full
+    assert load(path, pages=[1, 2]).text_payload == ""
+    assert load(path, pages=[1, 2]).document_type == DocumentType.TEXT
+
+
+class _SlowEngine:
+    """Frame 0 is instant, every later frame takes a long time."""
+
+    def images_to_strings(self, paths, lang="eng"):
+        texts = []
+        for path in paths:
+            with Image.open(path) as img:
+                level = img.getpixel((0, 0))
+            if level:
+                time.sleep(1.0)
+            texts.append(f"frame {level}")
+        return texts
+
+
+def test_deadline_returns_partial_result(monkeypatch, tmp_path):
+    monkeypatch.setattr(extracttext.ocr, "get_engine", lambda name=None: _SlowEngine())
+    monkeypatch.setenv("OCR_RASTER_DIR", str(tmp_path))
+    monkeypatch.setenv("OCR_BATCH_SIZE", "1")
+    frames = [Image.new("L", (32, 32), level) for level in (0, 50, 100, 150)]
+    buf = BytesIO()
+    frames[0].save(buf, format="TIFF", save_all=True, append_images=frames[1:])
+
+    with ThreadPoolExecutor(2) as pool:
+        start = time.monotonic()
+        result = DataLoader(executor=pool).load(buf.getvalue(), filename="fax.tif", deadline=0.3)
+        elapsed = time.monotonic() - start
+
+    print(f"[bounded] deadline result after {elapsed:.2f}s: {result.text_payload!r}")
+
+    assert result.partial
+    assert result.document_type == DocumentType.IMAGE
+    assert result.text_payload == "frame 0"
+    assert elapsed < 0.9, "running OCR tasks must be abandoned at the deadline"
+
+
+def test_bounded_results_use_but_never_fill_the_cache():
+    cache = MemoryCache()
+    loader = DataLoader(cache=cache)
+    data = _pdf(PAGES)
+
+    loader.load(data, filename="doc.pdf", pages=[0])
+    assert loader.load(data, filename="doc.pdf", max_chars=5).partial
+    assert len(cache) == 0
+
+    full = loader.load(data, filename="doc.pdf")
+    cached = loader.load(data, filename="doc.pdf", pages=[2, 3])
+    assert [p.strip() for p in cached.text_payload.split("\f")] == PAGES[2:4]
+    assert full.text_payload.startswith(PAGES[0])
+
+
+def test_invalid_max_chars():
+    with pytest.raises(ValueError):
+        load(SAMPLES_DIR / "text.txt", max_chars=-1)
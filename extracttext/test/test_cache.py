@@ -0,0 +1,111 @@
+from pathlib import Path
+import os
+import subprocess
+import sys
+
+from extracttext.cache import CachedResult, DiskCache, MemoryCache, TieredCache
+from extracttext.dataloader import DataLoader
+from extracttext.extractors.base_extractor import DocumentType
+from extracttext.extractors.text_file import TextExtractor
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def _entry(text: str) -> CachedResult:
+    return CachedResult(DocumentType.TEXT, text)
+
+
+def test_memory_cache_lru():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", _entry("A"))
+    cache.set("b", _entry("B"))
+    cache.get("a")  # "b" becomes least recently used
+    cache.set("c", _entry("C"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") == _entry("A")
+    assert len(cache) == 2
+
+
+def test_disk_cache_size_cap(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=600)
+    for n in range(10):
+        cache.set(f"{n:02d}" * 8, _entry("x" * 100))
+
+    print(f"[cache] disk tier holds {cache.size_bytes} bytes")
+
+    assert cache.size_bytes <= 600
+    assert cache.get("09" * 8) == _entry("x" * 100)
+    assert cache.get("00" * 8) is None
+
+
+def test_tiered_cache_promotes_disk_hits(tmp_path):
+    disk = DiskCache(tmp_path)
+    disk.set("k" * 16, _entry("from disk"))
+    cache = TieredCache(MemoryCache(), disk)
+
+    assert cache.get("k" * 16) == _entry("from disk")
+    assert cache.memory.get("k" * 16) == _entry("from disk")
+
+
+def test_dataloader_serves_repeat_from_cache(monkeypatch):
+    calls = []
+    original = TextExtractor.extract_text
+
+    def _counting(self, source):
+        calls.append(source)
+        return original(self, source)
+
+    monkeypatch.setattr(TextExtractor, "extract_text", _counting)
+
+    loader = DataLoader(cache=MemoryCache())
+    first = loader.load(SAMPLES_DIR / "text.txt")
+    second = loader.load((SAMPLES_DIR / "text.txt").read_bytes(), filename="copy.txt")
+
+    assert len(calls) == 1
+    assert second.text_payload == first.text_payload
+    assert second.document_name == "copy.txt"
+    assert second.document_id != first.document_id
+
+    # Settings that change the output must change the key
+    monkeypatch.setenv("OCR_LANG", "deu")
+    loader.load(SAMPLES_DIR / "text.txt")
+    assert len(calls) == 2
+
+
+def test_server_import_creates_no_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    env = {**os.environ, "EXTRACTTEXT_CACHE_DIR": str(cache_dir)}
+    # Fresh interpreter: the app module may already be imported here
+    subprocess.run(
+        [sys.executable, "-c", "import extracttext.server"], check=True, env=env, cwd=Path(__file__).resolve().parents[2]
+    )
+
+    assert not cache_dir.exists()
+
+
+def test_cached_text_load_imports_no_backend(tmp_path):
+    document = tmp_path / "notes.txt"
+    document.write_text("hello cache\n")
+    code = (
+        "import sys\n"
+        "from extracttext import DataLoader\n"
+        "from extracttext.cache import MemoryCache\n"
+        "loader = DataLoader(cache=MemoryCache())\n"
+        f"loader.load({str(document)!r}); loader.load({str(document)!r})\n"
+        "print(sorted(m for m in ('PIL', 'docx', 'lxml', 'pdfminer') if m in sys.modules))\n"
+    )
+    cwd = Path(__file__).resolve().parents[2]
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=cwd, check=True)
+
+    assert out.stdout.strip() == "[]"
+
+
+def test_cache_key_tracks_text_decoding_settings(monkeypatch):
+    path = SAMPLES_DIR / "text.txt"
+    keys = set()
+    for sample, chunk in (("65536", "1048576"), ("64", "1048576"), ("64", "100")):
+        monkeypatch.setenv("EXTRACTTEXT_TEXT_SAMPLE_BYTES", sample)
+        monkeypatch.setenv("EXTRACTTEXT_TEXT_CHUNK_BYTES", chunk)
+        keys.add(DataLoader()._cache_key(path, ".txt"))
+    assert len(keys) == 3
@@ -0,0 +1,27 @@
+import pytest
+
+from extracttext.concurrency import InlineExecutor, get_default_executor, resolve_executor
+
+
+def _executor_kind() -> str:
+    return type(resolve_executor()).__name__
+
+
+def test_default_pool_is_shared():
+    assert get_default_executor() is get_default_executor()
+    assert resolve_executor() is get_default_executor()
+
+
+def test_no_nested_pool_inside_workers():
+    kind = get_default_executor().submit(_executor_kind).result()
+
+    print(f"[concurrency] executor inside worker: {kind}")
+
+    assert kind == "InlineExecutor"
+
+
+def test_inline_executor_propagates_errors():
+    fut = InlineExecutor().submit(int, "not a number")
+
+    with pytest.raises(ValueError):
+        fut.result()
@@ -0,0 +1,126 @@
+from pathlib import Path
+import codecs
+import io
+import zipfile
+
+import pytest
+
+from extracttext import DataLoader, DocumentType
+from extracttext.detector import (
+    KIND_CSV,
+    KIND_DOCX,
+    KIND_IMAGE,
+    KIND_PDF,
+    KIND_TEXT,
+    probe_document,
+    sniff_kind,
+)
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+@pytest.mark.parametrize(
+    "sample, kind",
+    [
+        ("pdf_text.pdf", KIND_PDF),
+        ("pdf-notext.pdf", KIND_PDF),
+        ("docx.docx", KIND_DOCX),
+        ("image.png", KIND_IMAGE),
+        ("csv.csv", KIND_CSV),
+        ("text.txt", KIND_TEXT),
+    ],
+)
+def test_sniff_samples(sample, kind):
+    with open(SAMPLES_DIR / sample, "rb") as fp:
+        assert sniff_kind(fp, Path(sample).suffix) == kind
+        assert fp.tell() == 0
+
+
+def test_sniff_signatures_and_boms():
+    assert sniff_kind(io.BytesIO(b"II*\x00" + b"\x00" * 16)) == KIND_IMAGE
+    assert sniff_kind(io.BytesIO(b"\xff\xd8\xff\xe0" + b"\x00" * 16)) == KIND_IMAGE
+    assert sniff_kind(io.BytesIO(codecs.BOM_UTF16_LE + "hello".encode("utf-16-le"))) == KIND_TEXT
+    assert sniff_kind(io.BytesIO(codecs.BOM_UTF8 + b"a,b\n1,2\n"), ".csv") == KIND_CSV
+    assert sniff_kind(io.BytesIO(b"")) is None
+
+
+def test_sniff_zip_without_word_document():
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("xl/workbook.xml", "<workbook/>")
+
+    buf.seek(0)
+    assert sniff_kind(buf, ".docx") is None
+
+
+@pytest.mark.parametrize(
+    "sample, wrong_name, expected",
+    [
+        ("pdf_text.pdf", "upload.bin", DocumentType.PDF_TEXT),
+        ("docx.docx", "tmpab12_report", DocumentType.DOCX),
+    ],
+)
+def test_misnamed_files_are_routed_by_content(sample, wrong_name, expected):
+    data = (SAMPLES_DIR / sample).read_bytes()
+
+    res = DataLoader(in_memory=True).load(data, filename=wrong_name)
+
+    assert res.document_type == expected
+
+
+def test_dispatch_skips_unrelated_extractors():
+    # A PNG named .pdf must never reach the PDF extractors
+    data = (SAMPLES_DIR / "image.png").read_bytes()
+    loader = DataLoader()
+    probe = probe_document(data, name="scan.pdf")
+
+    candidates = loader._candidates(probe)
+
+    print(f"[dispatch] {probe.kind} → {[e.DOCUMENT_TYPE.value for e in candidates]}")
+
+    assert [e.DOCUMENT_TYPE for e in candidates] == [DocumentType.IMAGE]
+    assert not probe.is_pdf
+
+
+def test_text_mentioning_pdf_signature_stays_text(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text(
+        "2024-05-01T12:00:00Z INFO upload received\n"
+        "2024-05-01T12:00:01Z WARN header %PDF-1.4 found after junk bytes\n"
+    )
+
+    probe = probe_document(log)
+    result = DataLoader().load(log)
+
+    print(f"[sniff] {probe.kind} / {probe.mime_type} → {result.document_type}")
+    assert probe.kind == KIND_TEXT and not probe.is_pdf
+    assert result.document_type == DocumentType.TEXT
+
+    # Leading junk is still tolerated for .pdf files and binary prefixes
+    assert sniff_kind(io.BytesIO(b"garbage\n%PDF-1.4\n"), ".pdf") == KIND_PDF
+    assert sniff_kind(io.BytesIO(b"\x00\x01\x02%PDF-1.4\n")) == KIND_PDF
+
+
+def test_comma_separated_txt_stays_text(tmp_path):
+    rows = "".join(f"{n},name{n},{n * 3}\n" for n in range(50))
+    notes = tmp_path / "notes.txt"
+    notes.write_text("id,name,value\n" + rows)
+
+    assert DataLoader().load(notes).document_type == DocumentType.TEXT
+    with open(notes, "rb") as fp:
+        assert sniff_kind(fp, ".txt") == KIND_TEXT
+
+
+def test_probe_sniffs_mime_type_once(monkeypatch):
+    import extracttext.detector as detector
+
+    calls = []
+    real = detector.detect_mime_type
+    monkeypatch.setattr(detector, "detect_mime_type", lambda source: calls.append(1) or real(source))
+
+    memory = probe_document((SAMPLES_DIR / "text.txt").read_bytes(), name="text.txt")
+    on_disk = probe_document(SAMPLES_DIR / "text.txt")
+
+    assert memory.mime_type == on_disk.mime_type == "text/plain"
+    assert len(calls) == 2  # one libmagic lookup per probe
+    assert probe_document(SAMPLES_DIR / "pdf_text.pdf").mime_type == "application/pdf"
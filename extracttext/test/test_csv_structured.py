@@ -0,0 +1,93 @@
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+import extracttext.encoding
+from extracttext.extractors.csv_file import CsvExtractor
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def test_open_rows_sample():
+    with CsvExtractor().open_rows(SAMPLES_DIR / "csv.csv") as rows:
+        table = list(rows)
+
+    print(f"[csv-rows] columns={rows.columns} first={table[0]}")
+
+    assert rows.columns[0] == "id"
+    assert rows.dialect.delimiter == ","
+    assert all(len(r) == len(rows.columns) for r in table)
+
+
+def test_projection_limit_and_dialect():
+    data = "name;age;city\nAda;36;London\nAlan;41;Wilmslow\nGrace;85;Arlington\n".encode()
+
+    with CsvExtractor().open_rows(data, columns=["city", "name"], limit=2) as rows:
+        assert rows.columns == ["city", "name"]
+        assert list(rows) == [("London", "Ada"), ("Wilmslow", "Alan")]
+
+
+def test_quoted_multiline_fields_across_chunks(monkeypatch):
+    monkeypatch.setenv("EXTRACTTEXT_TEXT_CHUNK_BYTES", "8")
+    data = b'id,note\r\n1,"first\r\nsecond"\r\n2,plain\r\n'
+
+    rows = list(CsvExtractor().open_rows(data))
+
+    assert rows == [("1", "first\r\nsecond"), ("2", "plain")]
+
+
+def test_ragged_rows_and_index_projection():
+    data = b"a,b,c\n1,2,3\n4\n"
+
+    assert list(CsvExtractor().open_rows(data, columns=[2, 0])) == [("3", "1"), ("", "4")]
+    assert list(CsvExtractor().open_rows(data, columns=["b"])) == [("2",), ("",)]
+
+
+def test_headerless_and_unknown_column():
+    data = b"1,2\n3,4\n"
+
+    cols = CsvExtractor().read_columns(data, header=False)
+
+    assert cols == {"0": ["1", "3"], "1": ["2", "4"]}
+    with pytest.raises(ValueError):
+        CsvExtractor().open_rows(b"a,b\n1,2\n", columns=["zzz"])
+
+
+def test_read_columns_materialises_only_selected(tmp_path):
+    path = tmp_path / "export.csv"
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("id,payload,flag\n")
+        for n in range(20_000):
+            fh.write(f"{n},{'x' * 50},{n % 2}\n")
+
+    cols = CsvExtractor().read_columns(path, columns=["id", "flag"], limit=10_000)
+
+    assert list(cols) == ["id", "flag"]
+    assert len(cols["id"]) == 10_000 and cols["flag"][:3] == ["0", "1", "0"]
+
+
+def test_close_releases_the_mapped_file(tmp_path, monkeypatch):
+    path = tmp_path / "export.csv"
+    path.write_text("id,name\n" + "".join(f"{n},row{n}\n" for n in range(50_000)))
+    open_buffers = []
+    real_buffer = extracttext.encoding._buffer
+
+    @contextmanager
+    def _tracked(source):
+        with real_buffer(source) as buf:
+            open_buffers.append(buf)
+            try:
+                yield buf
+            finally:
+                open_buffers.remove(buf)
+
+    monkeypatch.setattr(extracttext.encoding, "_buffer", _tracked)
+    monkeypatch.setenv("EXTRACTTEXT_TEXT_CHUNK_BYTES", "4096")  # file spans many chunks
+
+    rows = CsvExtractor().open_rows(path)
+    assert next(iter(rows)) == ("0", "row0")
+    assert open_buffers  # decoder suspended mid-file
+
+    rows.close()
+    assert not open_buffers
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from extracttext.detector import probe_document
+from extracttext.extractors.pdf_ocr import PdfOcrExtractor
+from extracttext.extractors.pdf_text import PdfTextExtractor
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def test_probe_text_pdf():
+    probe = probe_document(SAMPLES_DIR / "pdf_text.pdf")
+
+    print(f"[probe] {probe}")
+
+    assert probe.is_pdf
+    assert probe.page_count == 1
+    assert probe.has_text_layer is True
+    assert probe.is_encrypted is False
+    assert probe.producer and "Skia" in probe.producer
+
+
+def test_probe_scanned_pdf_shared_by_extractors():
+    path = SAMPLES_DIR / "pdf-notext.pdf"
+    probe = probe_document(path)
+
+    assert probe.has_text_layer is False
+    assert probe.producer == "GPL Ghostscript 8.15"
+
+    # Both PDF extractors decide from the same probe without re-parsing
+    assert not PdfTextExtractor().can_process(path, probe)
+    assert PdfOcrExtractor().can_process(path, probe)
+
+
+def test_probe_non_pdf_is_cheap():
+    probe = probe_document(SAMPLES_DIR / "text.txt")
+
+    assert not probe.is_pdf
+    assert probe.suffix == ".txt"
+    assert probe.page_count is None and probe.has_text_layer is None
@@ -0,0 +1,110 @@
+from io import BytesIO
+from pathlib import Path
+import os
+import subprocess
+import sys
+import zipfile
+
+import docx
+import pytest
+
+from extracttext.extractors.docx import DocxExtractor
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def _build_docx() -> bytes:
+    document = docx.Document()
+    document.add_paragraph("Intro paragraph")
+    table = document.add_table(rows=2, cols=3)
+    table.cell(0, 0).text = "h1"
+    table.cell(0, 2).text = "h3"
+    table.cell(1, 0).text = "a"
+    table.cell(1, 1).text = "b"
+    table.cell(1, 2).text = "c"
+    para = document.add_paragraph("left")
+    run = para.add_run()
+    run.add_tab()
+    run.add_text("right")
+    run.add_break()
+    run.add_text("next line")
+    document.add_paragraph("   ")
+    document.add_paragraph("Closing paragraph")
+
+    buf = BytesIO()
+    document.save(buf)
+    return buf.getvalue()
+
+
+def test_stream_engine_keeps_body_order():
+    blocks = list(DocxExtractor().iter_blocks(_build_docx()))
+
+    print(f"[docx-stream] {blocks}")
+
+    assert blocks == [
+        "Intro paragraph",
+        "h1\th3",
+        "a\tb\tc",
+        "left\tright\nnext line",
+        "Closing paragraph",
+    ]
+
+
+def _rename_main_part(data: bytes, part: str) -> bytes:
+    """Move ``word/document.xml`` to *part*, updating the package references."""
+    out = BytesIO()
+    with zipfile.ZipFile(BytesIO(data)) as src, zipfile.ZipFile(out, "w") as dst:
+        for info in src.infolist():
+            payload = src.read(info)
+            if info.filename in ("_rels/.rels", "[Content_Types].xml"):
+                payload = payload.replace(b"word/document.xml", part.encode())
+            dst.writestr(part if info.filename == "word/document.xml" else info.filename, payload)
+    return out.getvalue()
+
+
+def test_stream_engine_resolves_main_part_from_rels(monkeypatch):
+    data = _rename_main_part(_build_docx(), "word/document2.xml")
+
+    stream = DocxExtractor().extract_text(data)
+    monkeypatch.setenv("DOCX_ENGINE", "python-docx")
+    legacy = DocxExtractor().extract_text(data)
+
+    assert stream.splitlines()[0] == "Intro paragraph"
+    assert sorted(stream.splitlines()) == sorted(legacy.splitlines())
+
+
+def test_engines_agree_on_content(monkeypatch):
+    data = _build_docx()
+
+    stream = DocxExtractor().extract_text(data)
+    monkeypatch.setenv("DOCX_ENGINE", "python-docx")
+    legacy = DocxExtractor().extract_text(data)
+
+    # Same lines, only the table position differs
+    assert sorted(stream.splitlines()) == sorted(legacy.splitlines())
+
+
+def test_stream_engine_matches_sample():
+    path = SAMPLES_DIR / "docx.docx"
+
+    assert DocxExtractor().extract_text(path) == DocxExtractor()._extract_object_model(path)
+
+
+def test_unknown_engine(monkeypatch):
+    monkeypatch.setenv("DOCX_ENGINE", "nope")
+
+    with pytest.raises(ValueError):
+        DocxExtractor().extract_text(SAMPLES_DIR / "docx.docx")
+
+
+def test_stream_engine_does_not_import_python_docx():
+    code = (
+        "import sys\n"
+        "from extracttext.extractors.docx import DocxExtractor\n"
+        f"DocxExtractor().extract_text({str(SAMPLES_DIR / 'docx.docx')!r})\n"
+        "print(sorted(m for m in ('docx', 'lxml') if m in sys.modules))\n"
+    )
+    env = {**os.environ, "DOCX_ENGINE": "stream"}
+    cwd = Path(__file__).resolve().parents[2]
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=cwd, check=True)
+    assert out.stdout.strip() == "[]"
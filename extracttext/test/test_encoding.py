@@ -0,0 +1,61 @@
+import codecs
+
+from extracttext.encoding import detect_encoding, iter_decoded
+from extracttext.extractors.text_file import TextExtractor
+
+
+def test_detect_encoding_fast_paths():
+    assert detect_encoding(codecs.BOM_UTF8 + b"abc") == "utf-8-sig"
+    assert detect_encoding(codecs.BOM_UTF16_LE + "abc".encode("utf-16-le")) == "utf-16"
+    assert detect_encoding("naïve café".encode("utf-8"), complete=True) == "utf-8"
+    # A multi-byte sequence cut at the end of a partial sample is still UTF-8
+    assert detect_encoding("café".encode("utf-8")[:-1]) == "utf-8"
+
+
+def test_detect_encoding_falls_back_to_chardet():
+    sample = ("Größenänderung der Übersicht für Kunden. " * 20).encode("latin-1")
+
+    encoding = detect_encoding(sample, complete=True)
+
+    print(f"[encoding] chardet picked {encoding!r}")
+
+    assert sample.decode(encoding) == sample.decode("latin-1")
+
+
+def test_iter_decoded_chunk_boundaries(tmp_path):
+    text = "ünïcödé ✓ line\n" * 500
+    path = tmp_path / "log.txt"
+    path.write_bytes(text.encode("utf-8"))
+
+    # Chunk size that splits multi-byte characters
+    assert "".join(iter_decoded(path, chunk_size=7)) == text
+    assert "".join(iter_decoded(text.encode("utf-16"), chunk_size=5)) == text
+
+
+def test_iter_decoded_recovers_from_unrepresentative_sample(monkeypatch):
+    monkeypatch.setenv("EXTRACTTEXT_TEXT_SAMPLE_BYTES", "64")
+    data = b"plain ascii header\n" * 10 + ("Größe " * 50).encode("latin-1")
+
+    text = "".join(iter_decoded(data, chunk_size=64))
+
+    assert text.startswith("plain ascii header\n")
+    assert len(text) >= len(data) - 64
+
+
+def test_iter_decoded_empty(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert list(iter_decoded(path)) == []
+    assert TextExtractor().extract_text(path) == ""
+
+
+def test_text_iter_pages_split_on_lines(monkeypatch):
+    monkeypatch.setenv("EXTRACTTEXT_TEXT_CHUNK_BYTES", "100")
+    data = b"".join(b"line %04d\n" % n for n in range(100))
+
+    pages = list(TextExtractor().iter_pages(data))
+
+    assert len(pages) > 1
+    assert all(p.endswith("\n") for p in pages)
+    assert "".join(pages) == data.decode()
@@ -0,0 +1,99 @@
+import importlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from extracttext import DataLoader
+from extracttext.bench import run_startup
+from extracttext.extractors import BaseExtractor, DocumentType, ExtractorSpec, register_extractor, unregister_extractor
+from extracttext.extractors import registry
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = ["pdfminer", "docx", "PIL", "pdf2image", "pytesseract", "chardet", "magic", "extracttext.extractors.pdf_text"]
+
+
+def test_import_loads_no_backend():
+    code = (
+        "import json, sys, extracttext, extracttext.cli\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=PACKAGE_ROOT, check=True)
+    print(f"[startup] heavy modules after import: {out.stdout.strip()}")
+    assert json.loads(out.stdout) == []
+
+
+def test_builtin_specs_match_their_classes():
+    for spec in (*registry.BUILTIN_SPECS, registry.HYBRID_PDF_SPEC):
+        module_name, _, class_name = spec.target.partition(":")
+        cls = getattr(importlib.import_module(module_name), class_name)
+        assert spec.name == cls.__name__
+        assert spec.document_type == cls.DOCUMENT_TYPE
+        assert spec.kind == cls.DOCUMENT_KIND
+        assert spec.extensions == cls.EXTENSIONS
+
+
+class _ShoutingExtractor(BaseExtractor):
+    DOCUMENT_TYPE = DocumentType.TEXT
+    DOCUMENT_KIND = "text"
+    EXTENSIONS = frozenset({".shout"})
+
+    def can_process(self, source, probe=None):
+        return self._matches(source, probe, self.EXTENSIONS)
+
+    def extract_text(self, source):
+        return Path(source).read_text().upper()
+
+
+def test_registered_extractor_is_dispatched(tmp_path):
+    document = tmp_path / "notes.shout"
+    document.write_text("hello registry\n")
+
+    spec = register_extractor(_ShoutingExtractor, priority=0)
+    try:
+        assert spec in registry.registered_specs()
+        result = DataLoader().load(document)
+    finally:
+        unregister_extractor(spec)
+
+    assert result.text_payload == "HELLO REGISTRY\n"
+    assert spec not in registry.registered_specs()
+    assert DataLoader().load(document).text_payload == "hello registry\n"
+
+
+def test_entry_point_plugins(monkeypatch):
+    class _EntryPoint:
+        def __init__(self, name, value):
+            self.name, self._value = name, value
+
+        def load(self):
+            if isinstance(self._value, Exception):
+                raise self._value
+            return self._value
+
+    lazy = ExtractorSpec("LazyExtractor", "not_installed_yet:LazyExtractor", DocumentType.TEXT, "text", frozenset({".lazy"}))
+    found = [_EntryPoint("lazy", lazy), _EntryPoint("shout", _ShoutingExtractor), _EntryPoint("broken", ImportError("nope"))]
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda group=None: found)
+    monkeypatch.setattr(registry, "_PLUGINS", None)
+    monkeypatch.setattr(registry, "_ORDERED", None)
+
+    with pytest.warns(RuntimeWarning, match="broken"):
+        specs = registry.registered_specs()
+
+    names = [s.name for s in specs]
+    assert names[-2:] == ["LazyExtractor", "_ShoutingExtractor"]
+    assert not lazy.loaded  # a spec entry point is not imported at discovery
+
+
+def test_startup_benchmark_report():
+    report = run_startup(repeat=1, scenarios=["python", "import", "first-load-text"])
+    latencies = {r["key"]: r["latency_ms"]["p50"] for r in report["results"]}
+    print(f"[startup] {latencies}")
+
+    assert report["schema"] == 1
+    assert all(r["status"] == "ok" for r in report["results"])
+    assert set(latencies) == {"startup:python", "startup:import", "startup:first-load-text", "startup:first-load-text:call"}
@@ -0,0 +1,54 @@
+from pathlib import Path
+import io
+import tempfile
+
+import pytest
+
+from extracttext import DataLoader, DocumentType
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+@pytest.fixture
+def no_temp_files(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise AssertionError("in-memory dispatch must not create a temp file")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", _fail)
+
+
+@pytest.mark.parametrize(
+    "sample, expected",
+    [
+        ("pdf_text.pdf", DocumentType.PDF_TEXT),
+        ("docx.docx", DocumentType.DOCX),
+        ("csv.csv", DocumentType.CSV),
+        ("text.txt", DocumentType.TEXT),
+    ],
+)
+def test_in_memory_bytes_match_path(no_temp_files, sample, expected):
+    path = SAMPLES_DIR / sample
+    data = path.read_bytes()
+
+    res = DataLoader(in_memory=True).load(data, filename=sample)
+
+    assert res.document_type == expected
+    assert res.document_name == sample
+    assert res.text_payload == DataLoader().load(path).text_payload
+
+
+def test_in_memory_stream(no_temp_files):
+    data = (SAMPLES_DIR / "pdf_text.pdf").read_bytes()
+
+    res = DataLoader(in_memory=True).load(io.BytesIO(data), filename="upload.pdf")
+
+    assert res.document_type == DocumentType.PDF_TEXT
+
+
+def test_in_memory_large_stream_spills_to_disk(monkeypatch):
+    monkeypatch.setenv("EXTRACTTEXT_IN_MEMORY_MAX_BYTES", "16")
+    data = (SAMPLES_DIR / "docx.docx").read_bytes()
+
+    res = DataLoader(in_memory=True).load(io.BytesIO(data), filename="big.docx")
+
+    assert res.document_type == DocumentType.DOCX
@@ -0,0 +1,100 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from extracttext import DataLoader, load
+from extracttext.extractors import PdfTextExtractor
+from extracttext.instrumentation import add_hook, remove_hook
+from extracttext.server.metrics import MetricsRegistry
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def test_trace_reports_pipeline_stages():
+    result = load(SAMPLES_DIR / "pdf_text.pdf", trace=True)
+
+    for span in result.spans:
+        print(f"[trace] {span.name:<10} {span.duration_ms:>8.3f} ms {span.attrs}")
+
+    assert [s.name for s in result.spans] == ["normalise", "probe", "extract", "load"]
+    extract, root = result.spans[2], result.spans[-1]
+    assert extract.attrs == {"extractor": "PdfTextExtractor", "document_type": "pdf_text"}
+    assert root.attrs["document_type"] == "pdf_text" and root.error is None
+    assert all(0 <= s.duration_ms <= root.duration_ms for s in result.spans)
+    assert "spans" in result.dict()
+
+    assert load(SAMPLES_DIR / "pdf_text.pdf").spans is None
+    assert "spans" not in load(SAMPLES_DIR / "pdf_text.pdf").dict()
+
+
+def test_failed_extractor_attempts_are_spans(monkeypatch):
+    def _broken(self, source):
+        raise RuntimeError("corrupt text layer")
+
+    monkeypatch.setattr(PdfTextExtractor, "extract_text", _broken)
+    seen = []
+    loader = DataLoader(hooks=[lambda span, trace: seen.append(span)])
+
+    try:
+        loader.load(SAMPLES_DIR / "pdf_text.pdf")
+    except Exception:
+        pass  # the OCR fallback may be unavailable here
+
+    attempts = [s for s in seen if s.name == "extract"]
+    print(f"[trace] attempts: {[(s.attrs['extractor'], s.error) for s in attempts]}")
+
+    assert attempts[0].attrs["extractor"] == "PdfTextExtractor"
+    assert attempts[0].error == "RuntimeError: corrupt text layer"
+    assert seen[-1].name == "load"
+
+
+def test_global_hooks_and_bounded_loads():
+    seen = []
+
+    def _hook(span, trace):
+        seen.append(span.name)
+
+    add_hook(_hook)
+    try:
+        result = load(SAMPLES_DIR / "text.txt", max_chars=10)
+    finally:
+        remove_hook(_hook)
+    load(SAMPLES_DIR / "text.txt")
+
+    assert result.spans is None  # hooks alone do not attach spans
+    assert seen == ["normalise", "probe", "extract", "load"]
+
+
+def test_metrics_histograms_per_document_type():
+    registry = MetricsRegistry()
+    loader = DataLoader(hooks=[registry.hook])
+    loader.load(SAMPLES_DIR / "text.txt")
+    loader.load(SAMPLES_DIR / "text.txt")
+    loader.load(SAMPLES_DIR / "csv.csv")
+
+    text = registry.render([("extracttext_admission_waiting", "Queued requests.", "doc_class", {"ocr": 2})])
+    print(text)
+
+    assert "# TYPE extracttext_load_duration_seconds histogram" in text
+    assert 'extracttext_load_duration_seconds_count{document_type="text",status="ok"} 2' in text
+    assert 'extracttext_load_duration_seconds_bucket{document_type="csv",status="ok",le="+Inf"} 1' in text
+    assert 'extracttext_stage_duration_seconds_count{document_type="text",stage="probe"} 2' in text
+    assert 'extracttext_extractor_attempts_total{extractor="TextExtractor",status="ok"} 2' in text
+    assert 'extracttext_admission_waiting{doc_class="ocr"} 2' in text
+
+
+def test_server_metrics_endpoint(tmp_path, monkeypatch):
+    import extracttext.server as server
+
+    monkeypatch.setenv("EXTRACTTEXT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(server, "_LOADER", None)  # rebuilt with the isolated cache
+    client = TestClient(server.app)
+    data = (SAMPLES_DIR / "text.txt").read_bytes()
+    response = client.post("/gettext?trace=true", files={"file": ("notes.txt", data)})
+    assert response.status_code == 200
+    assert [s["name"] for s in response.json()["spans"]][-1] == "load"
+
+    metrics = client.get("/metrics")
+    assert metrics.status_code == 200
+    assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'extracttext_load_duration_seconds_count{document_type="text",status="ok"}' in metrics.text
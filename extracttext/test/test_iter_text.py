@@ -0,0 +1,133 @@
+from pathlib import Path
+import asyncio
+import json
+import random
+import tempfile
+
+from extracttext import DataLoader, DocumentType, TextFragment
+from extracttext.bench.corpus import _page_lines, _pdf
+from extracttext.cache import MemoryCache
+from extracttext.ocr.pipeline import in_page_order
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def test_iter_text_pdf_pages_match_load():
+    path = SAMPLES_DIR / "pdf_text.pdf"
+
+    fragments = list(DataLoader().iter_text(path))
+
+    print(f"[iter_text] {[(f.page, len(f.text), f.elapsed_ms) for f in fragments]}")
+
+    assert [f.page for f in fragments] == list(range(1, len(fragments) + 1))
+    assert all(f.document_type == DocumentType.PDF_TEXT for f in fragments)
+    assert len({f.document_id for f in fragments}) == 1
+    # pdfminer terminates every page with a form-feed
+    assert "".join(f.text + "\f" for f in fragments) == DataLoader().load(path).text_payload
+
+
+def test_iter_text_unpaginated_single_fragment():
+    path = SAMPLES_DIR / "docx.docx"
+
+    fragments = list(DataLoader().iter_text(path))
+
+    assert len(fragments) == 1
+    assert isinstance(fragments[0], TextFragment)
+    assert fragments[0].text == DataLoader().load(path).text_payload
+    assert json.loads(fragments[0].json())["page"] == 1
+
+
+def test_iter_text_replays_cache(monkeypatch):
+    import extracttext.dataloader as dl
+
+    path = SAMPLES_DIR / "pdf_text.pdf"
+    loader = DataLoader(cache=MemoryCache())
+    expected = [f.text for f in DataLoader().iter_text(path)]
+    loader.load(path)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("cache hit must not probe the document")
+
+    monkeypatch.setattr(dl, "probe_document", _fail)
+
+    assert [f.text for f in loader.iter_text(path)] == expected
+
+
+def test_in_page_order_reorders_completions():
+    completions = [(2, "c"), (0, "a"), (3, "d"), (1, "b")]
+
+    assert list(in_page_order(completions, [0, 1, 2, 3])) == [(0, "a"), (1, "b"), (2, "c"), (3, "d")]
+
+
+def test_aiter_text():
+    data = (SAMPLES_DIR / "text.txt").read_bytes()
+
+    async def _main():
+        return [f async for f in DataLoader(in_memory=True).aiter_text(data, filename="notes.txt")]
+
+    fragments = asyncio.run(_main())
+
+    assert len(fragments) == 1
+    assert fragments[0].document_type == DocumentType.TEXT
+
+
+def _three_page_pdf() -> bytes:
+    rng = random.Random(3)
+    return _pdf([("text", _page_lines(rng, 4)) for _ in range(3)], 150)
+
+
+def test_aiter_text_yields_every_page():
+    data = _three_page_pdf()
+
+    async def _main():
+        return [f async for f in DataLoader(in_memory=True).aiter_text(data, filename="three.pdf")]
+
+    fragments = asyncio.run(_main())
+    expected = list(DataLoader(in_memory=True).iter_text(data, filename="three.pdf"))
+
+    assert [f.page for f in fragments] == [1, 2, 3]
+    assert [f.text for f in fragments] == [f.text for f in expected]
+    assert not any("\f" in f.text for f in fragments)
+
+
+def test_server_streams_ndjson(tmp_path, monkeypatch):
+    monkeypatch.setenv("EXTRACTTEXT_CACHE_DIR", str(tmp_path))
+    from fastapi.testclient import TestClient
+
+    import extracttext.server as server
+
+    monkeypatch.setattr(server, "_LOADER", DataLoader(in_memory=True))
+    client = TestClient(server.app)  # no context manager → lifespan (pool prewarm) skipped
+
+    resp = client.post("/gettext/stream", files={"file": ("doc.pdf", _three_page_pdf(), "application/pdf")})
+
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert lines[0]["page"] == 1 and lines[0]["document_type"] == "pdf_text"
+    assert [line["page"] for line in lines[:-1]] == [1, 2, 3]
+    assert lines[-1]["done"] is True and lines[-1]["pages"] == len(lines) - 1
+
+
+def test_server_stream_spools_upload_to_disk(tmp_path, monkeypatch):
+    monkeypatch.setenv("EXTRACTTEXT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    from fastapi.testclient import TestClient
+
+    import extracttext.server as server
+
+    monkeypatch.setattr(server, "_LOADER", None)
+    monkeypatch.setattr(tempfile, "tempdir", None)  # re-read TMPDIR
+    client = TestClient(server.app)
+    data = (SAMPLES_DIR / "text.txt").read_bytes()
+
+    resp = client.post("/gettext/stream", files={"file": ("notes.txt", data)})
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines[0]["document_name"] == "notes.txt" and lines[-1]["done"] is True
+    assert not list(tmp_path.glob("extracttext_upload_*"))  # spooled copy removed
+
+    monkeypatch.setenv("EXTRACTTEXT_MAX_UPLOAD_BYTES", str(len(data) - 1))
+    assert client.post("/gettext/stream", files={"file": ("notes.txt", data)}).status_code == 413
+    assert not list(tmp_path.glob("extracttext_upload_*"))
+    assert server._ADMISSION.stats()["text"]["running"] == 0
@@ -0,0 +1,133 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import itertools
+import os
+import threading
+import time
+
+from PIL import Image
+
+import extracttext.ocr
+from extracttext import DataLoader, DocumentType, UnsupportedDocumentError
+from extracttext.cache import MemoryCache
+from extracttext.extractors.pdf_ocr import PdfOcrExtractor
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+_BATCH = [
+    SAMPLES_DIR / "text.txt",
+    SAMPLES_DIR / "csv.csv",
+    SAMPLES_DIR / "docx.docx",
+    SAMPLES_DIR / "pdf_text.pdf",
+]
+
+
+def test_load_many_ordered():
+    results = list(DataLoader().load_many(_BATCH, ordered=True, max_workers=2))
+
+    print(f"[load_many] {[(r.index, r.document_name) for r in results]}")
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert all(r.ok for r in results)
+    assert [r.result.document_type for r in results] == [
+        DocumentType.TEXT,
+        DocumentType.CSV,
+        DocumentType.DOCX,
+        DocumentType.PDF_TEXT,
+    ]
+
+
+def test_load_many_reports_errors_per_item():
+    sources = [
+        SAMPLES_DIR / "text.txt",
+        SAMPLES_DIR / "does-not-exist.txt",
+        (b"\x00\x01", "blob.unknown"),
+    ]
+    results = sorted(DataLoader().load_many(sources), key=lambda r: r.index)
+
+    assert results[0].ok
+    assert isinstance(results[1].error, FileNotFoundError)
+    assert isinstance(results[2].error, UnsupportedDocumentError)
+
+
+def test_load_many_is_lazy():
+    consumed = []
+
+    def _gen():
+        for n in itertools.count():
+            consumed.append(n)
+            yield SAMPLES_DIR / "text.txt"
+
+    first = next(DataLoader().load_many(_gen(), max_workers=1))
+
+    assert first.ok
+    assert len(consumed) <= 2  # window of 1 plus one refill, never the whole stream
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Thread pool recording the peak number of tasks running at once."""
+
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self.running = self.peak = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        def _tracked():
+            with self._lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+            try:
+                time.sleep(0.02)
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        return super().submit(_tracked)
+
+
+def test_load_many_max_workers_caps_concurrency():
+    with _CountingExecutor(max_workers=8) as pool:
+        results = list(DataLoader(executor=pool).load_many(_BATCH * 4, max_workers=2))
+
+    assert all(r.ok for r in results) and len(results) == len(_BATCH) * 4
+    assert pool.peak <= 2
+
+
+def test_load_many_uses_cache():
+    loader = DataLoader(cache=MemoryCache())
+    list(loader.load_many([SAMPLES_DIR / "text.txt"]))
+    again = list(loader.load_many([SAMPLES_DIR / "text.txt"]))
+
+    assert again[0].result.text_payload.startswith("This is a TEXT document")
+    assert len(loader.cache) == 1
+
+
+class _SlowEngine:
+    def images_to_strings(self, paths, lang="eng"):
+        time.sleep(0.02)
+        return [f"page {Path(p).stem}\n" for p in paths]
+
+
+def test_load_many_fans_out_scanned_pdf_pages(monkeypatch, tmp_path):
+    def _render(self, path, dpi, output_folder, first_page, last_page):
+        paths = []
+        for page in range(first_page - 1, last_page):
+            raster = os.path.join(output_folder, f"{page}.pgm")
+            Image.new("L", (8, 8), 255).save(raster)
+            paths.append(raster)
+        return paths
+
+    monkeypatch.setattr(extracttext.ocr, "get_engine", lambda name=None: _SlowEngine())
+    monkeypatch.setattr(PdfOcrExtractor, "_page_count", lambda self, source: 8)
+    monkeypatch.setattr(PdfOcrExtractor, "_render", _render)
+    monkeypatch.setenv("OCR_RASTER_DIR", str(tmp_path))
+    monkeypatch.setenv("OCR_BATCH_SIZE", "1")
+
+    with _CountingExecutor(max_workers=4) as pool:
+        results = list(DataLoader(executor=pool).load_many([SAMPLES_DIR / "pdf-notext.pdf"]))
+
+    assert results[0].result.document_type == DocumentType.PDF_IMAGE
+    assert results[0].result.text_payload.split("\f") == [f"page {n}" for n in range(8)]
+    assert pool.peak > 1  # pages ran side by side, not one after another in a worker
@@ -0,0 +1,112 @@
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+import extracttext.extractors.image_ocr
+import extracttext.ocr
+from extracttext import DataLoader
+from extracttext.dataloader import DocumentType
+from extracttext.extractors.image_ocr import ImageOcrExtractor
+
+LEVELS = [10, 60, 110, 160, 210]
+
+
+def _fax(levels=LEVELS) -> bytes:
+    frames = [Image.new("L", (64, 48), level) for level in levels]
+    buf = BytesIO()
+    frames[0].save(buf, format="TIFF", save_all=True, append_images=frames[1:])
+    return buf.getvalue()
+
+
+class _FrameEngine:
+    """Reports each raster's gray level; early frames finish last."""
+
+    def __init__(self):
+        self.batches = []
+
+    def images_to_strings(self, paths, lang="eng"):
+        self.batches.append(len(paths))
+        texts = []
+        for path in paths:
+            with Image.open(path) as img:
+                level = img.getpixel((0, 0))
+            time.sleep((255 - level) / 255 * 0.02)
+            texts.append(f"frame {level}\n")
+        return texts
+
+
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    fake = _FrameEngine()
+    monkeypatch.setattr(extracttext.ocr, "get_engine", lambda name=None: fake)
+    monkeypatch.setenv("OCR_RASTER_DIR", str(tmp_path))
+    monkeypatch.setenv("OCR_BATCH_SIZE", "1")
+    return fake
+
+
+def test_every_frame_ocred_in_order(engine, tmp_path):
+    with ThreadPoolExecutor(4) as pool:
+        text = ImageOcrExtractor().extract_text(_fax(), executor=pool)
+
+    print(f"[multi-frame] {text!r}")
+
+    assert text == "\f".join(f"frame {level}" for level in LEVELS)
+    assert len(engine.batches) == len(LEVELS)  # one task per frame
+    assert not os.listdir(tmp_path), "frame rasters must be removed"
+
+
+def test_frames_stream_with_bounded_inflight(engine, monkeypatch):
+    monkeypatch.setenv("OCR_MAX_INFLIGHT", "2")
+
+    with ThreadPoolExecutor(4) as pool:
+        pages = list(ImageOcrExtractor().iter_pages(_fax(), executor=pool))
+
+    assert pages == [f"frame {level}" for level in LEVELS]
+
+
+def test_single_frame_text_is_stripped_like_frames(monkeypatch):
+    class _Engine:
+        def image_to_string(self, image, lang="eng"):
+            return "  single frame\n\n"
+
+    monkeypatch.setattr(extracttext.extractors.image_ocr, "get_engine", lambda name=None: _Engine())
+    buf = BytesIO()
+    Image.new("L", (64, 48), 128).save(buf, format="PNG")
+
+    assert ImageOcrExtractor().extract_text(buf.getvalue()) == "single frame"
+
+
+def test_loader_fans_out_multiframe_tiff(engine):
+    with ThreadPoolExecutor(4) as pool:
+        result = DataLoader(executor=pool).load(_fax(), filename="fax.tif")
+
+    assert result.document_type == DocumentType.IMAGE
+    assert result.text_payload.split("\f") == [f"frame {level}" for level in LEVELS]
+
+
+def test_image_ocr_does_not_import_pdf2image(tmp_path):
+    fax = tmp_path / "fax.tif"
+    fax.write_bytes(_fax())
+    code = (
+        "import sys\n"
+        "import extracttext.ocr\n"
+        "from extracttext.concurrency import InlineExecutor\n"
+        "from extracttext.extractors.image_ocr import ImageOcrExtractor\n"
+        "class Engine:\n"
+        "    def images_to_strings(self, paths, lang='eng'):\n"
+        "        return ['frame\\n' for _ in paths]\n"
+        "extracttext.ocr.get_engine = lambda name=None: Engine()\n"
+        f"text = ImageOcrExtractor().extract_text({str(fax)!r}, executor=InlineExecutor())\n"
+        "print(text.count('frame'), 'pdf2image' in sys.modules)\n"
+    )
+    env = {**os.environ, "OCR_RASTER_DIR": str(tmp_path)}
+    cwd = Path(__file__).resolve().parents[2]
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, cwd=cwd, check=True)
+    assert out.stdout.split() == [str(len(LEVELS)), "False"]
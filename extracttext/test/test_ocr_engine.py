@@ -0,0 +1,47 @@
+from pathlib import Path
+import shutil
+
+import pytest
+
+from extracttext.ocr import BatchTesseractEngine, TesseractEngine, _split_pages, get_engine
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+tesseract_ok = shutil.which("tesseract") is not None
+
+
+def test_get_engine_by_name(monkeypatch):
+    assert isinstance(get_engine("tesseract"), TesseractEngine)
+
+    monkeypatch.setenv("OCR_ENGINE", "tesseract-batch")
+    assert isinstance(get_engine(), BatchTesseractEngine)
+
+    with pytest.raises(ValueError):
+        get_engine("no-such-engine")
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        "one\ftwo\fthree\f",  # tesseract 4 – separator after every page
+        "one\ftwo\fthree",  # tesseract 5 – separator between pages
+    ],
+)
+def test_split_batch_output(output: str):
+    assert _split_pages(output, 3) == ["one", "two", "three"]
+
+
+def test_split_batch_output_mismatch():
+    assert _split_pages("one\ftwo", 3) is None
+
+
+@pytest.mark.skipif(not tesseract_ok, reason="Tesseract binary not found – install to run real OCR test")
+def test_batch_engine_matches_per_image_engine():
+    path = str(SAMPLES_DIR / "image.png")
+
+    single = TesseractEngine().image_to_string(path)
+    batched = BatchTesseractEngine().images_to_strings([path, path])
+
+    print(f"[ocr engine] batch of 2 → {[len(t) for t in batched]} chars")
+
+    assert [t.strip() for t in batched] == [single.strip(), single.strip()]
@@ -0,0 +1,88 @@
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+from extracttext.extractors import image_ocr
+from extracttext.extractors.image_ocr import ImageOcrExtractor
+from extracttext.ocr.preprocess import PreprocessOptions, otsu_threshold, prepare_image, preprocess_file
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def _jpeg(size, **save_kwargs) -> Image.Image:
+    buf = BytesIO()
+    Image.new("RGB", size, (200, 180, 160)).save(buf, format="JPEG", **save_kwargs)
+    buf.seek(0)
+    return Image.open(buf)
+
+
+def test_phone_photo_is_draft_decoded_and_capped():
+    img = _jpeg((4000, 3000), dpi=(72, 72))
+
+    out = prepare_image(img, PreprocessOptions(max_side=1000))
+
+    print(f"[preprocess] 4000×3000 → {out.size} {out.mode}")
+
+    assert out.mode == "L"
+    assert out.size == (1000, 750)
+
+
+def test_high_dpi_scan_reduced_to_target():
+    img = Image.new("L", (1200, 1600))
+    img.info["dpi"] = (600, 600)
+
+    assert prepare_image(img, PreprocessOptions()).size == (600, 800)
+    # Render DPI passed explicitly wins over metadata
+    assert prepare_image(img, PreprocessOptions(), dpi=300).size == (1200, 1600)
+
+
+def test_small_image_never_upscaled_and_disabled_mode():
+    img = Image.open(SAMPLES_DIR / "image.png")
+
+    assert prepare_image(img, PreprocessOptions()).size == img.size
+    assert prepare_image(img, PreprocessOptions(enabled=False)).mode == "RGB"
+
+
+def test_binarize_otsu():
+    hist = [0] * 256
+    hist[30] = 500  # ink
+    hist[220] = 5000  # paper
+    threshold = otsu_threshold(hist)
+
+    assert 30 <= threshold < 220
+
+    img = Image.new("L", (40, 10), 220)
+    img.paste(30, (0, 0, 10, 10))
+    out = prepare_image(img, PreprocessOptions(binarize=True))
+
+    assert [level for level, count in enumerate(out.histogram()) if count] == [0, 255]
+
+
+def test_preprocess_file_only_decodes_when_needed(tmp_path):
+    path = tmp_path / "page.pgm"
+    Image.new("L", (100, 100), 128).save(path)
+    before = path.read_bytes()
+
+    preprocess_file(str(path), PreprocessOptions(), dpi=300)
+    assert path.read_bytes() == before
+
+    preprocess_file(str(path), PreprocessOptions(), dpi=600)
+    assert Image.open(path).size == (50, 50)
+
+
+def test_image_extractor_hands_normalised_image_to_engine(monkeypatch):
+    seen = []
+
+    class _Engine:
+        def image_to_string(self, image, lang="eng"):
+            seen.append((image.mode, image.size))
+            return "ok"
+
+    monkeypatch.setattr(image_ocr, "get_engine", lambda: _Engine())
+    monkeypatch.setenv("OCR_MAX_SIDE", "500")
+    buf = BytesIO()
+    _jpeg((2000, 1000)).save(buf, format="JPEG")
+
+    assert ImageOcrExtractor().extract_text(buf.getvalue()) == "ok"
+    assert seen == [("L", (500, 250))]
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+from extracttext.dataloader import DataLoader
+from extracttext.extractors.base_extractor import DocumentType
+from extracttext.extractors.pdf_hybrid import PdfHybridExtractor, _mix_type
+from extracttext.extractors.pdf_ocr import PdfOcrExtractor, _contiguous_runs
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def test_hybrid_text_pdf_skips_ocr(monkeypatch):
+    def _fail(self, source, page_numbers, **kwargs):
+        raise AssertionError("OCR must not run for pages with a text layer")
+
+    monkeypatch.setattr(PdfOcrExtractor, "ocr_pages", _fail)
+
+    res = DataLoader(hybrid_pdf=True).load(SAMPLES_DIR / "pdf_text.pdf")
+
+    print(f"[hybrid] {res.document_type}: {res.text_payload[:80].strip()!r}")
+
+    assert res.document_type == DocumentType.PDF_TEXT  # no page needed OCR
+    assert len(res.text_payload.strip()) > 100
+
+
+def test_hybrid_ocrs_only_missing_pages(monkeypatch):
+    requested: list[int] = []
+
+    def _fake_ocr(self, source, page_numbers, **kwargs):
+        requested.extend(page_numbers)
+        return {n: f"ocr page {n}" for n in page_numbers}
+
+    monkeypatch.setattr(PdfOcrExtractor, "ocr_pages", _fake_ocr)
+
+    text = PdfHybridExtractor().extract_text(SAMPLES_DIR / "pdf-notext.pdf")
+
+    assert requested == [0]
+    assert text == "ocr page 0"
+
+
+def test_hybrid_reports_ocr_only_pdf_as_image(monkeypatch):
+    def _fake_ocr(self, source, page_numbers, **kwargs):
+        return {n: f"ocr page {n}" for n in page_numbers}
+
+    def _fake_iter_ocr(self, source, page_numbers, **kwargs):
+        yield from _fake_ocr(self, source, page_numbers).items()
+
+    monkeypatch.setattr(PdfOcrExtractor, "ocr_pages", _fake_ocr)
+    monkeypatch.setattr(PdfOcrExtractor, "iter_ocr_pages", _fake_iter_ocr)
+    loader = DataLoader(hybrid_pdf=True)
+
+    res = loader.load(SAMPLES_DIR / "pdf-notext.pdf")
+    fragments = list(loader.iter_text(SAMPLES_DIR / "pdf-notext.pdf"))
+
+    assert (res.document_type, res.text_payload) == (DocumentType.PDF_IMAGE, "ocr page 0")
+    assert [f.document_type for f in fragments] == [DocumentType.PDF_IMAGE]
+    assert _mix_type(1, 3) == DocumentType.PDF_MIXED
+
+
+def test_contiguous_runs():
+    assert list(_contiguous_runs([0, 1, 2, 5, 7, 8])) == [(0, 2), (5, 5), (7, 8)]
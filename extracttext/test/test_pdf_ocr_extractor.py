@@ -1,8 +1,14 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 import shutil
+from PIL import Image
 
+import extracttext.ocr
 from extracttext.extractors.pdf_ocr import PdfOcrExtractor
 
 SAMPLES_DIR = Path(__file__).parent / "testsamples"
@@ -22,4 +28,73 @@ def test_pdf_ocr_extractor_real():
 
     print(f"[pdf_ocr] extracted (first 120 chars): {text[:120].strip()!r}")
 
-    assert text.strip(), "Expected non-empty OCR text from scanned PDF" 
\ No newline at end of file
+    assert text.strip(), "Expected non-empty OCR text from scanned PDF"
+
+
+def test_render_windows_are_bounded():
+    from extracttext.extractors.pdf_ocr import _windows
+
+    assert list(_windows(range(10), 4)) == [(0, 3), (4, 7), (8, 9)]
+    # Non-contiguous page selections never render the gaps
+    assert list(_windows([0, 1, 2, 7, 8], 2)) == [(0, 1), (2, 2), (7, 8)]
+
+
+def test_raster_dir_override(monkeypatch, tmp_path):
+    from extracttext.ocr.pipeline import raster_dir
+
+    monkeypatch.setenv("OCR_RASTER_DIR", str(tmp_path))
+
+    assert raster_dir() == str(tmp_path)
+
+
+PAGES = 12
+
+
+class _PageEngine:
+    """Reports each raster's page number; early pages finish last."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.done = 0
+
+    def images_to_strings(self, paths, lang="eng"):
+        texts = []
+        for path in paths:
+            with Image.open(path) as img:
+                page = img.getpixel((0, 0)) // 10
+            time.sleep((PAGES - page) * 0.003)
+            texts.append(f"page {page}\n")
+        with self.lock:
+            self.done += len(paths)
+        return texts
+
+
+def test_ocr_pipeline_bounds_inflight_pages(monkeypatch, tmp_path):
+    engine = _PageEngine()
+    alive = []
+
+    def _render(self, path, dpi, output_folder, first_page, last_page):
+        paths = []
+        for page in range(first_page - 1, last_page):
+            raster = os.path.join(output_folder, f"page-{page:03d}.pgm")
+            Image.new("L", (32, 24), page * 10).save(raster)
+            paths.append(raster)
+        alive.append(len(os.listdir(output_folder)))  # rendered, not yet OCR'd
+        return paths
+
+    monkeypatch.setattr(extracttext.ocr, "get_engine", lambda name=None: engine)
+    monkeypatch.setattr(PdfOcrExtractor, "_page_count", lambda self, source: PAGES)
+    monkeypatch.setattr(PdfOcrExtractor, "_render", _render)
+    monkeypatch.setenv("OCR_RASTER_DIR", str(tmp_path))
+    monkeypatch.setenv("OCR_RENDER_WINDOW", "2")
+    monkeypatch.setenv("OCR_MAX_INFLIGHT", "3")
+    monkeypatch.setenv("OCR_BATCH_SIZE", "1")
+
+    with ThreadPoolExecutor(4) as pool:
+        pages = list(PdfOcrExtractor().iter_pages(SAMPLES_DIR / "pdf-notext.pdf", executor=pool))
+
+    print(f"[pdf_ocr] rasters alive after each render: {alive}")
+
+    assert pages == [f"page {n}" for n in range(PAGES)]
+    assert engine.done == PAGES
+    assert max(alive) <= 3
@@ -0,0 +1,80 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from extracttext import DataLoader
+from extracttext import poppler
+from extracttext.bench.corpus import _page_lines, _pdf
+from extracttext.detector import probe_document
+from extracttext.extractors.pdf_text import PdfTextExtractor, _page_runs
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+poppler_ok = poppler.pdftotext_available()
+
+
+def _three_page_pdf() -> bytes:
+    rng = random.Random(7)
+    return _pdf([("text", _page_lines(rng, 5)) for _ in range(3)], 150)
+
+
+def test_page_splitting_helpers():
+    assert poppler.split_pages("one\ftwo\f") == ["one", "two"]
+    assert poppler.split_pages("\f\f") == ["", ""]  # two blank pages
+    assert poppler.split_pages("") == []
+    assert _page_runs([0, 1, 2, 5, 6, 9], 2) == [(0, 1), (2, 2), (5, 6), (9, 9)]
+
+
+def test_auto_falls_back_to_pdfminer_without_poppler(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))  # no poppler binaries here
+    monkeypatch.delenv("PDF_TEXT_ENGINE", raising=False)
+    assert poppler.resolve_pdf_text_engine() == "pdfminer"
+
+    ext = PdfTextExtractor()
+    text = ext.extract_text(SAMPLES_DIR / "pdf_text.pdf")
+    assert text.strip()
+    assert list(ext.iter_pages(_three_page_pdf(), page_numbers=[2, 0, 7])) == ext.extract_pages(_three_page_pdf())[::2]
+
+    monkeypatch.setenv("PDF_TEXT_ENGINE", "pdftotext")
+    with pytest.raises(RuntimeError):
+        ext.extract_text(SAMPLES_DIR / "pdf_text.pdf")
+
+    monkeypatch.setenv("PDF_TEXT_ENGINE", "fastest")
+    with pytest.raises(ValueError):
+        ext.extract_text(SAMPLES_DIR / "pdf_text.pdf")
+
+
+def test_cache_key_tracks_pdf_text_engine(monkeypatch):
+    path = SAMPLES_DIR / "pdf_text.pdf"
+    keys = set()
+    for engine, mode in (("pdfminer", "reading"), ("pdftotext", "reading"), ("pdftotext", "layout")):
+        monkeypatch.setenv("PDF_TEXT_ENGINE", engine)
+        monkeypatch.setenv("PDFTOTEXT_MODE", mode)
+        keys.add(DataLoader()._cache_key(path, ".pdf"))
+    assert len(keys) == 3
+
+
+@pytest.mark.skipif(not poppler_ok, reason="poppler (pdftotext, pdfinfo) not installed")
+def test_pdftotext_matches_pdfminer(monkeypatch):
+    data = _three_page_pdf()
+    ext = PdfTextExtractor()
+
+    monkeypatch.setenv("PDF_TEXT_ENGINE", "pdfminer")
+    reference = ext.extract_pages(data)
+    reference_probe = probe_document(data, name="three.pdf")
+
+    monkeypatch.setenv("PDF_TEXT_ENGINE", "pdftotext")
+    for mode in ("reading", "layout", "raw"):
+        monkeypatch.setenv("PDFTOTEXT_MODE", mode)
+        pages = ext.extract_pages(data)
+        print(f"[pdftotext:{mode}] {pages[0][:80]!r}")
+        assert len(pages) == len(reference) == 3
+        assert [p.split() for p in pages] == [p.split() for p in reference]
+
+    assert list(ext.iter_pages(data, page_numbers=[2, 0, 7])) == [pages[0], pages[2]]
+    assert ext.extract_text(data).count("\f") == 3
+
+    probe = probe_document(data, name="three.pdf")
+    assert (probe.page_count, probe.has_text_layer) == (reference_probe.page_count, reference_probe.has_text_layer)
+    assert probe_document(SAMPLES_DIR / "pdf-notext.pdf").has_text_layer is False
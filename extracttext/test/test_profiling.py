@@ -0,0 +1,99 @@
+import json
+import pstats
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from extracttext import load
+from extracttext.cli import main
+from extracttext.concurrency import get_default_executor
+from extracttext.profiling import profile, profiled
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def test_profile_writes_pstats_and_summary(tmp_path, monkeypatch):
+    monkeypatch.setenv("PDF_TEXT_ENGINE", "pdfminer")  # in-process, so it shows up
+    with profile(tmp_path / "prof", top=10) as report:
+        result = load(SAMPLES_DIR / "pdf_text.pdf")
+
+    summary = report.summary_path.read_text()
+    print(summary[:1500])
+
+    assert result.text_payload.strip()
+    assert report.pstats_path.exists() and report.snapshot_path.exists()
+    assert report.peak_memory_bytes > 0
+    functions = {func for _, _, func in pstats.Stats(str(report.pstats_path)).stats}
+    assert "process_page" in functions  # pdfminer layout analysis is visible
+    assert "Top 10 functions by cumulative time" in summary
+    assert "allocation sites" in summary
+
+
+def test_worker_tasks_are_profiled_and_merged(tmp_path):
+    pool = get_default_executor()
+    assert profiled(json.dumps) is json.dumps  # no session – task unchanged
+
+    with profile(tmp_path, memory=True) as report:
+        encoded = pool.submit(profiled(json.dumps), list(range(50_000))).result()
+
+    assert len(encoded) > 50_000
+    print(f"[profile] workers: {report.worker_profiles}, peak {report.worker_peak_memory_bytes} B")
+    assert report.worker_tasks == 1
+    assert report.worker_peak_memory_bytes > 0
+    functions = {func for _, _, func in pstats.Stats(str(report.pstats_path)).stats}
+    assert "encode" in functions  # json internals ran in the worker only
+
+    # Reusing the directory drops the previous session's worker artifacts
+    with profile(tmp_path) as again:
+        pass
+    assert again.worker_tasks == 0
+
+
+def test_server_profile_opt_in(tmp_path, monkeypatch):
+    import extracttext.server as server
+
+    monkeypatch.setenv("EXTRACTTEXT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(server, "_LOADER", None)  # rebuilt with the isolated cache
+    client = TestClient(server.app)
+    data = (SAMPLES_DIR / "text.txt").read_bytes()
+
+    monkeypatch.delenv("EXTRACTTEXT_PROFILE_DIR", raising=False)
+    assert client.post("/gettext?profile=true", files={"file": ("notes.txt", data)}).status_code == 403
+
+    monkeypatch.setenv("EXTRACTTEXT_PROFILE_DIR", str(tmp_path / "profiles"))
+    response = client.post("/gettext?profile=true", files={"file": ("notes.txt", data)})
+    assert response.status_code == 200
+    artifacts = response.json()["profile"]
+    assert Path(artifacts["summary_path"]).read_text().startswith("wall time")
+    assert Path(artifacts["directory"]).parent == (tmp_path / "profiles").resolve()
+
+
+def test_server_profiles_repeated_uploads_without_cache(tmp_path, monkeypatch):
+    import extracttext.server as server
+
+    monkeypatch.setenv("EXTRACTTEXT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("EXTRACTTEXT_PROFILE_DIR", str(tmp_path / "profiles"))
+    monkeypatch.setenv("PDF_TEXT_ENGINE", "pdfminer")  # in-process, so it shows up
+    monkeypatch.setattr(server, "_LOADER", None)
+    client = TestClient(server.app)
+    data = (SAMPLES_DIR / "pdf_text.pdf").read_bytes()
+
+    client.post("/gettext", files={"file": ("doc.pdf", data)})  # warms the result cache
+    for _ in range(2):
+        response = client.post("/gettext?profile=true", files={"file": ("doc.pdf", data)})
+        assert response.status_code == 200
+        stats = pstats.Stats(response.json()["profile"]["pstats_path"]).stats
+        assert "process_page" in {func for _, _, func in stats}  # real extraction, not a cache hit
+
+
+def test_cli_profile_flag_precedes_source(tmp_path, monkeypatch, capsys):
+    source = SAMPLES_DIR / "text.txt"
+    monkeypatch.setattr(sys, "argv", ["extracttext", "--profile", str(source), "--profile-dir", str(tmp_path)])
+
+    main()
+
+    out = capsys.readouterr()
+    assert json.loads(out.out)["document_type"] == "text"
+    assert "Profile written to" in out.err
+    assert (tmp_path / "summary.txt").exists()
@@ -0,0 +1,70 @@
+import asyncio
+import io
+from pathlib import Path
+
+import pytest
+
+from extracttext.server.admission import (
+    OCR_CLASS,
+    TEXT_CLASS,
+    AdmissionController,
+    AdmissionRejected,
+    classify_upload,
+)
+
+SAMPLES_DIR = Path(__file__).parent / "testsamples"
+
+
+def test_classify_upload():
+    assert classify_upload("scan.PDF") == OCR_CLASS
+    assert classify_upload("photo.jpg") == OCR_CLASS
+    assert classify_upload("notes.txt") == TEXT_CLASS
+    assert classify_upload(None) == TEXT_CLASS
+
+
+def test_classify_upload_sniffs_misnamed_files():
+    pdf = io.BytesIO((SAMPLES_DIR / "pdf-notext.pdf").read_bytes())
+
+    assert classify_upload("scan.txt", pdf) == OCR_CLASS
+    assert pdf.tell() == 0  # rewound for the loader
+    assert classify_upload(None, pdf) == OCR_CLASS
+    utf8_text = io.BytesIO(b"\xef\xbb\xbfplain words\n")  # BOM – recognised without libmagic
+    assert classify_upload("notes.pdf", utf8_text) == TEXT_CLASS
+
+
+def test_admission_queues_then_rejects():
+    controller = AdmissionController({OCR_CLASS: (1, 1)})
+
+    async def _main():
+        release = asyncio.Event()
+        tickets = []
+
+        async def _job():
+            async with controller.admit(OCR_CLASS) as ticket:
+                tickets.append(ticket)
+                await release.wait()
+
+        running = asyncio.create_task(_job())  # takes the only slot
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(_job())  # fills the queue
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as info:
+            async with controller.admit(OCR_CLASS):
+                pass
+
+        assert controller.stats()[OCR_CLASS] == {"running": 1, "waiting": 1}
+
+        await asyncio.sleep(0.02)
+        release.set()
+        await asyncio.gather(running, queued)
+        return tickets, info.value
+
+    tickets, rejected = asyncio.run(_main())
+
+    print(f"[admission] rejected: {rejected}")
+
+    assert rejected.retry_after >= 1
+    assert rejected.queue_depth == 1
+    assert tickets[0].queue_depth == 0
+    assert tickets[1].queue_depth == 0 and tickets[1].queue_wait_ms >= 15